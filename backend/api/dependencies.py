@@ -1,10 +1,15 @@
 # backend/api/dependencies.py
 from functools import lru_cache
 from backend.services.coqui_tts_service import CoquiTTSService
+from backend.services.audio_file_service import AudioFileService
 from backend.services.meaning_service import MeaningService
 from backend.core.config import get_settings
 from backend.services.phonetic_service import PhoneticService
 from backend.services.pronunciation_service import PronunciationService
+from backend.services.warmup_service import WarmupService
+from backend.services.g2p import G2P
+from backend.services.lookup_service import LookupService
+from backend.services.transcript_service import TranscriptService
 
 @lru_cache()
 def get_meaning_service() -> MeaningService:
@@ -15,21 +20,58 @@ def get_meaning_service() -> MeaningService:
     print("🔧 Initializing MeaningService (should see this only once)")
     return MeaningService()
 
+@lru_cache()
+def get_g2p() -> G2P:
+    """Singleton G2P fallback (one learned lexicon for phonetics and pronunciation)"""
+    return G2P(get_settings().G2P_CACHE_ITEMS)
+
 @lru_cache()
 def get_phonetic_service() -> PhoneticService:  # NEW
     """Singleton PhoneticService"""
     print("🔤 Initializing PhoneticService singleton")
-    return PhoneticService()
+    return PhoneticService(g2p=get_g2p())
 
 @lru_cache()
 def get_coqui_tts_service() -> CoquiTTSService:  # NEW
     """Singleton CoquiService for audio generation"""
     return CoquiTTSService()
 
+@lru_cache()
+def get_audio_file_service() -> AudioFileService:
+    """Singleton AudioFileService (keeps the hot-file cache)"""
+    return AudioFileService()
+
 @lru_cache()
 def get_pronunciation_service() -> PronunciationService:
-    """Singleton Pronunciation Service"""
-    return PronunciationService()
+    """Singleton Pronunciation Service (TTS provides the acoustic reference)"""
+    settings = get_settings()
+    if settings.ENABLE_AUDIO and settings.ENABLE_ACOUSTIC_SCORING:
+        return PronunciationService(tts_service=get_coqui_tts_service(), g2p=get_g2p())
+    return PronunciationService(g2p=get_g2p())
+
+@lru_cache()
+def get_lookup_service() -> LookupService:
+    """Singleton LookupService over the enabled subsystems' singletons"""
+    settings = get_settings()
+    return LookupService(
+        meaning=get_meaning_service if settings.ENABLE_MEANING else None,
+        phonetics=get_phonetic_service if settings.ENABLE_PHONETICS else None,
+        tts=get_coqui_tts_service if settings.ENABLE_AUDIO else None
+    )
+
+@lru_cache()
+def get_transcript_service() -> TranscriptService:
+    """Singleton TranscriptService (keeps the transcript jobs)"""
+    settings = get_settings()
+    return TranscriptService(
+        phonetics=get_phonetic_service if settings.ENABLE_PHONETICS else None,
+        tts=get_coqui_tts_service if settings.ENABLE_AUDIO else None
+    )
+
+@lru_cache()
+def get_warmup_service() -> WarmupService:
+    """Singleton WarmupService (startup preloading + readiness)"""
+    return WarmupService()
 
 @lru_cache()
 def get_settings_dependency():
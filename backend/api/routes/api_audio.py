@@ -1,12 +1,13 @@
 # backend/api/routes/audio.py - UPDATE
 
-from fastapi import APIRouter, HTTPException, Depends
-from fastapi.responses import FileResponse
-from pathlib import Path
+from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi.responses import Response
 
 from backend.api.schemas.api_schemas import AudioGenerateRequest, AudioGenerateResponse
-from backend.api.dependencies import get_coqui_tts_service  # ✅ CHANGED
+from backend.api.dependencies import get_coqui_tts_service, get_audio_file_service  # ✅ CHANGED
+from backend.core.exceptions import AppException
 from backend.services.coqui_tts_service import CoquiTTSService  # ✅ CHANGED
+from backend.services.audio_file_service import AudioFileService
 
 router = APIRouter(prefix="/api/audio", tags=["Audio"])
 
@@ -18,52 +19,100 @@ async def generate_audio(
     """
     Generate audio from text using Coqui TTS
     
-    - **text**: Text to convert to speech (max 500 chars)
+    - **text**: Text to convert to speech (max 5000 chars; long texts are
+      split at sentence boundaries and synthesized in parallel)
     - **voice_preset**: Voice style (default)
+    - **speed**: Playback speed 0.25-2.0 (derived from the cached normal-speed
+      clip, pitch preserved)
     """
     try:
         return await service.generate_audio(
             request.text,
-            request.voice_preset
+            request.voice_preset,
+            request.speed
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/files/{filename}")
-async def get_audio_file(filename: str):
-    """Get generated audio file"""
-    filepath = Path("audio_files") / filename
-    
-    if not filepath.exists():
-        raise HTTPException(status_code=404, detail="Audio file not found")
-    
-    return FileResponse(
-        filepath,
+async def get_audio_file(
+    filename: str,
+    request: Request,
+    files: AudioFileService = Depends(get_audio_file_service)
+):
+    """
+    Get generated audio file
+
+    Files are content-addressed, so responses are immutable and carry a
+    strong ETag. Supports conditional GET (304) and single byte ranges (206).
+    """
+    try:
+        filepath = files.get_existing(filename)
+    except AppException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+
+    headers = files.cache_headers(filepath.name)
+    etag = headers["ETag"]
+
+    if files.etag_matches(request.headers.get("if-none-match"), etag):
+        files.not_modified += 1
+        return Response(status_code=304, headers=headers)
+
+    headers["Content-Disposition"] = f'attachment; filename="{filepath.name}"'
+    size = filepath.stat().st_size
+
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if if_range and if_range.strip() != etag:
+        # Client's copy is stale: send the whole file
+        range_header = None
+
+    try:
+        byte_range = files.parse_range(range_header, size)
+    except AppException as e:
+        headers["Content-Range"] = f"bytes */{size}"
+        return Response(status_code=e.status_code, headers=headers)
+
+    if byte_range is None:
+        return Response(
+            content=await files.read(filepath),
+            media_type="audio/wav",
+            headers=headers
+        )
+
+    start, end = byte_range
+    files.partial_responses += 1
+    headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    return Response(
+        content=await files.read_range(filepath, start, end),
+        status_code=206,
         media_type="audio/wav",
-        filename=filename,
-        headers={
-            "Access-Control-Allow-Origin": "*"
-        }
+        headers=headers
     )
 
 @router.delete("/files/{filename}")
-async def delete_audio_file(filename: str):
+async def delete_audio_file(
+    filename: str,
+    files: AudioFileService = Depends(get_audio_file_service)
+):
     """Delete audio file"""
     try:
-        filepath = Path("audio_files") / filename
-        
-        if filepath.exists():
-            filepath.unlink()
+        if files.delete(filename):
             return {"success": True, "message": f"Deleted {filename}"}
         
         return {"success": True, "message": "File not found"}
         
+    except AppException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/stats")
 async def get_stats(
-    service: CoquiTTSService = Depends(get_coqui_tts_service)
+    service: CoquiTTSService = Depends(get_coqui_tts_service),
+    files: AudioFileService = Depends(get_audio_file_service)
 ):
     """Get audio generation statistics"""
-    return service.get_cache_stats()
+    stats = service.get_cache_stats()
+    stats["file_serving"] = files.get_cache_stats()
+    return stats
@@ -0,0 +1,30 @@
+# backend/api/routes/api_health.py
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
+
+from backend.api.dependencies import get_warmup_service
+from backend.services.warmup_service import WarmupService
+
+router = APIRouter(tags=["Health"])
+
+@router.get("/health")
+async def health():
+    """Liveness check: the process is up"""
+    return {"status": "ok"}
+
+@router.get("/ready")
+async def ready(
+    warmup: WarmupService = Depends(get_warmup_service)
+):
+    """
+    Readiness check
+
+    Returns 200 once startup preloading finished, 503 while models are
+    still loading (or if one failed). Includes per-component load time and memory.
+    """
+    status = warmup.get_status()
+    return JSONResponse(
+        content=status,
+        status_code=200 if status["ready"] else 503
+    )
@@ -0,0 +1,39 @@
+# backend/api/routes/lookup.py
+
+from fastapi import APIRouter, Depends
+
+from backend.api.schemas.api_schemas import LookupRequest, LookupResponse
+from backend.api.dependencies import get_lookup_service
+from backend.services.lookup_service import LookupService
+
+router = APIRouter(prefix="/api", tags=["Lookup"])
+
+@router.post("/lookup", response_model=LookupResponse)
+async def lookup(
+    request: LookupRequest,
+    service: LookupService = Depends(get_lookup_service)
+) -> LookupResponse:
+    """
+    Meaning, phonetics and audio of a word click in one request
+    
+    - Input: { "text": "serendipity", "fields": ["phonetics", "audio"] }
+    - Output: the requested parts that finished in time; slow, failed or
+      disabled parts are missing and explained in `errors`
+    
+    Parts run concurrently, so latency is that of the slowest part (at most
+    its timeout), not their sum
+    """
+    result = await service.lookup(
+        request.text,
+        request.fields,
+        request.voice_preset,
+        request.speed,
+        request.include_ipa,
+        request.include_syllables
+    )
+    return LookupResponse(**result)
+
+@router.get("/lookup/stats")
+async def get_lookup_stats(service: LookupService = Depends(get_lookup_service)):
+    """Per-part successes, timeouts and errors"""
+    return service.get_stats()
@@ -0,0 +1,92 @@
+# backend/api/routes/api_metrics.py
+"""
+GET /metrics (Prometheus text format)
+
+Request, inference and Gemini series are recorded as they happen (see
+backend.core.metrics). Cache counters and queue depths are read from the
+service singletons at scrape time; a service that was never built is
+skipped rather than built by the scrape.
+"""
+
+from fastapi import APIRouter, Response
+
+from backend.api.dependencies import (
+    get_audio_file_service, get_coqui_tts_service, get_g2p, get_lookup_service,
+    get_phonetic_service, get_pronunciation_service, get_transcript_service
+)
+from backend.core.metrics import CONTENT_TYPE, REGISTRY
+
+router = APIRouter(tags=["Metrics"])
+
+
+def _built(getter):
+    """The singleton behind `getter`, or None if nothing asked for it yet"""
+    return getter() if getter.cache_info().currsize else None
+
+
+def _cache_counters():
+    """{(service, cache): counters} over the live services"""
+    counters = {}
+    for service_name, getter in (
+        ("phonetic", get_phonetic_service),
+        ("coqui_tts", get_coqui_tts_service),
+        ("pronunciation", get_pronunciation_service),
+    ):
+        service = _built(getter)
+        if service is not None:
+            for cache_name, stats in service.cache_counters().items():
+                counters[(service_name, cache_name)] = stats
+    g2p = _built(get_g2p)
+    if g2p is not None:
+        counters[("g2p", "lexicon")] = g2p.lexicon.stats()
+    audio_files = _built(get_audio_file_service)
+    if audio_files is not None:
+        counters[("audio_files", "hot_files")] = audio_files.hot_cache.stats()
+    return counters
+
+
+def _cache_series(field: str):
+    def collect():
+        return [
+            ({"service": service, "cache": cache}, stats[field])
+            for (service, cache), stats in _cache_counters().items()
+        ]
+    return collect
+
+
+def _queue_depths():
+    depths = []
+    pronunciation = _built(get_pronunciation_service)
+    if pronunciation is not None:
+        depths.append(({"executor": "pronunciation_pool"}, pronunciation.pool.pending))
+        # Single analyses scored with asyncio.to_thread
+        depths.append(({"executor": "pronunciation_threads"}, pronunciation.scoring_pending))
+    tts = _built(get_coqui_tts_service)
+    if tts is not None and tts.replicas is not None:
+        depths.append(({"executor": "tts_replicas"}, tts.replicas.pending))
+    return depths
+
+
+def _background_work():
+    work = []
+    transcripts = _built(get_transcript_service)
+    if transcripts is not None:
+        work.append(({"kind": "transcript_jobs"}, transcripts.get_stats()["active"]))
+    lookup = _built(get_lookup_service)
+    if lookup is not None:
+        work.append(({"kind": "lookup_parts"}, len(lookup._background)))
+    return work
+
+
+REGISTRY.collector("cache_hits_total", "counter", "Cache hits", _cache_series("hits"))
+REGISTRY.collector("cache_misses_total", "counter", "Cache misses", _cache_series("misses"))
+REGISTRY.collector("cache_evictions_total", "counter", "Cache evictions", _cache_series("evictions"))
+REGISTRY.collector("cache_items", "gauge", "Entries held by each cache", _cache_series("items"))
+REGISTRY.collector("executor_queue_depth", "gauge", "Tasks submitted and not finished", _queue_depths)
+REGISTRY.collector("background_tasks", "gauge", "Background work still running", _background_work)
+
+
+@router.get("/metrics")
+async def metrics():
+    """Prometheus scrape endpoint"""
+    return Response(content=REGISTRY.render(), media_type=CONTENT_TYPE)
@@ -1,13 +1,40 @@
 # backend/api/routes/pronunciation.py
 
-from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Form
-from pathlib import Path
-import shutil
+from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Form, WebSocket
+from fastapi.responses import StreamingResponse
+from starlette.websockets import WebSocketDisconnect
+from typing import List
+import asyncio
+import json
+import logging
+import time
 
+import numpy as np
+
+from backend.core.config import get_settings
+from backend.core.exceptions import AppException, PayloadTooLargeError, ValidationError
 from backend.services.pronunciation_service import PronunciationService
 from backend.api.dependencies import get_pronunciation_service
 
 router = APIRouter(prefix="/api/pronunciation", tags=["Pronunciation"])
+logger = logging.getLogger(__name__)
+
+def _check_upload_size(audio: UploadFile, limit: int):
+    """Per-file limit (Content-Length is already checked by UploadLimitMiddleware)"""
+    if audio.size is not None and audio.size > limit:
+        raise PayloadTooLargeError(
+            f"{audio.filename or 'audio'} is {audio.size} bytes (max {limit})"
+        )
+
+
+async def _decode_upload(audio: UploadFile, service: PronunciationService) -> np.ndarray:
+    """Decode straight from the upload's spooled buffer, no temp file"""
+    _check_upload_size(audio, get_settings().PRONUNCIATION_MAX_UPLOAD_BYTES)
+    try:
+        return await asyncio.to_thread(service.load_recording, audio.file)
+    except ValidationError as e:
+        raise ValidationError(f"{audio.filename or 'audio'}: {e.message}")
+
 
 @router.post("/analyze")
 async def analyze_pronunciation(
@@ -21,37 +48,202 @@ async def analyze_pronunciation(
     - **audio**: WAV audio file of user speaking
     - **text**: Expected text (what user was supposed to say)
     
-    Returns analysis with MIR score and feedback
+    Returns analysis with MIR score and feedback. An exact repeat of an
+    earlier upload (same audio bytes and text) is answered from the cache;
+    `cache.hit` tells which
     """
     try:
-        # Save uploaded audio
-        audio_dir = Path("temp_audio")
-        audio_dir.mkdir(exist_ok=True)
+        _check_upload_size(audio, get_settings().PRONUNCIATION_MAX_UPLOAD_BYTES)
+        key = await asyncio.to_thread(service.upload_key, audio.file, text)
+        cached = service.cached_analysis(key)
+        if cached is not None:
+            return cached
         
-        audio_path = audio_dir / f"recording_{audio.filename}"
-        
-        with audio_path.open("wb") as buffer:
-            shutil.copyfileobj(audio.file, buffer)
+        start = time.perf_counter()
+        waveform = await _decode_upload(audio, service)
         
         # Analyze
-        result = await service.analyze_pronunciation(
-            str(audio_path),
-            text
-        )
-        
-        # Clean up
-        audio_path.unlink()
-        
-        return result
+        analysis = await service.analyze_pronunciation(waveform, text)
+        return service.remember_analysis(key, analysis, time.perf_counter() - start)
         
+    except AppException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/analyze/batch")
+async def analyze_pronunciation_batch(
+    audios: List[UploadFile] = File(...),
+    texts: List[str] = Form(...),
+    service: PronunciationService = Depends(get_pronunciation_service)
+):
+    """
+    Analyze many recordings at once (e.g. a whole class)
+    
+    - **audios**: WAV files, repeated form field
+    - **texts**: Expected text for each audio, in the same order
+      (or a single text shared by every recording)
+    
+    Streams newline-delimited JSON: one line per recording as soon as it
+    is scored (`index`, `filename`, `text`, `result` or `error`), then a
+    final `summary` line with throughput
+    """
+    settings = get_settings()
+    if len(texts) not in (1, len(audios)):
+        raise HTTPException(
+            status_code=400,
+            detail=f"Got {len(audios)} audio files but {len(texts)} texts"
+        )
+    if len(audios) > settings.PRONUNCIATION_BATCH_MAX_FILES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.PRONUNCIATION_BATCH_MAX_FILES} files per batch"
+        )
+    if len(texts) == 1:
+        texts = texts * len(audios)
+    
+    # Decode everything up front: a bad file rejects the batch before any scoring
+    try:
+        waveforms = [await _decode_upload(audio, service) for audio in audios]
+    except AppException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+    
+    items = list(zip(waveforms, texts))
+    filenames = [audio.filename for audio in audios]
+    
+    async def stream():
+        async for item in service.analyze_batch(items):
+            if "index" in item:
+                item["filename"] = filenames[item["index"]]
+            yield json.dumps(item) + "\n"
+    
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
+@router.get("/stats")
+async def get_pronunciation_stats(
+    service: PronunciationService = Depends(get_pronunciation_service)
+):
+    """Reference cache hit rate, acoustic settings and batch pool state"""
+    return service.get_stats()
+
+
 @router.get("/word/{word}")
 async def get_word_pronunciation(
     word: str,
     service: PronunciationService = Depends(get_pronunciation_service)
 ):
     """Get pronunciation for a word"""
-    return service.get_word_pronunciation(word)
\ No newline at end of file
+    return service.get_word_pronunciation(word)
+
+
+def _message_type(text: str) -> str:
+    """`type` of a JSON control message (None if it is not one)"""
+    try:
+        return json.loads(text or "null").get("type")
+    except (ValueError, AttributeError):
+        return None
+
+
+async def _close_with_error(websocket: WebSocket, detail: str, code: int):
+    """Report a failure to the client and close; the client may be gone already"""
+    try:
+        await websocket.send_json({"type": "error", "detail": detail})
+        await websocket.close(code=code)
+    except (WebSocketDisconnect, RuntimeError):
+        pass
+
+
+@router.websocket("/stream")
+async def stream_pronunciation(
+    websocket: WebSocket,
+    service: PronunciationService = Depends(get_pronunciation_service)
+):
+    """
+    Live pronunciation scoring while the learner speaks
+    
+    1. Client sends `{"type": "start", "text": ..., "sample_rate": 16000}`;
+       server answers `ready` once the reference is prepared
+    2. Client sends binary frames of 16-bit little-endian mono PCM; each
+       one is answered with a `partial` (per-word scores so far). Chunks
+       arriving while too many are queued are dropped and counted
+    3. Client sends `{"type": "stop"}`; server sends `final` (the same
+       analysis as /analyze, plus chunk latency stats) and closes
+    
+    Any failure is reported as `{"type": "error", "detail": ...}` before
+    the server closes the socket.
+    """
+    settings = get_settings()
+    await websocket.accept()
+    try:
+        start = await websocket.receive_json()
+        if not isinstance(start, dict) or start.get("type") != "start":
+            raise ValidationError("First message must be {\"type\": \"start\", ...}")
+        session = await service.start_live_session(
+            start.get("text", ""), start.get("sample_rate")
+        )
+    except (AppException, ValueError) as e:
+        await _close_with_error(websocket, getattr(e, "message", str(e)), 1008)
+        return
+    except WebSocketDisconnect:
+        return
+    await websocket.send_json({"type": "ready", **session.describe()})
+    
+    # Unbounded so the stop sentinel never waits; chunks are bounded below
+    queue: asyncio.Queue = asyncio.Queue()
+    max_pending = settings.PRONUNCIATION_STREAM_MAX_PENDING_CHUNKS
+    
+    async def score_chunks() -> bool:
+        """Feed queued chunks until the sentinel; False once it gave up"""
+        try:
+            while (item := await queue.get()) is not None:
+                chunk, received = item
+                partial = await asyncio.to_thread(session.feed, chunk)
+                session.record_latency(time.perf_counter() - received)
+                await websocket.send_json({"type": "partial", **partial})
+        except WebSocketDisconnect:
+            return False
+        except Exception as e:
+            logger.error(f"❌ Live scoring failed: {e}", exc_info=True)
+            detail = e.message if isinstance(e, AppException) else "Live scoring failed"
+            await _close_with_error(websocket, detail, 1011)
+            return False
+        return True
+    
+    worker = asyncio.create_task(score_chunks())
+    max_bytes = settings.PRONUNCIATION_STREAM_MAX_SECONDS * session.input_rate * 2
+    received_bytes = 0
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect" or worker.done():
+                return
+            if message.get("bytes") is not None:
+                received_bytes += len(message["bytes"])
+                if received_bytes > max_bytes:
+                    # Stream limit reached: score what arrived
+                    break
+                if queue.qsize() >= max_pending:
+                    session.dropped += 1
+                else:
+                    queue.put_nowait((message["bytes"], time.perf_counter()))
+            elif _message_type(message.get("text")) == "stop":
+                break
+        
+        queue.put_nowait(None)
+        if not await worker:
+            return
+        try:
+            result = await asyncio.to_thread(session.finish)
+        except AppException as e:
+            await _close_with_error(websocket, e.message, 1008)
+            return
+        stats = session.stats()
+        logger.info(f"✅ Live session done: MIR={result['mir']}% {stats}")
+        await websocket.send_json({"type": "final", "result": result, "stats": stats})
+        await websocket.close()
+    except WebSocketDisconnect:
+        logger.info(f"🔌 Live session closed by client after {session.chunks} chunks")
+    finally:
+        worker.cancel()
@@ -0,0 +1,94 @@
+# backend/api/routes/transcript.py
+
+import json
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+
+from backend.api.schemas.api_schemas import TranscriptJobResponse, TranscriptRequest
+from backend.api.dependencies import get_transcript_service
+from backend.core.exceptions import AppException
+from backend.services.transcript_service import TranscriptService
+
+router = APIRouter(prefix="/api/transcripts", tags=["Transcripts"])
+
+@router.post("", response_model=TranscriptJobResponse, status_code=202)
+async def start_transcript_job(
+    request: TranscriptRequest,
+    service: TranscriptService = Depends(get_transcript_service)
+) -> TranscriptJobResponse:
+    """
+    Prepare a whole transcript ahead of playback
+    
+    - Input: { "lines": [{ "start": 0.0, "duration": 2.1, "text": "..." }, ...],
+      "position": 0.0 }
+    - Output: a job handle; phonetics of every unique word and audio of every
+      upcoming line (earliest first) are computed in the background, so word
+      lookups and replays during playback hit the caches
+    """
+    try:
+        job = service.start(
+            [line.model_dump() for line in request.lines],
+            request.position,
+            request.voice_preset,
+            request.speed,
+            request.synthesize_audio
+        )
+    except AppException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+    
+    return TranscriptJobResponse(
+        job_id=job.id,
+        status=job.status,
+        lines=len(job.lines),
+        words=len(job.words),
+        audio_total=len(job.clips),
+        status_url=f"/api/transcripts/{job.id}",
+        events_url=f"/api/transcripts/{job.id}/events"
+    )
+
+@router.get("/{job_id}")
+async def get_transcript_job(
+    job_id: str,
+    service: TranscriptService = Depends(get_transcript_service)
+):
+    """Progress of a transcript job"""
+    try:
+        return service.get(job_id).describe()
+    except AppException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+
+@router.get("/{job_id}/events")
+async def stream_transcript_events(
+    job_id: str,
+    since: int = 0,
+    service: TranscriptService = Depends(get_transcript_service)
+):
+    """
+    Results as newline-delimited JSON, as they are produced: `phonetics`
+    (a batch of words), `audio` / `audio_error` (one line's clip), then a
+    final `done` with the summary. Earlier events are replayed; `since`
+    skips the first ones (e.g. after a reconnect)
+    """
+    try:
+        job = service.get(job_id)
+    except AppException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+    
+    async def stream():
+        async for event in job.stream(since):
+            yield json.dumps(event) + "\n"
+    
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+@router.delete("/{job_id}")
+async def cancel_transcript_job(
+    job_id: str,
+    service: TranscriptService = Depends(get_transcript_service)
+):
+    """Stop a transcript job (e.g. the learner left the video)"""
+    try:
+        job = await service.cancel(job_id)
+        return job.describe()
+    except AppException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
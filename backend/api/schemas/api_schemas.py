@@ -1,6 +1,6 @@
 # backend/api/schemas/api_schemas.py
 from pydantic import BaseModel, Field, field_validator, validator
-from typing import List, Optional
+from typing import Dict, List, Literal, Optional
 
 class MeaningRequest(BaseModel):
     """Input from client"""
@@ -82,8 +82,10 @@ class PhoneticsResponse(BaseModel):
 
 class AudioGenerateRequest(BaseModel):
     """Request for audio generation"""
-    text: str = Field(..., min_length=1, max_length=500)
+    text: str = Field(..., min_length=1, max_length=5000)
     voice_preset: Optional[str] = Field(default="v2/en_speaker_6")
+    # Playback speed; 0.75 / 0.5 for slower listening practice
+    speed: float = Field(default=1.0, ge=0.25, le=2.0)
     
     @field_validator('text')
     def text_not_empty(cls, v):
@@ -95,7 +97,8 @@ class AudioGenerateRequest(BaseModel):
         json_schema_extra = {
             "example": {
                 "text": "Hello, how are you?",
-                "voice_preset": "v2/en_speaker_6"
+                "voice_preset": "v2/en_speaker_6",
+                "speed": 1.0
             }
         }
 
@@ -105,6 +108,7 @@ class AudioGenerateResponse(BaseModel):
     audio_url: str
     duration: Optional[float] = None
     voice_preset: str
+    speed: float = 1.0
     
     class Config:
         json_schema_extra = {
@@ -112,6 +116,69 @@ class AudioGenerateResponse(BaseModel):
                 "text": "Hello, how are you?",
                 "audio_url": "/api/audio/files/audio_123456.wav",
                 "duration": 2.5,
-                "voice_preset": "v2/en_speaker_6"
+                "voice_preset": "v2/en_speaker_6",
+                "speed": 1.0
             }
-        }
\ No newline at end of file
+        }
+
+LookupPart = Literal["meaning", "phonetics", "audio"]
+
+class LookupRequest(BaseModel):
+    """One word click: meaning, phonetics and audio in a single round-trip"""
+    text: str = Field(..., min_length=1, max_length=5000)
+    # Parts to fetch; all enabled parts when omitted
+    fields: Optional[List[LookupPart]] = None
+    voice_preset: Optional[str] = Field(default="v2/en_speaker_6")
+    speed: float = Field(default=1.0, ge=0.25, le=2.0)
+    include_ipa: bool = Field(default=True)
+    include_syllables: bool = Field(default=True)
+    
+    @field_validator('text')
+    def text_not_empty(cls, v):
+        if not v.strip():
+            raise ValueError('Text cannot be empty')
+        return v.strip()
+    
+    @field_validator('fields')
+    def fields_not_empty(cls, v):
+        if v is not None and not v:
+            raise ValueError('fields cannot be empty')
+        return v
+
+class LookupResponse(BaseModel):
+    """Whatever parts finished in time; the others are listed in `errors`"""
+    text: str
+    meaning: Optional[MeaningResponse] = None
+    phonetics: Optional[PhoneticsResponse] = None
+    audio: Optional[AudioGenerateResponse] = None
+    # part -> why it is missing (timeout, failure, disabled)
+    errors: Dict[str, str] = {}
+    # part -> milliseconds it took (or waited before timing out)
+    timings_ms: Dict[str, float] = {}
+    elapsed_ms: float
+
+
+class TranscriptLine(BaseModel):
+    """One caption line, as in YouTube transcripts"""
+    start: float = Field(..., ge=0)
+    duration: Optional[float] = Field(default=None, ge=0)
+    text: str = Field(..., max_length=1000)
+
+class TranscriptRequest(BaseModel):
+    """Whole transcript of a video session"""
+    lines: List[TranscriptLine] = Field(..., min_length=1)
+    # Current playback time: lines that already ended get no audio
+    position: float = Field(default=0.0, ge=0)
+    synthesize_audio: bool = Field(default=True)
+    voice_preset: Optional[str] = Field(default="v2/en_speaker_6")
+    speed: float = Field(default=1.0, ge=0.25, le=2.0)
+
+class TranscriptJobResponse(BaseModel):
+    """Handle of a transcript job; results stream from `events_url`"""
+    job_id: str
+    status: str
+    lines: int
+    words: int
+    audio_total: int
+    status_url: str
+    events_url: str
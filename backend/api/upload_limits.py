@@ -0,0 +1,43 @@
+# backend/api/upload_limits.py
+"""
+Reject oversized uploads before their body is read
+
+FastAPI parses multipart bodies before the endpoint runs, so a size check
+inside the route only happens after the whole upload was spooled. This
+ASGI middleware looks at Content-Length first and answers 413 right away.
+"""
+
+import json
+from typing import Dict
+
+
+class UploadLimitMiddleware:
+    """413 for requests to `limits` paths whose Content-Length is too big"""
+
+    def __init__(self, app, limits: Dict[str, int]):
+        self.app = app
+        # Exact path -> max request body bytes
+        self.limits = limits
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope.get("method") == "POST":
+            limit = self.limits.get(scope["path"].rstrip("/"))
+            length = dict(scope["headers"]).get(b"content-length", b"")
+            if limit and length.isdigit() and int(length) > limit:
+                await self._reject(send, limit)
+                return
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    async def _reject(send, limit: int):
+        body = json.dumps({"detail": f"Upload too large (max {limit} bytes)"}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 413,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"connection", b"close"),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,165 @@
+# backend/benchmarks/bench_alignment.py
+"""
+Needleman-Wunsch phoneme alignment: vectorized vs. cell-by-cell
+
+Times NeedlemanWunschAligner.align against the original pure-Python
+double loop (kept here as `legacy_align`) on random phoneme sequences,
+and checks both reach the same optimal score. Also reports peak memory
+of the full table vs. the word-segmented linear-memory mode.
+
+    python -m backend.benchmarks.bench_alignment
+    python -m backend.benchmarks.bench_alignment --sizes 10,100,1000 --json report.json
+"""
+
+import argparse
+import json
+import random
+import time
+import tracemalloc
+from pathlib import Path
+from typing import List, Tuple
+
+import numpy as np
+
+from backend.benchmarks.common import print_table
+from backend.services.phoneme_inventory import PHONEMES
+from backend.services.pronunciation_service import NeedlemanWunschAligner, WPSM
+
+
+def legacy_align(
+    wpsm: WPSM,
+    seq1: List[str],
+    seq2: List[str],
+    gap_penalty: float = -0.73
+) -> Tuple[List[str], List[str], float]:
+    """The original implementation: per-cell dict lookups, insert(0) traceback"""
+    m, n = len(seq1), len(seq2)
+    score = np.zeros((m + 1, n + 1))
+    trace = np.zeros((m + 1, n + 1), dtype=int)
+
+    for i in range(1, m + 1):
+        score[i][0] = score[i-1][0] + gap_penalty
+        trace[i][0] = 1
+    for j in range(1, n + 1):
+        score[0][j] = score[0][j-1] + gap_penalty
+        trace[0][j] = 2
+
+    for i in range(1, m + 1):
+        for j in range(1, n + 1):
+            diag = score[i-1][j-1] + wpsm.get_similarity(seq1[i-1], seq2[j-1])
+            up = score[i-1][j] + gap_penalty
+            left = score[i][j-1] + gap_penalty
+            if diag >= up and diag >= left:
+                score[i][j], trace[i][j] = diag, 0
+            elif up >= left:
+                score[i][j], trace[i][j] = up, 1
+            else:
+                score[i][j], trace[i][j] = left, 2
+
+    aligned1, aligned2 = [], []
+    i, j = m, n
+    while i > 0 or j > 0:
+        if i > 0 and j > 0 and trace[i][j] == 0:
+            aligned1.insert(0, seq1[i-1])
+            aligned2.insert(0, seq2[j-1])
+            i, j = i - 1, j - 1
+        elif i > 0 and trace[i][j] == 1:
+            aligned1.insert(0, seq1[i-1])
+            aligned2.insert(0, '-')
+            i -= 1
+        else:
+            aligned1.insert(0, '-')
+            aligned2.insert(0, seq2[j-1])
+            j -= 1
+    return aligned1, aligned2, score[m][n]
+
+
+def random_pair(size: int, rng: random.Random) -> Tuple[List[str], List[str]]:
+    """Reference sequence and a 'spoken' copy with ~15% edits"""
+    inventory = PHONEMES[:-1]
+    reference = [rng.choice(inventory) for _ in range(size)]
+    spoken = []
+    for phoneme in reference:
+        roll = rng.random()
+        if roll < 0.05:
+            continue
+        spoken.append(rng.choice(inventory) if roll < 0.10 else phoneme)
+        if roll > 0.95:
+            spoken.append(rng.choice(inventory))
+    return spoken, reference
+
+
+def best_time(fn, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def peak_mb(fn) -> float:
+    """Peak traced allocation of one call"""
+    tracemalloc.start()
+    try:
+        fn()
+        return round(tracemalloc.get_traced_memory()[1] / (1024 * 1024), 2)
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="10,100,1000")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--json", help="write the report to this file")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    wpsm = WPSM()
+    aligner = NeedlemanWunschAligner(wpsm)
+    # Forced into segmented mode at every size (4-phoneme "words")
+    segmented = NeedlemanWunschAligner(wpsm, max_cells=0, segment_phonemes=16)
+
+    results = []
+    for size in (int(s) for s in args.sizes.split(",")):
+        spoken, reference = random_pair(size, rng)
+        # The cell-by-cell version takes seconds at 1000 phonemes
+        legacy_repeats = max(1, args.repeats if size <= 100 else 1)
+
+        legacy_s = best_time(lambda: legacy_align(wpsm, spoken, reference), legacy_repeats)
+        vectorized_s = best_time(lambda: aligner.align(spoken, reference), args.repeats)
+
+        boundaries = list(range(4, len(reference), 4))
+        full = NeedlemanWunschAligner(wpsm, max_cells=10**12)
+        segmented_s = best_time(
+            lambda: segmented.align(spoken, reference, boundaries), args.repeats
+        )
+
+        _, _, legacy_score = legacy_align(wpsm, spoken, reference)
+        _, _, score = aligner.align(spoken, reference)
+        _, _, segmented_score = segmented.align(spoken, reference, boundaries)
+
+        results.append({
+            "phonemes": size,
+            "legacy_ms": round(legacy_s * 1000, 3),
+            "vectorized_ms": round(vectorized_s * 1000, 3),
+            "speedup": round(legacy_s / vectorized_s, 1),
+            "segmented_ms": round(segmented_s * 1000, 3),
+            "full_peak_mb": peak_mb(lambda: full.align(spoken, reference)),
+            "segmented_peak_mb": peak_mb(lambda: segmented.align(spoken, reference, boundaries)),
+            "same_score": bool(
+                abs(legacy_score - score) < 1e-6 and abs(segmented_score - score) < 1e-6
+            ),
+        })
+
+    print_table(results, "phonemes", [
+        "legacy_ms", "vectorized_ms", "speedup", "segmented_ms",
+        "full_peak_mb", "segmented_peak_mb", "same_score",
+    ])
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# backend/benchmarks/bench_cmudict.py
+"""
+Compare the cmudict.dict() loader with the memory-mapped CMUDict index
+
+Each loader runs in a fresh interpreter. Reports load time, resident and
+private (not file-backed, so not shared between workers) memory added by
+the load, and stress-stripped lookups per second.
+
+    python -m backend.benchmarks.bench_cmudict
+    python -m backend.benchmarks.bench_cmudict --lookups 500000 --json report.json
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import tempfile
+import time
+from pathlib import Path
+
+from backend.benchmarks.common import print_table, run_isolated
+from backend.core.profiling import bytes_to_mb
+
+LOADERS = ["dict", "index"]
+
+
+def _memory():
+    """(resident, private) bytes of this process"""
+    with open("/proc/self/statm") as f:
+        _, resident, shared = (int(v) for v in f.read().split()[:3])
+    page = os.sysconf("SC_PAGE_SIZE")
+    return resident * page, (resident - shared) * page
+
+
+def run_single(loader: str, index_path: str, lookups: int):
+    """Child process: load one way, then look up random words"""
+    import cmudict
+
+    words = [w for w, _ in cmudict.entries()]
+    sample = random.Random(0).choices(words, k=lookups)
+    # Keep the word list out of the loader's numbers
+    rss_before, private_before = _memory()
+
+    start = time.perf_counter()
+    if loader == "dict":
+        table = cmudict.dict()
+        lookup = lambda w: [re.sub(r'[0-9]', '', p) for p in table[w][0]]
+    else:
+        from backend.services.cmudict_index import CMUDictIndex
+        index = CMUDictIndex(index_path)
+        lookup = index.first
+    load_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for word in sample:
+        lookup(word)
+    lookup_s = time.perf_counter() - start
+
+    rss_after, private_after = _memory()
+    print(json.dumps({
+        "loader": loader,
+        "load_s": round(load_s, 4),
+        "rss_mb": bytes_to_mb(rss_after - rss_before),
+        "private_mb": bytes_to_mb(private_after - private_before),
+        "lookups_per_s": round(lookups / lookup_s),
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--loaders", default=",".join(LOADERS))
+    parser.add_argument("--lookups", type=int, default=200_000)
+    parser.add_argument("--json", help="write the report to this file")
+    parser.add_argument("--single", help=argparse.SUPPRESS)
+    parser.add_argument("--index", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single:
+        run_single(args.single, args.index, args.lookups)
+        return
+
+    from backend.services.cmudict_index import build_from_cmudict
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index_path = os.path.join(tmp, "cmudict.idx")
+        start = time.perf_counter()
+        build_from_cmudict(index_path)
+        print(f"Index built in {time.perf_counter() - start:.2f}s "
+              f"({os.path.getsize(index_path) / 1e6:.1f} MB)")
+
+        results = [
+            {"loader": name, **run_isolated("backend.benchmarks.bench_cmudict", [
+                "--single", name, "--index", index_path, "--lookups", str(args.lookups),
+            ])}
+            for name in args.loaders.split(",")
+        ]
+
+    print_table(results, "loader", ["load_s", "rss_mb", "private_mb", "lookups_per_s"])
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
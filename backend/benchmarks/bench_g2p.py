@@ -0,0 +1,106 @@
+# backend/benchmarks/bench_g2p.py
+"""
+Out-of-vocabulary G2P fallback: throughput and accuracy
+
+Times G2P on names and slang that CMUDict / eng_to_ipa don't know, cold
+(spelling rules) and warm (memoized lexicon), and the full sentence path of
+CMUDictLoader on text full of them. Accuracy is the phoneme error rate of
+the rules on random CMUDict words, where the answer is known.
+
+    python -m backend.benchmarks.bench_g2p
+    python -m backend.benchmarks.bench_g2p --repeats 20 --sample 5000 --json report.json
+"""
+
+import argparse
+import json
+import random
+from pathlib import Path
+
+from backend.benchmarks.bench_alignment import best_time
+from backend.benchmarks.common import print_table
+from backend.core.config import get_settings
+from backend.services.g2p import G2P, spell_to_phonemes
+from backend.services.pronunciation_service import CMUDictLoader, NeedlemanWunschAligner, WPSM
+
+# Not in CMUDict: first names, brands, internet slang
+OOV_WORDS = [
+    "aaliyah", "jaylen", "kaylee", "brayden", "zendaya", "nevaeh", "khaleesi",
+    "xander", "oakley", "maddox", "ximena", "zayn", "kairo", "amara", "jaxon",
+    "rizz", "yeet", "sus", "bussin", "skibidi", "delulu", "situationship",
+    "gyat", "cheugy", "finna", "bruh", "smol", "vibing", "ghosted", "sksksk",
+    "spotify", "tiktok", "airpods", "doordash", "chatbot", "fintech", "zoomer",
+    "instagrammable", "glamping", "hangry", "staycation", "mansplain", "doomscroll",
+]
+
+
+def phoneme_error_rate(sample):
+    """(edit distance / reference length, exact matches) of the rules on CMUDict words"""
+    aligner = NeedlemanWunschAligner(WPSM())
+    errors = total = exact = 0
+    for word, reference in sample:
+        guess = spell_to_phonemes(word)
+        a1, a2, _ = aligner.align(guess, reference)
+        errors += sum(1 for x, y in zip(a1, a2) if x != y)
+        total += len(reference)
+        exact += guess == reference
+    return errors / total, exact / len(sample)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeats", type=int, default=10)
+    parser.add_argument("--sample", type=int, default=3000, help="CMUDict words for accuracy")
+    parser.add_argument("--json", help="write the report to this file")
+    args = parser.parse_args()
+
+    plain = CMUDictLoader(get_settings().CMUDICT_INDEX_PATH)
+    loader = CMUDictLoader(get_settings().CMUDICT_INDEX_PATH, g2p=G2P())
+    oov = [w for w in OOV_WORDS if w not in plain.index]
+    sentence = " ".join(f"{w.capitalize()}, hello!" for w in oov)
+    n = len(oov)
+
+    def cold():
+        g2p = G2P()
+        for word in oov:
+            g2p.phonemes(word)
+
+    warm_g2p = G2P()
+
+    results = [
+        {"path": "g2p cold (rules)", "seconds": best_time(cold, args.repeats), "words": n},
+        {"path": "g2p warm (lexicon)", "seconds": best_time(
+            lambda: [warm_g2p.phonemes(w) for w in oov], args.repeats
+        ), "words": n},
+        {"path": "sentence, UNK only", "seconds": best_time(
+            lambda: plain.sentence_to_word_phonemes(sentence), args.repeats
+        ), "words": 2 * n},
+        {"path": "sentence, g2p warm", "seconds": best_time(
+            lambda: loader.sentence_to_word_phonemes(sentence), args.repeats
+        ), "words": 2 * n},
+    ]
+    for r in results:
+        r["us_per_word"] = round(1e6 * r["seconds"] / r["words"], 2)
+        r["words_per_s"] = round(r["words"] / r["seconds"])
+        r["seconds"] = round(r["seconds"], 6)
+
+    import cmudict
+    entries = [(w, p) for w, p in cmudict.dict().items() if w.isalpha()]
+    sample = [
+        (w, [s.rstrip("012") for s in prons[0]])
+        for w, prons in random.Random(0).sample(entries, args.sample)
+    ]
+    per, exact = phoneme_error_rate(sample)
+
+    print(f"{n} OOV words, e.g. " + ", ".join(
+        f"{w} -> {' '.join(loader.get_pronunciation(w))}" for w in oov[:4]
+    ))
+    print_table(results, "path", ["words", "us_per_word", "words_per_s"])
+    print(f"Rules vs CMUDict ({args.sample} words): phoneme error rate {per:.3f}, exact {exact:.3f}")
+    if args.json:
+        Path(args.json).write_text(json.dumps({
+            "throughput": results, "phoneme_error_rate": per, "exact": exact,
+        }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
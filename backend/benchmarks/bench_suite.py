@@ -0,0 +1,321 @@
+# backend/benchmarks/bench_suite.py
+"""
+Hot-path latency suite with regression thresholds
+
+Times every request hot path offline (stub TTS engine, stubbed Gemini
+client) and reports p50/p95/p99 per case:
+
+    phonetics   per word and per 5000-character text, cold and warm cache
+    alignment   Needleman-Wunsch at 10, 100 and 1000 phonemes
+    cmudict     index load and 1000 lookups
+    tts / audio response cache hit, hot audio file read
+    http        end-to-end FastAPI requests through backend.main:app
+
+With --baseline, a case fails when its --metric exceeds the baseline by
+more than --tolerance (and by more than --min-delta-ms, so microsecond
+cases don't fail on timer noise); the exit status is then 1.
+
+    python -m backend.benchmarks.bench_suite --json report.json
+    python -m backend.benchmarks.bench_suite --baseline backend/benchmarks/baseline.json
+    python -m backend.benchmarks.bench_suite --only alignment,cmudict --iterations 20
+    python -m backend.benchmarks.bench_suite --update-baseline backend/benchmarks/baseline.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from backend.benchmarks.bench_alignment import random_pair
+from backend.benchmarks.common import OfflineMeaningService, TTS_TEXTS, print_table
+
+PERCENTILES = (50, 95, 99)
+
+VOICE = "v2/en_speaker_6"
+
+# Words of the 5000-character text: CMUDict entries, so phonetics run
+# through eng_to_ipa like real subtitles (and a few miss, like real slang)
+TEXT_CHARS = 5000
+
+
+class Case:
+    """One timed call; `setup` runs untimed before each iteration"""
+
+    def __init__(
+        self,
+        name: str,
+        fn: Callable[[], object],
+        setup: Optional[Callable[[], object]] = None,
+        iterations: int = 200,
+        ops: int = 1,
+        warmup: int = 3
+    ):
+        self.name = name
+        self.fn = fn
+        self.setup = setup
+        self.iterations = iterations
+        self.ops = ops
+        self.warmup = warmup
+
+    @property
+    def group(self) -> str:
+        return self.name.split(".")[0]
+
+
+def summarize(samples: List[float], ops: int = 1) -> Dict:
+    """Percentiles (ms) of per-iteration durations in seconds"""
+    ms = np.asarray(samples) * 1000
+    summary = {"iterations": len(samples), "ops": ops}
+    for p, value in zip(PERCENTILES, np.percentile(ms, PERCENTILES)):
+        summary[f"p{p}_ms"] = round(float(value), 4)
+    summary["mean_ms"] = round(float(ms.mean()), 4)
+    summary["max_ms"] = round(float(ms.max()), 4)
+    if ops > 1:
+        summary["p50_us_per_op"] = round(summary["p50_ms"] * 1000 / ops, 3)
+    return summary
+
+
+def run_case(case: Case, iterations: Optional[int] = None) -> Dict:
+    for _ in range(case.warmup):
+        if case.setup:
+            case.setup()
+        case.fn()
+
+    samples = []
+    for _ in range(iterations or case.iterations):
+        if case.setup:
+            case.setup()
+        start = time.perf_counter()
+        case.fn()
+        samples.append(time.perf_counter() - start)
+    return {"case": case.name, **summarize(samples, case.ops)}
+
+
+def compare(
+    report: Dict,
+    baseline: Dict,
+    tolerance: float,
+    metric: str = "p95_ms",
+    min_delta_ms: float = 0.05
+) -> List[Dict]:
+    """Cases whose `metric` regressed past the baseline; missing cases are skipped"""
+    regressions = []
+    for name, result in report["cases"].items():
+        before = baseline.get("cases", {}).get(name, {}).get(metric)
+        if before is None:
+            continue
+        after = result[metric]
+        if after > before * (1 + tolerance) and after - before > min_delta_ms:
+            regressions.append({
+                "case": name,
+                "metric": metric,
+                "baseline": before,
+                "current": after,
+                "ratio": round(after / before, 2) if before else None
+            })
+    return regressions
+
+
+def _sample_text(rng: random.Random, chars: int = TEXT_CHARS) -> str:
+    import cmudict
+
+    words = [w for w in cmudict.words() if w.isalpha()]
+    parts, length = [], 0
+    while length < chars:
+        sentence = " ".join(rng.choice(words) for _ in range(rng.randint(5, 12))).capitalize() + "."
+        parts.append(sentence)
+        length += len(sentence) + 1
+    return " ".join(parts)[:chars]
+
+
+def build_cases(loop: asyncio.AbstractEventLoop) -> List[Case]:
+    """
+    Every case, on services built from the current settings. Expects
+    TTS_BACKEND=stub (see configure_offline); requests run on `loop`
+    """
+    from backend.api.dependencies import get_audio_file_service, get_coqui_tts_service
+    from backend.core.config import get_settings
+    from backend.services.cmudict_index import CMUDictIndex
+    from backend.services.g2p import G2P
+    from backend.services.phonetic_service import PhoneticService
+    from backend.services.pronunciation_service import NeedlemanWunschAligner, WPSM
+
+    rng = random.Random(0)
+    run = loop.run_until_complete
+    cases = []
+
+    # Phonetics
+    phonetics = PhoneticService(g2p=G2P())
+    text = _sample_text(rng)
+    words = phonetics._extract_words(text)
+    next_word = iter(words * 1000).__next__
+    cases += [
+        Case("phonetics.word_cold", lambda: phonetics.lookup_words([next_word()]),
+             setup=phonetics.cache.clear, iterations=500),
+        Case("phonetics.word_warm", lambda: phonetics.lookup_words(["hello"]), iterations=2000),
+        # eng_to_ipa costs ~10 ms per uncached word: seconds per text
+        Case("phonetics.text_5000_cold", lambda: run(phonetics.get_phonetics(text)),
+             setup=phonetics.cache.clear, iterations=5, warmup=1),
+        Case("phonetics.text_5000_warm", lambda: run(phonetics.get_phonetics(text)), iterations=50),
+    ]
+
+    # Alignment
+    aligner = NeedlemanWunschAligner(WPSM())
+    for size, iterations in ((10, 1000), (100, 300), (1000, 30)):
+        spoken, reference = random_pair(size, rng)
+        cases.append(Case(
+            f"alignment.nw_{size}",
+            lambda spoken=spoken, reference=reference: aligner.align(spoken, reference),
+            iterations=iterations
+        ))
+
+    # CMUDict
+    index_path = get_settings().CMUDICT_INDEX_PATH
+    index = CMUDictIndex.load_or_build(index_path)
+    lookups = rng.sample(words, min(len(words), 1000))
+    cases += [
+        Case("cmudict.load", lambda: CMUDictIndex(index_path), iterations=200),
+        Case("cmudict.lookup", lambda: [index.first(w) for w in lookups],
+             iterations=200, ops=len(lookups)),
+    ]
+
+    # TTS response cache and audio files
+    tts = get_coqui_tts_service()
+    files = get_audio_file_service()
+    cached = run(tts.generate_audio(TTS_TEXTS[1], VOICE, 1.0))
+    filename = cached.audio_url.rsplit("/", 1)[-1]
+    cases += [
+        Case("tts.cache_hit", lambda: run(tts.generate_audio(TTS_TEXTS[1], VOICE, 1.0)),
+             iterations=2000),
+        Case("audio.read", lambda: run(files.read(files.get_existing(filename))), iterations=2000),
+    ]
+    return cases
+
+
+def build_http_cases(client, filename: str) -> List[Case]:
+    """End-to-end requests through the real app (middleware, routing, validation)"""
+    etag = client.get(f"/api/audio/files/{filename}").headers["etag"]
+
+    def expect(status: int, method: str, url: str, **kwargs):
+        def call():
+            response = client.request(method, url, **kwargs)
+            if response.status_code != status:
+                raise RuntimeError(f"{method} {url}: {response.status_code} {response.text[:200]}")
+        return call
+
+    return [
+        Case("http.health", expect(200, "GET", "/health"), iterations=300),
+        Case("http.phonetics", expect(200, "POST", "/api/phonetics", json={"text": "Hello, world!"}),
+             iterations=300),
+        Case("http.meaning", expect(200, "POST", "/api/meaning", json={"text": "hello"}), iterations=300),
+        Case("http.audio_generate_cached", expect(
+            200, "POST", "/api/audio/generate", json={"text": TTS_TEXTS[1]}
+        ), iterations=300),
+        Case("http.audio_file", expect(200, "GET", f"/api/audio/files/{filename}"), iterations=300),
+        Case("http.audio_file_not_modified", expect(
+            304, "GET", f"/api/audio/files/{filename}", headers={"If-None-Match": etag}
+        ), iterations=300),
+        Case("http.lookup", expect(
+            200, "POST", "/api/lookup", json={"text": "hello"}
+        ), iterations=300),
+    ]
+
+
+def configure_offline(workdir: str):
+    """Stub TTS engine, no preloading, generated files under `workdir`"""
+    from backend.core.config import get_settings
+
+    os.environ["TTS_BACKEND"] = "stub"
+    os.environ["PRELOAD_ON_STARTUP"] = "false"
+    os.environ["AUDIO_DIR"] = str(Path(workdir) / "audio_files")
+    os.environ.setdefault("CMUDICT_INDEX_PATH", str(Path(__file__).parents[2] / "models" / "cmudict.idx"))
+    get_settings.cache_clear()
+
+
+def run_suite(groups: Optional[List[str]] = None, iterations: Optional[int] = None) -> Dict:
+    """Run the selected groups (all by default) and return the report"""
+    from fastapi.testclient import TestClient
+
+    from backend.api.dependencies import (
+        get_coqui_tts_service, get_lookup_service, get_meaning_service, get_phonetic_service
+    )
+    from backend.services.lookup_service import LookupService
+
+    loop = asyncio.new_event_loop()
+    results = {}
+    with ExitStack() as stack:
+        stack.callback(loop.close)
+        cases = build_cases(loop)
+
+        if groups is None or "http" in groups:
+            from backend.main import app
+
+            meaning = OfflineMeaningService()
+            lookup = LookupService(
+                meaning=lambda: meaning, phonetics=get_phonetic_service, tts=get_coqui_tts_service
+            )
+            app.dependency_overrides[get_meaning_service] = lambda: meaning
+            app.dependency_overrides[get_lookup_service] = lambda: lookup
+            stack.callback(app.dependency_overrides.clear)
+            client = stack.enter_context(TestClient(app))
+            audio = client.post("/api/audio/generate", json={"text": TTS_TEXTS[1]})
+            cases += build_http_cases(client, audio.json()["audio_url"].rsplit("/", 1)[-1])
+
+        for case in cases:
+            if groups is None or case.group in groups:
+                results[case.name] = run_case(case, iterations)
+
+    return {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "cases": results
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--only", help="comma-separated groups, e.g. alignment,http")
+    parser.add_argument("--iterations", type=int, help="override every case's iteration count")
+    parser.add_argument("--json", help="write the report to this file")
+    parser.add_argument("--baseline", help="fail on regressions against this report")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="allowed slowdown (0.5 = +50%%)")
+    parser.add_argument("--metric", default="p95_ms", choices=[f"p{p}_ms" for p in PERCENTILES])
+    parser.add_argument("--min-delta-ms", type=float, default=0.05)
+    parser.add_argument("--update-baseline", help="write the report as the new baseline")
+    args = parser.parse_args()
+
+    groups = args.only.split(",") if args.only else None
+    with tempfile.TemporaryDirectory() as workdir:
+        configure_offline(workdir)
+        report = run_suite(groups, args.iterations)
+
+    rows = list(report["cases"].values())
+    print_table(rows, "case", ["iterations", "p50_ms", "p95_ms", "p99_ms"], name_width=30)
+    for path in (args.json, args.update_baseline):
+        if path:
+            Path(path).write_text(json.dumps(report, indent=2))
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        regressions = compare(report, baseline, args.tolerance, args.metric, args.min_delta_ms)
+        for r in regressions:
+            print(f"❌ {r['case']}: {r['metric']} {r['current']} ms vs {r['baseline']} ms ({r['ratio']}x)")
+        if regressions:
+            sys.exit(1)
+        print(f"✅ No {args.metric} regression beyond {args.tolerance:.0%} of {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# backend/benchmarks/bench_tts_backends.py
+"""
+Compare TTS backends from the registry (e.g. torch VITS vs ONNX Runtime)
+
+Each backend runs in a fresh interpreter so RSS is attributable. Reports
+load time, real-time factor, RSS and output similarity to the first backend.
+
+    python -m backend.benchmarks.bench_tts_backends --backends coqui_vits,onnx_vits
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from backend.benchmarks.common import TTS_TEXTS, add_similarity, print_table, run_isolated
+
+
+def run_single(backend_name: str, out_path: str, repeats: int):
+    """Child process: load one backend and time synthesis"""
+    from backend.core.config import get_settings
+    from backend.core.profiling import bytes_to_mb, current_rss_bytes
+    from backend.services.tts_backends import create_backend
+
+    backend = create_backend(get_settings(), backend_name)
+    voice = backend.resolve_voice("default")
+
+    start = time.perf_counter()
+    backend.load()
+    load_s = time.perf_counter() - start
+
+    # Warm up (JIT, allocator, ORT graph init)
+    backend.synthesize(TTS_TEXTS[0], voice)
+
+    try:
+        import torch
+    except ImportError:
+        torch = None
+
+    waveforms = {}
+    latencies, audio_s = [], 0.0
+    for i, text in enumerate(TTS_TEXTS):
+        for _ in range(repeats):
+            if torch is not None:
+                torch.manual_seed(0)
+            start = time.perf_counter()
+            waveform = backend.synthesize(text, voice)
+            latencies.append(time.perf_counter() - start)
+            audio_s += len(waveform) / backend.sample_rate
+        waveforms[f"text_{i}"] = waveform
+
+    np.savez(out_path, **waveforms)
+    print(json.dumps({
+        "backend": backend_name,
+        "load_s": round(load_s, 3),
+        "p50_ms": round(float(np.percentile(latencies, 50)) * 1000, 1),
+        "rtf": round(sum(latencies) / audio_s, 4) if audio_s else None,
+        "rss_mb": bytes_to_mb(current_rss_bytes()),
+        "waveforms": out_path,
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--backends", default="coqui_vits,onnx_vits",
+                        help="comma separated; the first one is the similarity reference")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--json", help="write the report to this file")
+    parser.add_argument("--single", help=argparse.SUPPRESS)
+    parser.add_argument("--out", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single:
+        run_single(args.single, args.out, args.repeats)
+        return
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in args.backends.split(","):
+            result = run_isolated("backend.benchmarks.bench_tts_backends", [
+                "--single", name,
+                "--out", os.path.join(tmp, f"{name}.npz"),
+                "--repeats", str(args.repeats),
+            ])
+            results.append({"backend": name, **result})
+        add_similarity(results)
+
+    print_table(results, "backend", ["load_s", "p50_ms", "rtf", "rss_mb", "similarity"])
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+# backend/benchmarks/bench_tts_profiles.py
+"""
+Compare CPU inference profiles for the VITS model
+
+Each profile runs in a fresh interpreter (torch thread pools can only be
+configured once per process). Reports real-time factor, RSS and spectral
+similarity of the output against the first profile.
+
+    python -m backend.benchmarks.bench_tts_profiles
+    python -m backend.benchmarks.bench_tts_profiles --profiles default,int8 --json report.json
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from backend.benchmarks.common import TTS_TEXTS, add_similarity, print_table, run_isolated
+from backend.services.inference_profile import InferenceProfile
+
+PROFILES = {
+    # Plain eager torch: autograd on, default threads
+    "default": dict(inference_mode=False),
+    "inference_mode": dict(inference_mode=True),
+    "threads_1": dict(inference_mode=True, intra_op_threads=1, inter_op_threads=1),
+    "threads_4": dict(inference_mode=True, intra_op_threads=4, inter_op_threads=1),
+    "int8": dict(inference_mode=True, quantize_int8=True),
+    "compile": dict(inference_mode=True, torch_compile=True),
+}
+
+
+def run_single(profile_name: str, out_path: str, repeats: int):
+    """Child process: load the model with one profile and time synthesis"""
+    import torch
+    from backend.core.profiling import bytes_to_mb, current_rss_bytes
+    from backend.services.coqui_tts_service import CoquiTTSService
+
+    service = CoquiTTSService()
+    service.backend.profile = InferenceProfile(**PROFILES[profile_name])
+
+    start = time.perf_counter()
+    service._load_models()
+    load_s = time.perf_counter() - start
+
+    speaker = service._get_speaker("default")
+    # First call pays JIT/compile costs; keep it out of the steady-state numbers
+    start = time.perf_counter()
+    service._synthesize(TTS_TEXTS[0], speaker)
+    first_call_s = time.perf_counter() - start
+
+    synth_s, audio_s = 0.0, 0.0
+    waveforms = {}
+    for i, text in enumerate(TTS_TEXTS):
+        for _ in range(repeats):
+            # VITS samples noise: seed so profiles are comparable
+            torch.manual_seed(0)
+            start = time.perf_counter()
+            waveform = service._synthesize(text, speaker)
+            synth_s += time.perf_counter() - start
+            audio_s += len(waveform) / service.sample_rate
+        waveforms[f"text_{i}"] = waveform
+
+    np.savez(out_path, **waveforms)
+    print(json.dumps({
+        "profile": profile_name,
+        "settings": service.backend.profile.describe(),
+        "load_s": round(load_s, 3),
+        "first_call_s": round(first_call_s, 3),
+        "rtf": round(synth_s / audio_s, 4) if audio_s else None,
+        "rss_mb": bytes_to_mb(current_rss_bytes()),
+        "threads": torch.get_num_threads(),
+        "waveforms": out_path,
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--profiles", default=",".join(PROFILES),
+                        help="comma separated; the first one is the similarity reference")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--json", help="write the report to this file")
+    parser.add_argument("--single", help=argparse.SUPPRESS)
+    parser.add_argument("--out", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single:
+        run_single(args.single, args.out, args.repeats)
+        return
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in args.profiles.split(","):
+            result = run_isolated("backend.benchmarks.bench_tts_profiles", [
+                "--single", name,
+                "--out", os.path.join(tmp, f"{name}.npz"),
+                "--repeats", str(args.repeats),
+            ])
+            results.append({"profile": name, **result})
+        add_similarity(results)
+
+    print_table(results, "profile", ["rtf", "rss_mb", "load_s", "first_call_s", "similarity"])
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# backend/benchmarks/bench_variants.py
+"""
+Multi-variant reference alignment: lattice vs. single reference
+
+Builds passages of random CMUDict words (every pronunciation of each word)
+and times NeedlemanWunschAligner.align_variants against aligning with the
+first pronunciations only, plus enumerating every sentence variant where
+that is still feasible.
+
+    python -m backend.benchmarks.bench_variants
+    python -m backend.benchmarks.bench_variants --words 10,50,200 --json report.json
+"""
+
+import argparse
+import itertools
+import json
+import math
+import random
+from pathlib import Path
+
+from backend.benchmarks.bench_alignment import best_time
+from backend.benchmarks.common import print_table
+from backend.core.config import get_settings
+from backend.services.phoneme_inventory import PHONEMES
+from backend.services.pronunciation_service import CMUDictLoader, NeedlemanWunschAligner, WPSM
+
+# Above this many sentence variants, enumeration is not timed
+MAX_ENUMERATED = 512
+
+
+def sample_passage(loader: CMUDictLoader, vocabulary, size: int, rng: random.Random):
+    """`size` words with all their pronunciations, and a spoken version
+    that uses random variants with ~10% phoneme edits"""
+    words = loader.sentence_to_word_variants(" ".join(rng.choices(vocabulary, k=size)))
+    inventory = PHONEMES[:-1]
+    spoken = []
+    for variants in words:
+        for phoneme in rng.choice(variants):
+            roll = rng.random()
+            if roll < 0.05:
+                continue
+            spoken.append(rng.choice(inventory) if roll < 0.10 else phoneme)
+    return spoken, words
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--words", default="5,10,50,200")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--json", help="write the report to this file")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    loader = CMUDictLoader(get_settings().CMUDICT_INDEX_PATH)
+    # Common-ish words: short ones, a third of them with several pronunciations
+    import cmudict
+    entries = cmudict.dict()
+    single = [w for w, p in entries.items() if w.isalpha() and len(w) <= 7 and len(p) == 1]
+    multi = [w for w, p in entries.items() if w.isalpha() and len(w) <= 7 and len(p) > 1]
+    vocabulary = rng.sample(single, 2000) + rng.sample(multi, 1000)
+
+    aligner = NeedlemanWunschAligner(WPSM())
+    results = []
+    for size in (int(s) for s in args.words.split(",")):
+        spoken, words = sample_passage(loader, vocabulary, size, rng)
+        first = [p for variants in words for p in variants[0]]
+        combinations = math.prod(len(variants) for variants in words)
+
+        single_s = best_time(lambda: aligner.align(spoken, first), args.repeats)
+        lattice_s = best_time(lambda: aligner.align_variants(spoken, words), args.repeats)
+        _, _, single_score = aligner.align(spoken, first)
+        _, _, lattice_score, chosen = aligner.align_variants(spoken, words)
+
+        result = {
+            "words": size,
+            "phonemes": len(first),
+            "variant_rows": sum(len(v) for variants in words for v in variants),
+            "combinations": combinations,
+            "single_ms": round(single_s * 1000, 3),
+            "lattice_ms": round(lattice_s * 1000, 3),
+            "overhead": round(lattice_s / single_s, 2),
+            "score_gain": round(lattice_score - single_score, 2),
+            "enumerate_ms": None,
+        }
+        if combinations <= MAX_ENUMERATED:
+            sentences = [
+                [p for variant in combo for p in variant] for combo in itertools.product(*words)
+            ]
+            result["enumerate_ms"] = round(1000 * best_time(
+                lambda: max(aligner.align(spoken, s)[2] for s in sentences), 1
+            ), 3)
+            best = max(aligner.align(spoken, s)[2] for s in sentences)
+            result["same_score"] = abs(best - lattice_score) < 1e-6
+        results.append(result)
+
+    print_table(results, "words", [
+        "phonemes", "variant_rows", "combinations", "single_ms", "lattice_ms",
+        "overhead", "enumerate_ms", "score_gain",
+    ])
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# backend/benchmarks/common.py
+"""Helpers shared by the benchmark scripts"""
+
+import json
+import os
+import subprocess
+import sys
+from types import SimpleNamespace
+from typing import Dict, List
+
+import numpy as np
+
+from backend.services.audio_utils import spectral_similarity
+from backend.services.meaning_service import MeaningService
+
+# Settings require a Gemini key; benchmarks never call Gemini
+os.environ.setdefault("API_KEY_GEMINI", "offline-benchmark")
+
+# Sentences used by the TTS benchmarks
+TTS_TEXTS = [
+    "Hello, how are you?",
+    "The quick brown fox jumps over the lazy dog.",
+    "Learning a language takes patience, practice and a little curiosity every day.",
+]
+
+
+class StubGeminiClient:
+    """Stands in for google.genai.Client: canned JSON, no network"""
+
+    def __init__(self):
+        self.models = self
+        self.calls = 0
+
+    def generate_content(self, model: str, contents: str):
+        self.calls += 1
+        return SimpleNamespace(text=json.dumps({
+            "meaning": "a greeting",
+            "synonyms": ["hi", "hey"],
+            "examples": ["Hello, how are you?"]
+        }))
+
+
+class OfflineMeaningService(MeaningService):
+    """MeaningService with the Gemini client stubbed (prompt and parsing still run)"""
+
+    def _initialize_gemini(self):
+        self.client = StubGeminiClient()
+
+
+def run_isolated(module: str, args: List[str], env: Dict[str, str] = None) -> Dict:
+    """
+    Run `python -m module *args` in a fresh interpreter and parse the JSON
+    object it prints last. Keeps RSS and torch thread settings per run.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-m", module, *args],
+        capture_output=True,
+        text=True,
+        env=env
+    )
+    if proc.returncode != 0:
+        return {"error": proc.stderr.strip()[-500:] or "failed"}
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def add_similarity(results: List[Dict], key: str = "waveforms"):
+    """
+    Compare each run's saved waveforms (npz path under `key`) against the
+    first successful run; stores the worst per-text similarity
+    """
+    ok = [r for r in results if "error" not in r]
+    if not ok:
+        return
+
+    reference = np.load(ok[0][key])
+    for result in ok:
+        waves = np.load(result[key])
+        result["similarity"] = round(min(
+            spectral_similarity(waves[name], reference[name]) for name in waves.files
+        ), 4)
+    for result in ok:
+        result.pop(key)
+
+
+def print_table(results: List[Dict], name_key: str, columns: List[str], name_width: int = 16):
+    """Fixed-width report"""
+    print(f"{name_key:<{name_width}}" + "".join(f"{c:>14}" for c in columns))
+    for r in results:
+        if "error" in r:
+            print(f"{r[name_key]:<{name_width}} failed: {r['error'].splitlines()[-1]}")
+            continue
+        print(f"{r[name_key]:<{name_width}}" + "".join(f"{str(r.get(c)):>14}" for c in columns))
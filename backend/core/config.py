@@ -37,6 +37,135 @@ class Settings(BaseSettings):
     # native torchaudio/encodec dependencies. Set to true in .env when
     # running on a system with compatible PyTorch (e.g. torch==2.8.0+cpu).
     USE_TRANSFORMER_BARK: bool = False
+
+    # TTS engine from backend.services.tts_backends:
+    # coqui_vits | onnx_vits | bark | stub
+    TTS_BACKEND: str = "coqui_vits"
+    # Exported with: python -m ml.models.vits_onnx --out models/vits_vctk.onnx
+    TTS_ONNX_PATH: str = "models/vits_vctk.onnx"
+    BARK_MODEL_NAME: str = "suno/bark-small"
+
+    # Feature flags: disabled subsystems are never imported or mounted,
+    # so e.g. a phonetics-only worker skips torch/TTS entirely
+    ENABLE_MEANING: bool = True
+    ENABLE_PHONETICS: bool = True
+    ENABLE_AUDIO: bool = True
+    ENABLE_PRONUNCIATION: bool = True
+
+    # /api/lookup: meaning, phonetics and audio run concurrently, each
+    # bounded by its own timeout (a slow part is left out of the response)
+    LOOKUP_MEANING_TIMEOUT_SECONDS: float = 8.0
+    LOOKUP_PHONETICS_TIMEOUT_SECONDS: float = 2.0
+    LOOKUP_AUDIO_TIMEOUT_SECONDS: float = 10.0
+
+    # Transcript jobs (YouTube sessions): vocabulary phonetics are
+    # precomputed in batches of TRANSCRIPT_PHONETICS_BATCH words and line
+    # audio is synthesized in timestamp order by TRANSCRIPT_AUDIO_CONCURRENCY
+    # workers; finished jobs are kept TRANSCRIPT_JOB_TTL_SECONDS
+    TRANSCRIPT_MAX_LINES: int = 5000
+    TRANSCRIPT_MAX_ACTIVE_JOBS: int = 4
+    TRANSCRIPT_JOB_TTL_SECONDS: float = 3600.0
+    TRANSCRIPT_PHONETICS_BATCH: int = 200
+    TRANSCRIPT_AUDIO_CONCURRENCY: int = 2
+
+    # Audio file serving
+    AUDIO_DIR: str = "audio_files"
+    # Files are content-addressed (audio_<md5>.wav), so clients may keep them forever
+    AUDIO_CACHE_MAX_AGE: int = 31536000
+    # In-memory cache for the most played clips
+    AUDIO_HOT_CACHE_ITEMS: int = 64
+    AUDIO_HOT_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+    AUDIO_HOT_CACHE_MIN_PLAYS: int = 2
+
+    # Sentence-level TTS cache
+    TTS_SEGMENT_CACHE_ITEMS: int = 1024
+    TTS_SEGMENT_CACHE_MAX_BYTES: int = 128 * 1024 * 1024
+    # Crossfade between concatenated sentences (milliseconds)
+    TTS_CROSSFADE_MS: float = 15.0
+    # Full-text base waveforms kept in memory to derive speed variants
+    TTS_BASE_CACHE_ITEMS: int = 128
+    TTS_BASE_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+
+    # Long texts: split into chunks of at most TTS_CHUNK_CHARS and, above
+    # TTS_LONG_TEXT_CHARS, synthesize them in parallel on TTS_REPLICAS worker
+    # processes (each loads its own model; 1 = no pool)
+    TTS_CHUNK_CHARS: int = 200
+    TTS_LONG_TEXT_CHARS: int = 200
+    TTS_REPLICAS: int = 1
+
+    # Pronunciation alignment: tables above this many cells are aligned in
+    # linear memory (word-segmented when word boundaries are known), with
+    # segments of at least PRONUNCIATION_SEGMENT_PHONEMES reference phonemes
+    PRONUNCIATION_MAX_ALIGN_CELLS: int = 1_000_000
+    PRONUNCIATION_SEGMENT_PHONEMES: int = 48
+    # Batch scoring: worker processes (0 = one per CPU) and max files per request
+    PRONUNCIATION_WORKERS: int = 0
+    PRONUNCIATION_BATCH_MAX_FILES: int = 100
+    # Upload limits: one recording, and a whole batch request
+    PRONUNCIATION_MAX_UPLOAD_BYTES: int = 10 * 1024 * 1024
+    PRONUNCIATION_MAX_BATCH_BYTES: int = 200 * 1024 * 1024
+    # Expected texts whose reference data (phonemes, identity score, TTS
+    # features) stay cached
+    PRONUNCIATION_REFERENCE_CACHE_ITEMS: int = 512
+    # Live scoring over WebSocket: 16-bit PCM chunks are queued up to
+    # PRONUNCIATION_STREAM_MAX_PENDING_CHUNKS (further chunks are dropped),
+    # aligned online in a window of PRONUNCIATION_STREAM_WINDOW_FRAMES
+    # reference frames; a stream ends after PRONUNCIATION_STREAM_MAX_SECONDS
+    PRONUNCIATION_STREAM_MAX_PENDING_CHUNKS: int = 32
+    PRONUNCIATION_STREAM_WINDOW_FRAMES: int = 300
+    PRONUNCIATION_STREAM_MAX_SECONDS: int = 120
+    # Analyses of identical uploads (same audio bytes and normalized text)
+    # are served from a cache for PRONUNCIATION_RESULT_CACHE_TTL_SECONDS
+    PRONUNCIATION_RESULT_CACHE_ITEMS: int = 1024
+    PRONUNCIATION_RESULT_CACHE_TTL_SECONDS: float = 900.0
+    # Recordings are trimmed to the speech (frame energy VAD, PRONUNCIATION_VAD_PAD_MS
+    # kept on each side) and scaled to PRONUNCIATION_TARGET_DBFS before scoring;
+    # less than PRONUNCIATION_MIN_SPEECH_MS of speech, or more than
+    # PRONUNCIATION_MAX_CLIPPED_RATIO clipped samples, is rejected
+    PRONUNCIATION_VAD_ENABLED: bool = True
+    PRONUNCIATION_VAD_TOP_DB: float = 35.0
+    PRONUNCIATION_VAD_PAD_MS: float = 150.0
+    PRONUNCIATION_MIN_SPEECH_MS: float = 100.0
+    PRONUNCIATION_TARGET_DBFS: float = -20.0
+    PRONUNCIATION_MAX_CLIPPED_RATIO: float = 0.01
+    # Spelling-rule G2P for out-of-vocabulary words: memoized words
+    G2P_CACHE_ITEMS: int = 10_000
+    # Memory-mapped CMUDict index, built from the cmudict package if missing
+    CMUDICT_INDEX_PATH: str = "models/cmudict.idx"
+
+    # Acoustic scoring: learner audio vs. the TTS rendering of the text
+    # (MFCC + DTW). Needs ENABLE_AUDIO for the reference voice
+    ENABLE_ACOUSTIC_SCORING: bool = True
+    ACOUSTIC_REFERENCE_VOICE: str = "v2/en_speaker_6"
+    ACOUSTIC_REFERENCE_CACHE_ITEMS: int = 256
+    ACOUSTIC_SAMPLE_RATE: int = 16000
+    ACOUSTIC_N_MFCC: int = 13
+    ACOUSTIC_HOP_MS: float = 10.0
+    # DTW band half-width as a fraction of the longer sequence
+    ACOUSTIC_BAND_RATIO: float = 0.2
+    # Phoneme score = 100 * exp(-mean MFCC distance / scale); phonemes under
+    # ACOUSTIC_MIN_PHONEME_SCORE count as mispronounced
+    ACOUSTIC_DEVIATION_SCALE: float = 4.0
+    ACOUSTIC_MIN_PHONEME_SCORE: float = 40.0
+
+    # CPU inference profile for the torch TTS model
+    # Thread counts: 0 keeps torch's default (one intra-op thread per core)
+    TTS_INTRA_OP_THREADS: int = 0
+    TTS_INTER_OP_THREADS: int = 0
+    # Run synthesis under torch.inference_mode (no autograd bookkeeping)
+    TTS_INFERENCE_MODE: bool = True
+    # Dynamic int8 quantization of nn.Linear layers
+    TTS_QUANTIZE_INT8: bool = False
+    # torch.compile the model's inference (slow first call, faster after)
+    TTS_TORCH_COMPILE: bool = False
+
+    # Startup preloading (see /ready)
+    PRELOAD_ON_STARTUP: bool = True
+    PRELOAD_TTS: bool = True
+    PRELOAD_CMUDICT: bool = True
+    PRELOAD_PHONETICS: bool = True
+    # Short synthesis run after loading so the first request skips JIT warmup
+    TTS_WARMUP_TEXT: str = "Hello, and welcome."
     
     # Database (future)
     DATABASE_URL: str = "sqlite+aiosqlite:///./tts_extension.db"
@@ -33,4 +33,58 @@ class ExternalServiceError(AppException):
             status_code=502,
             error_type="external_service_error",
             details={"service": service_name}
-        )
\ No newline at end of file
+        )
+
+class PayloadTooLargeError(AppException):
+    """Upload exceeds the configured size limit"""
+    def __init__(self, message: str):
+        super().__init__(
+            message=message,
+            status_code=413,
+            error_type="payload_too_large"
+        )
+
+class NotFoundError(AppException):
+    """Requested resource does not exist"""
+    def __init__(self, message: str):
+        super().__init__(
+            message=message,
+            status_code=404,
+            error_type="not_found"
+        )
+
+class EmptyRecordingError(AppException):
+    """Recording has no speech (silent, or too short)"""
+    def __init__(self, message: str):
+        super().__init__(
+            message=message,
+            status_code=422,
+            error_type="empty_recording"
+        )
+
+class ClippedRecordingError(AppException):
+    """Recording is too distorted (clipped) to score"""
+    def __init__(self, message: str):
+        super().__init__(
+            message=message,
+            status_code=422,
+            error_type="clipped_recording"
+        )
+
+class ServiceBusyError(AppException):
+    """Too much work already in progress; retry later"""
+    def __init__(self, message: str):
+        super().__init__(
+            message=message,
+            status_code=429,
+            error_type="service_busy"
+        )
+
+class ScoringUnavailableError(AppException):
+    """Pronunciation can't be scored (no acoustic reference to compare with)"""
+    def __init__(self, message: str):
+        super().__init__(
+            message=message,
+            status_code=503,
+            error_type="scoring_unavailable"
+        )
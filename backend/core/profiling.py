@@ -0,0 +1,67 @@
+# backend/core/profiling.py
+import os
+import sys
+import time
+from typing import Optional
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """High-water mark of RSS for this process"""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # macOS reports bytes, Linux reports kilobytes
+        return peak if sys.platform == "darwin" else peak * 1024
+    except (ImportError, OSError):
+        return None
+
+
+def current_rss_bytes() -> Optional[int]:
+    """
+    Resident set size of this process
+    Reads /proc on Linux, falls back to peak RSS elsewhere
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return peak_rss_bytes()
+
+
+def bytes_to_mb(value: Optional[int]) -> Optional[float]:
+    """Bytes -> MB rounded for reporting"""
+    return round(value / (1024 * 1024), 1) if value is not None else None
+
+
+class CallMeter:
+    """
+    Measures latency and peak memory of a block
+
+        with CallMeter() as meter:
+            run_model()
+        meter.latency_s, meter.peak_rss_delta_bytes
+
+    Peak memory comes from the process RSS high-water mark: if the block
+    raised it we know the exact peak, otherwise we fall back to RSS after.
+    """
+
+    def __enter__(self) -> "CallMeter":
+        self.rss_before = current_rss_bytes()
+        self.peak_before = peak_rss_bytes()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.latency_s = time.perf_counter() - self._start
+        rss_after = current_rss_bytes()
+        peak_after = peak_rss_bytes()
+
+        self.peak_rss_delta_bytes = None
+        if self.rss_before is not None and rss_after is not None:
+            peak = rss_after
+            if peak_after is not None and self.peak_before is not None \
+                    and peak_after > self.peak_before:
+                peak = max(peak, peak_after)
+            self.peak_rss_delta_bytes = max(peak - self.rss_before, 0)
+        return False
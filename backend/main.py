@@ -3,10 +3,13 @@ import logging
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from backend.core.config import get_settings
-from backend.api.routes.api_meaning import router as meaning_router
-from backend.api.routes.api_phonetic import router as phonetic_router
-from backend.api.routes.api_audio import router as audio_router
-from backend.api.routes.api_pronunciation import router as pronunciation_router
+from backend.api.routes.api_health import router as health_router
+from backend.api.routes.api_metrics import router as metrics_router
+from backend.api.request_metrics import MetricsMiddleware
+from backend.api.upload_limits import UploadLimitMiddleware
+from backend.api.dependencies import (
+    get_coqui_tts_service, get_pronunciation_service, get_transcript_service, get_warmup_service
+)
 from contextlib import asynccontextmanager
 # Setup logging
 logging.basicConfig(
@@ -18,18 +21,32 @@ logger = logging.getLogger(__name__)
 # Get settings
 settings = get_settings()
 
-# Startup event
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # Startup
     logger.info("🚀 Application starting...")
     logger.info(f"📝 App: {settings.APP_NAME} v{settings.APP_VERSION}")
     logger.info(f"🔧 Debug mode: {settings.DEBUG}")
+
+    warmup = get_warmup_service()
+    if settings.PRELOAD_ON_STARTUP:
+        # Runs in the background: the server accepts traffic, /ready says when warm
+        warmup.start()
+
     yield
-# Shutdown event
-@asynccontextmanager
-async def lifespan(app: FastAPI):
+
+    # Shutdown
+    await warmup.stop()
+    if get_transcript_service.cache_info().currsize:
+        # Stop transcript jobs before the services they use
+        await get_transcript_service().shutdown()
+    if settings.ENABLE_AUDIO and get_coqui_tts_service.cache_info().currsize:
+        # Stop TTS replica processes if any were started
+        get_coqui_tts_service().shutdown()
+    if settings.ENABLE_PRONUNCIATION and get_pronunciation_service.cache_info().currsize:
+        # Stop batch scoring workers if any were started
+        get_pronunciation_service().shutdown()
     logger.info("👋 Application shutting down...")
-    yield
 
 app = FastAPI(
     lifespan=lifespan,
@@ -46,11 +63,38 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
-# Routes
-app.include_router(meaning_router)
-app.include_router(phonetic_router) 
-app.include_router(audio_router)  # NEW
-app.include_router(pronunciation_router)
+# Oversized recordings are refused before the body is read
+# (single upload: file limit + room for the multipart envelope and text)
+app.add_middleware(
+    UploadLimitMiddleware,
+    limits={
+        "/api/pronunciation/analyze": settings.PRONUNCIATION_MAX_UPLOAD_BYTES + 64 * 1024,
+        "/api/pronunciation/analyze/batch": settings.PRONUNCIATION_MAX_BATCH_BYTES,
+    }
+)
+# Outermost: latency as the client sees it
+app.add_middleware(MetricsMiddleware)
+# Routes (only for enabled subsystems)
+if settings.ENABLE_MEANING:
+    from backend.api.routes.api_meaning import router as meaning_router
+    app.include_router(meaning_router)
+if settings.ENABLE_PHONETICS:
+    from backend.api.routes.api_phonetic import router as phonetic_router
+    app.include_router(phonetic_router)
+if settings.ENABLE_AUDIO:
+    from backend.api.routes.api_audio import router as audio_router
+    app.include_router(audio_router)
+if settings.ENABLE_PRONUNCIATION:
+    from backend.api.routes.api_pronunciation import router as pronunciation_router
+    app.include_router(pronunciation_router)
+if settings.ENABLE_MEANING or settings.ENABLE_PHONETICS or settings.ENABLE_AUDIO:
+    from backend.api.routes.api_lookup import router as lookup_router
+    app.include_router(lookup_router)
+if settings.ENABLE_PHONETICS or settings.ENABLE_AUDIO:
+    from backend.api.routes.api_transcript import router as transcript_router
+    app.include_router(transcript_router)
+app.include_router(health_router)
+app.include_router(metrics_router)
 
 
 
@@ -60,10 +104,14 @@ async def root():
         "message": "TTS Learning Extension API",
         "version": settings.APP_VERSION,
         "endpoints": {
-            "meaning": "/api/meaning",
-            "phonetics": "/api/phonetics",
-            "audio": "/api/audio/generate",
-            "pronunciation": "/api/pronunciation",
+            "meaning": "/api/meaning" if settings.ENABLE_MEANING else None,
+            "phonetics": "/api/phonetics" if settings.ENABLE_PHONETICS else None,
+            "audio": "/api/audio/generate" if settings.ENABLE_AUDIO else None,
+            "pronunciation": "/api/pronunciation" if settings.ENABLE_PRONUNCIATION else None,
+            "lookup": "/api/lookup",
+            "transcripts": "/api/transcripts",
+            "ready": "/ready",
+            "metrics": "/metrics",
             "docs": "/docs" if settings.DEBUG else None
         }
     
@@ -0,0 +1,516 @@
+# backend/services/acoustic_service.py
+"""
+Acoustic comparison of a learner recording against a TTS reference
+
+    reference text -> TTS waveform -> MFCC   (cached per text)
+    learner audio  -> MFCC
+    band-constrained DTW between the two
+    -> per-phoneme deviation along the warping path
+
+The reference has no phoneme timings, so its frames are split across
+the phonemes proportionally to typical durations (vowels longer than
+consonants). Good enough to point at the part of an utterance that was
+off; not a forced aligner.
+"""
+
+import asyncio
+import hashlib
+import logging
+from typing import BinaryIO, Dict, List, Tuple, Union
+
+import numpy as np
+
+from backend.core.cache import LRUCache
+from backend.core.config import get_settings
+from backend.core.exceptions import EmptyRecordingError
+from backend.services.phoneme_inventory import VOWELS
+
+logger = logging.getLogger(__name__)
+
+# Spoken symbol for a phoneme whose acoustics deviate too much from the reference
+DEVIATING = "?"
+
+# Recordings whose peak stays under this are treated as silent
+SILENCE_PEAK = 1e-3
+
+# Relative duration weights used to place phonemes on the reference frames
+_VOWEL_WEIGHT = 1.6
+_CONSONANT_WEIGHT = 1.0
+_UNKNOWN_WEIGHT = 3.0
+
+
+# ============================================================================
+# FEATURES
+# ============================================================================
+
+def mfcc_features(
+    waveform: np.ndarray,
+    sample_rate: int,
+    target_rate: int = 16000,
+    n_mfcc: int = 13,
+    hop_ms: float = 10.0
+) -> np.ndarray:
+    """
+    (frames, n_mfcc) MFCCs of a mono waveform, leading/trailing silence
+    trimmed, cepstral mean/variance normalized (speaker and loudness
+    differences matter less than the shape of the sounds)
+    """
+    import librosa
+
+    waveform = np.asarray(waveform, dtype=np.float32)
+    if sample_rate != target_rate:
+        waveform = librosa.resample(waveform, orig_sr=sample_rate, target_sr=target_rate)
+    if len(waveform):
+        waveform, _ = librosa.effects.trim(waveform, top_db=35)
+
+    hop = max(int(target_rate * hop_ms / 1000), 1)
+    if len(waveform) < hop:
+        return np.zeros((0, n_mfcc), dtype=np.float32)
+
+    # c0 is frame energy: dropped, loudness is not pronunciation
+    mfcc = librosa.feature.mfcc(
+        y=waveform, sr=target_rate, n_mfcc=n_mfcc + 1, hop_length=hop, n_fft=4 * hop
+    )[1:].T
+    mfcc = (mfcc - mfcc.mean(axis=0)) / (mfcc.std(axis=0) + 1e-6)
+    return mfcc.astype(np.float32)
+
+
+def load_audio(source: Union[str, BinaryIO], target_rate: int = 16000) -> np.ndarray:
+    """
+    Mono float32 waveform at `target_rate` from a path or an open file
+    (e.g. an upload's spooled buffer, decoded without touching disk)
+    """
+    import soundfile as sf
+
+    if hasattr(source, "seek"):
+        source.seek(0)
+    waveform, sample_rate = sf.read(source, dtype="float32", always_2d=True)
+    waveform = waveform.mean(axis=1)
+    if sample_rate != target_rate:
+        import librosa
+
+        waveform = librosa.resample(waveform, orig_sr=sample_rate, target_sr=target_rate)
+    return waveform.astype(np.float32, copy=False)
+
+
+# ============================================================================
+# DTW
+# ============================================================================
+
+def band_dtw(
+    reference: np.ndarray,
+    query: np.ndarray,
+    band_ratio: float = 0.2
+) -> Tuple[float, np.ndarray, np.ndarray]:
+    """
+    Dynamic time warping between two feature sequences, restricted to a
+    Sakoe-Chiba band around the (length-scaled) diagonal
+
+    Cells on one anti-diagonal only depend on the two previous
+    anti-diagonals, so each anti-diagonal is computed in one numpy step.
+
+    Returns:
+        (total cost, path as (k, 2) array of (reference, query) frame
+        indices, local Euclidean cost of each path step)
+    """
+    n, m = len(reference), len(query)
+    if n == 0 or m == 0:
+        return float("inf"), np.zeros((0, 2), dtype=np.intp), np.zeros(0, dtype=np.float32)
+
+    slope = (m - 1) / (n - 1) if n > 1 else 0.0
+    # Wide enough to always connect (0, 0) to (n - 1, m - 1)
+    width = max(int(np.ceil(band_ratio * max(n, m))), int(np.ceil(slope)) + 1, 1)
+
+    # Accumulated cost with a border of inf: acc[i + 1, j + 1] is cell (i, j)
+    acc = np.full((n + 1, m + 1), np.inf, dtype=np.float64)
+    acc[0, 0] = 0.0
+
+    for k in range(n + m - 1):
+        i = np.arange(max(0, k - m + 1), min(n - 1, k) + 1)
+        j = k - i
+        inside = np.abs(j - i * slope) <= width
+        i, j = i[inside], j[inside]
+        if not len(i):
+            continue
+
+        cost = np.sqrt(((reference[i] - query[j]) ** 2).sum(axis=1))
+        best = np.minimum(np.minimum(acc[i, j], acc[i, j + 1]), acc[i + 1, j])
+        acc[i + 1, j + 1] = cost + best
+
+    # Traceback: diagonal first on ties
+    path = []
+    i, j = n, m
+    while i > 0 and j > 0:
+        path.append((i - 1, j - 1))
+        diag, up, left = acc[i - 1, j - 1], acc[i - 1, j], acc[i, j - 1]
+        if diag <= up and diag <= left:
+            i, j = i - 1, j - 1
+        elif up <= left:
+            i -= 1
+        else:
+            j -= 1
+    path.reverse()
+
+    path = np.array(path, dtype=np.intp)
+    path_cost = np.sqrt(((reference[path[:, 0]] - query[path[:, 1]]) ** 2).sum(axis=1))
+    return float(acc[n, m]), path, path_cost
+
+
+# ============================================================================
+# PER-PHONEME DEVIATIONS
+# ============================================================================
+
+def phoneme_frames(phonemes: List[str], n_frames: int) -> np.ndarray:
+    """Phoneme index of every reference frame (duration-weighted split)"""
+    if not phonemes:
+        return np.zeros(n_frames, dtype=np.intp)
+
+    weights = np.array([
+        _UNKNOWN_WEIGHT if p == "UNK" else _VOWEL_WEIGHT if p in VOWELS else _CONSONANT_WEIGHT
+        for p in phonemes
+    ])
+    # Start frame of each phoneme; every frame belongs to the last one started
+    starts = np.floor(np.cumsum(weights) / weights.sum() * n_frames)[:-1]
+    return np.searchsorted(starts, np.arange(n_frames), side="right")
+
+
+def phoneme_deviations(
+    reference_phonemes: List[str],
+    reference_frames: int,
+    path: np.ndarray,
+    path_cost: np.ndarray,
+    deviation_scale: float = 4.0
+) -> List[Dict]:
+    """
+    Per reference phoneme: mean acoustic distance along the warping path,
+    a 0-100 score, and how long the learner spent on it relative to the
+    reference (duration_ratio)
+    """
+    count = len(reference_phonemes)
+    if not count:
+        return []
+
+    owner = phoneme_frames(reference_phonemes, reference_frames)
+    segment = owner[path[:, 0]]
+
+    steps = np.bincount(segment, minlength=count)
+    total = np.bincount(segment, weights=path_cost, minlength=count)
+    deviation = np.divide(total, steps, out=np.full(count, np.inf), where=steps > 0)
+
+    ref_frames = np.bincount(owner, minlength=count)
+    # Distinct learner frames matched to each phoneme
+    width = int(path[:, 1].max()) + 1
+    pairs = np.unique(segment * width + path[:, 1])
+    learner_frames = np.bincount(pairs // width, minlength=count)
+
+    scores = 100.0 * np.exp(-deviation / deviation_scale)
+    return [
+        {
+            "position": i,
+            "phoneme": phoneme,
+            "deviation": round(float(deviation[i]), 3) if steps[i] else None,
+            "score": round(float(scores[i]), 1),
+            "duration_ratio": round(float(learner_frames[i] / ref_frames[i]), 2) if ref_frames[i] else None,
+        }
+        for i, phoneme in enumerate(reference_phonemes)
+    ]
+
+
+def spoken_from_deviations(
+    reference_phonemes: List[str],
+    deviations: List[Dict],
+    min_score: float = 40.0
+) -> List[str]:
+    """
+    Phoneme sequence to align against the reference: phonemes that sound
+    like the reference stay, the ones below `min_score` become DEVIATING
+    """
+    return [
+        phoneme if d["score"] >= min_score else DEVIATING
+        for phoneme, d in zip(reference_phonemes, deviations)
+    ]
+
+
+def compare_recording(
+    waveform: np.ndarray,
+    reference_features: np.ndarray,
+    reference_phonemes: List[str],
+    sample_rate: int = 16000,
+    n_mfcc: int = 13,
+    hop_ms: float = 10.0,
+    band_ratio: float = 0.2,
+    deviation_scale: float = 4.0,
+    min_phoneme_score: float = 40.0
+) -> Tuple[List[str], List[Dict]]:
+    """
+    Learner recording (mono, at `sample_rate`) vs. precomputed reference
+    features (blocking). Returns (spoken phonemes, per-phoneme deviations)
+    """
+    if not len(waveform) or np.abs(waveform).max() < SILENCE_PEAK:
+        raise EmptyRecordingError("Recording is empty or silent")
+    features = mfcc_features(waveform, sample_rate, sample_rate, n_mfcc, hop_ms)
+    if not len(features) or not len(reference_features):
+        raise EmptyRecordingError("Recording is empty or silent")
+
+    _, path, path_cost = band_dtw(reference_features, features, band_ratio)
+    deviations = phoneme_deviations(
+        reference_phonemes, len(reference_features), path, path_cost, deviation_scale
+    )
+    spoken = spoken_from_deviations(reference_phonemes, deviations, min_phoneme_score)
+    return spoken, deviations
+
+
+# ============================================================================
+# ONLINE (STREAMING) COMPARISON
+# ============================================================================
+
+# Learner frames quieter than this (RMS) are silence
+SPEECH_RMS = 5e-3
+
+
+class OnlineDTW:
+    """
+    Incremental version of compare_recording for audio arriving in chunks
+
+    MFCCs are computed over a rolling buffer (only the samples of frames
+    not yet complete are kept) and normalized with running statistics.
+    Each learner frame adds one DTW column over the reference frames,
+    restricted to a window around the current position; the position is
+    the best length-normalized cell of that column and never moves back,
+    so the warping path is known frame by frame.
+
+    Running statistics are only an estimate early on, so phoneme scores
+    re-cost the path with the latest ones. Partial results only: the
+    final score of a recording comes from compare_recording.
+    """
+
+    def __init__(
+        self,
+        reference_features: np.ndarray,
+        reference_phonemes: List[str],
+        sample_rate: int = 16000,
+        n_mfcc: int = 13,
+        hop_ms: float = 10.0,
+        deviation_scale: float = 4.0,
+        window_frames: int = 300,
+        warmup_frames: int = 50
+    ):
+        self.reference = np.asarray(reference_features, dtype=np.float32)
+        self.reference_phonemes = reference_phonemes
+        self.owner = phoneme_frames(reference_phonemes, len(self.reference))
+        self.sample_rate = sample_rate
+        self.n_mfcc = n_mfcc
+        self.hop = max(int(sample_rate * hop_ms / 1000), 1)
+        self.n_fft = 4 * self.hop
+        self.deviation_scale = deviation_scale
+        # Column window: a quarter behind the position, the rest ahead
+        self.window_frames = max(window_frames, 4)
+        self.warmup_frames = warmup_frames
+
+        self._pending = np.zeros(0, dtype=np.float32)
+        # Running mean / sum of squared deviations (CMVN) and frames held
+        # back until the statistics are meaningful
+        self._count = 0
+        self._mean = np.zeros(n_mfcc, dtype=np.float64)
+        self._m2 = np.zeros(n_mfcc, dtype=np.float64)
+        self._held: List[np.ndarray] = []
+        # Every aligned feature batch, before normalization
+        self._raw: List[np.ndarray] = []
+        # Quiet frames after speech: a pause if speech resumes, trailing
+        # silence (dropped, like the offline trim) otherwise
+        self._quiet = np.zeros((0, n_mfcc), dtype=np.float32)
+        self._speaking = False
+
+        self._column: np.ndarray = None
+        self.position = 0
+        # Reference frame matched by each aligned learner frame
+        self.path: List[int] = []
+
+    @property
+    def frames(self) -> int:
+        """Learner frames aligned so far"""
+        return len(self.path)
+
+    def _features(self, samples: np.ndarray) -> np.ndarray:
+        """
+        MFCCs of the frames completed by `samples` (not normalized), minus
+        leading silence; quiet frames are only released once speech resumes
+        """
+        import librosa
+
+        buffer = np.concatenate([self._pending, samples])
+        if len(buffer) < self.n_fft:
+            self._pending = buffer
+            return np.zeros((0, self.n_mfcc), dtype=np.float32)
+
+        count = 1 + (len(buffer) - self.n_fft) // self.hop
+        used = buffer[:(count - 1) * self.hop + self.n_fft]
+        self._pending = buffer[count * self.hop:]
+
+        frames = np.lib.stride_tricks.sliding_window_view(used, self.n_fft)[::self.hop]
+        voiced = np.flatnonzero(np.sqrt((frames ** 2).mean(axis=1)) >= SPEECH_RMS)
+        if not self._speaking and not len(voiced):
+            return np.zeros((0, self.n_mfcc), dtype=np.float32)
+        mfcc = librosa.feature.mfcc(
+            y=used, sr=self.sample_rate, n_mfcc=self.n_mfcc + 1,
+            hop_length=self.hop, n_fft=self.n_fft, center=False
+        )[1:].T.astype(np.float32)
+        if not self._speaking:
+            mfcc = mfcc[voiced[0]:]
+            voiced = voiced - voiced[0]
+            self._speaking = True
+
+        # Everything up to the last voiced frame is speech (pauses included)
+        end = voiced[-1] + 1 if len(voiced) else 0
+        if end:
+            released = np.concatenate([self._quiet, mfcc[:end]])
+            self._quiet = mfcc[end:]
+        else:
+            released = np.zeros((0, self.n_mfcc), dtype=np.float32)
+            self._quiet = np.concatenate([self._quiet, mfcc])
+        return released
+
+    def _normalize(self, features: np.ndarray) -> np.ndarray:
+        """Fold a batch into the running statistics (Chan et al.), then normalize"""
+        n = len(features)
+        batch_mean = features.mean(axis=0)
+        delta = batch_mean - self._mean
+        total = self._count + n
+        self._mean += delta * n / total
+        self._m2 += ((features - batch_mean) ** 2).sum(axis=0) + delta ** 2 * self._count * n / total
+        self._count = total
+        std = np.sqrt(self._m2 / total)
+        return ((features - self._mean) / (std + 1e-6)).astype(np.float32)
+
+    def _step(self, query: np.ndarray):
+        """One DTW column for learner frame `query`"""
+        n = len(self.reference)
+        j = self.frames
+        if self._column is None:
+            lo, hi = 0, min(n, self.window_frames)
+        else:
+            lo = max(0, self.position - self.window_frames // 4)
+            hi = min(n, lo + self.window_frames)
+
+        cost = np.sqrt(((self.reference[lo:hi] - query) ** 2).sum(axis=1))
+        total = np.cumsum(cost)
+        column = np.full(n, np.inf)
+        if self._column is None:
+            # First column: only vertical moves from (0, 0)
+            column[lo:hi] = total
+        else:
+            # col[i] = cost[i] + min(prev[i - 1], prev[i], col[i - 1]):
+            # unrolling the vertical chain gives a running minimum
+            prev = self._column
+            entry = prev[lo:hi].copy()
+            shifted = prev[lo - 1:hi - 1] if lo > 0 else np.concatenate([[np.inf], prev[:hi - 1]])
+            entry = np.minimum(entry, shifted)
+            column[lo:hi] = total + np.minimum.accumulate(entry + cost - total)
+        self._column = column
+
+        rows = np.arange(lo, hi)
+        best = lo + int(np.argmin(column[lo:hi] / (rows + j + 2)))
+        self.position = max(self.position, best)
+        self.path.append(self.position)
+
+    def feed(self, samples: np.ndarray) -> int:
+        """Align the frames completed by `samples`; returns how many were aligned"""
+        features = self._features(np.asarray(samples, dtype=np.float32))
+        if not len(features):
+            return 0
+        self._raw.append(features)
+        normalized = self._normalize(features)
+        before = self.frames
+        if self._count < self.warmup_frames:
+            self._held.append(features)
+            return 0
+        if self._held:
+            # Statistics are settled: align the held-back frames with them
+            normalized = self._normalize_held(normalized)
+        for query in normalized:
+            self._step(query)
+        return self.frames - before
+
+    def _normalize_held(self, normalized: np.ndarray) -> np.ndarray:
+        std = np.sqrt(self._m2 / self._count)
+        held = ((np.concatenate(self._held) - self._mean) / (std + 1e-6)).astype(np.float32)
+        self._held = []
+        return np.concatenate([held, normalized])
+
+    def phoneme_scores(self) -> np.ndarray:
+        """Running 0-100 score per reference phoneme (NaN before it is reached)"""
+        count = len(self.reference_phonemes)
+        if not self.frames:
+            return np.full(count, np.nan)
+        std = np.sqrt(self._m2 / self._count)
+        self._raw = [np.concatenate(self._raw)]
+        features = (self._raw[0][:self.frames] - self._mean) / (std + 1e-6)
+        matched = np.array(self.path, dtype=np.intp)
+        cost = np.sqrt(((self.reference[matched] - features) ** 2).sum(axis=1))
+
+        segment = self.owner[matched]
+        steps = np.bincount(segment, minlength=count)
+        total = np.bincount(segment, weights=cost, minlength=count)
+        deviation = np.divide(total, steps, out=np.full(count, np.nan), where=steps > 0)
+        return 100.0 * np.exp(-deviation / self.deviation_scale)
+
+    @property
+    def current_phoneme(self) -> int:
+        return int(self.owner[self.position]) if self.frames else -1
+
+
+# ============================================================================
+# SERVICE
+# ============================================================================
+
+class AcousticService:
+    """Reference features from TTS (cached) + comparison settings"""
+
+    def __init__(self, tts_service):
+        self.settings = get_settings()
+        self.tts_service = tts_service
+        self.voice_preset = self.settings.ACOUSTIC_REFERENCE_VOICE
+
+        # MFCC matrices of TTS references, by text
+        self.reference_cache = LRUCache(
+            max_items=self.settings.ACOUSTIC_REFERENCE_CACHE_ITEMS,
+            sizeof=lambda features: features.nbytes
+        )
+        self.params = {
+            "sample_rate": self.settings.ACOUSTIC_SAMPLE_RATE,
+            "n_mfcc": self.settings.ACOUSTIC_N_MFCC,
+            "hop_ms": self.settings.ACOUSTIC_HOP_MS,
+            "band_ratio": self.settings.ACOUSTIC_BAND_RATIO,
+            "deviation_scale": self.settings.ACOUSTIC_DEVIATION_SCALE,
+            "min_phoneme_score": self.settings.ACOUSTIC_MIN_PHONEME_SCORE,
+        }
+
+    def _reference_key(self, text: str) -> str:
+        return hashlib.md5(f"{text.strip()}_{self.voice_preset}".encode()).hexdigest()
+
+    async def reference_features(self, text: str) -> np.ndarray:
+        """MFCCs of the TTS rendering of `text`, synthesized only once"""
+        key = self._reference_key(text)
+        features = self.reference_cache.get(key)
+        if features is not None:
+            return features
+
+        logger.info(f"🎯 Building acoustic reference: {text[:40]}")
+        waveform, sample_rate = await self.tts_service.get_waveform(text, self.voice_preset)
+        features = await asyncio.to_thread(
+            mfcc_features,
+            waveform,
+            sample_rate,
+            self.params["sample_rate"],
+            self.params["n_mfcc"],
+            self.params["hop_ms"]
+        )
+        self.reference_cache.set(key, features)
+        return features
+
+    def get_stats(self) -> Dict:
+        return {
+            "reference_cache": self.reference_cache.stats(),
+            "voice_preset": self.voice_preset,
+            **self.params
+        }
@@ -0,0 +1,196 @@
+# backend/services/audio_file_service.py
+
+import asyncio
+import logging
+import re
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from backend.core.cache import LRUCache
+from backend.core.config import get_settings
+from backend.core.exceptions import AppException, NotFoundError, ValidationError
+
+logger = logging.getLogger(__name__)
+
+# Only plain file names inside the audio directory, e.g. audio_<md5>.wav
+SAFE_FILENAME = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]{0,127}\.wav$")
+
+
+class RangeNotSatisfiableError(AppException):
+    """Requested byte range is outside the file"""
+    def __init__(self, size: int):
+        super().__init__(
+            message="Requested range not satisfiable",
+            status_code=416,
+            error_type="range_not_satisfiable",
+            details={"size": size}
+        )
+
+
+class AudioFileService:
+    """
+    Serves generated audio files with HTTP caching in mind
+    Files are content-addressed, so they never change once written
+    """
+
+    def __init__(self):
+        self.settings = get_settings()
+        self.audio_dir = Path(self.settings.AUDIO_DIR)
+        self.audio_dir.mkdir(exist_ok=True)
+        self._root = self.audio_dir.resolve()
+
+        # Hot clips kept in memory, promoted after a few plays
+        self.hot_cache = LRUCache(
+            max_items=self.settings.AUDIO_HOT_CACHE_ITEMS,
+            max_bytes=self.settings.AUDIO_HOT_CACHE_MAX_BYTES,
+            sizeof=len
+        )
+        self.play_counts = LRUCache(max_items=4096)
+
+        self.not_modified = 0
+        self.partial_responses = 0
+
+    def resolve(self, filename: str) -> Path:
+        """Map a client supplied filename to a path inside the audio dir"""
+        if not SAFE_FILENAME.match(filename) or ".." in filename:
+            raise ValidationError(f"Invalid audio filename: {filename!r}")
+
+        filepath = (self._root / filename).resolve()
+        if filepath.parent != self._root:
+            raise ValidationError(f"Invalid audio filename: {filename!r}")
+
+        return filepath
+
+    def get_existing(self, filename: str) -> Path:
+        """Resolve filename and make sure the file exists"""
+        filepath = self.resolve(filename)
+        if not filepath.is_file():
+            raise NotFoundError("Audio file not found")
+        return filepath
+
+    @staticmethod
+    def etag_for(filename: str) -> str:
+        """
+        Strong ETag derived from the content key
+        audio_<md5>.wav -> "<md5>", variants keep their suffix
+        """
+        stem = Path(filename).stem
+        key = stem[len("audio_"):] if stem.startswith("audio_") else stem
+        return f'"{key}"'
+
+    def cache_headers(self, filename: str) -> Dict[str, str]:
+        """Headers shared by 200, 206 and 304 responses"""
+        return {
+            "ETag": self.etag_for(filename),
+            "Cache-Control": f"public, max-age={self.settings.AUDIO_CACHE_MAX_AGE}, immutable",
+            "Accept-Ranges": "bytes",
+            "Access-Control-Allow-Origin": "*",
+            "Access-Control-Expose-Headers": "ETag, Content-Range, Accept-Ranges",
+        }
+
+    @staticmethod
+    def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+        """Check an If-None-Match header against our ETag"""
+        if not if_none_match:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        candidates = [tag.strip() for tag in if_none_match.split(",")]
+        # Weak comparison is fine for If-None-Match
+        return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+    @staticmethod
+    def parse_range(range_header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+        """
+        Parse a single "bytes=start-end" range
+
+        Returns:
+            (start, end) inclusive, or None to serve the whole file
+        """
+        if not range_header:
+            return None
+
+        unit, _, spec = range_header.partition("=")
+        if unit.strip().lower() != "bytes" or "," in spec:
+            # Unknown unit or multiple ranges: serve the full body
+            return None
+
+        start_str, sep, end_str = spec.strip().partition("-")
+        if not sep:
+            return None
+
+        try:
+            if start_str == "":
+                # Suffix range: last N bytes
+                length = int(end_str)
+                if length <= 0:
+                    raise RangeNotSatisfiableError(size)
+                start = max(size - length, 0)
+                end = size - 1
+            else:
+                start = int(start_str)
+                end = int(end_str) if end_str else size - 1
+        except ValueError:
+            return None
+
+        if start >= size or start > end:
+            raise RangeNotSatisfiableError(size)
+
+        return start, min(end, size - 1)
+
+    @staticmethod
+    def _read_slice(filepath: Path, start: int, length: int) -> bytes:
+        with filepath.open("rb") as f:
+            f.seek(start)
+            return f.read(length)
+
+    async def read(self, filepath: Path) -> bytes:
+        """
+        Read a whole file, using the hot cache for popular clips
+        Only the disk read runs in a thread: the caches stay on the event loop
+        """
+        name = filepath.name
+        data = self.hot_cache.get(name)
+        if data is not None:
+            return data
+
+        data = await asyncio.to_thread(filepath.read_bytes)
+
+        plays = self.play_counts.get(name, 0) + 1
+        self.play_counts.set(name, plays)
+        if plays >= self.settings.AUDIO_HOT_CACHE_MIN_PLAYS:
+            self.hot_cache.set(name, data)
+            logger.debug(f"🔥 Promoted {name} to hot cache")
+
+        return data
+
+    async def read_range(self, filepath: Path, start: int, end: int) -> bytes:
+        """Read bytes [start, end] without loading cold files entirely"""
+        data = self.hot_cache.get(filepath.name)
+        if data is not None:
+            return data[start:end + 1]
+
+        # Players open with "bytes=0-": count that as a play
+        if start == 0:
+            return (await self.read(filepath))[:end + 1]
+
+        return await asyncio.to_thread(self._read_slice, filepath, start, end - start + 1)
+
+    def delete(self, filename: str) -> bool:
+        """Delete a file and drop it from memory"""
+        filepath = self.resolve(filename)
+        self.hot_cache.pop(filepath.name)
+        self.play_counts.pop(filepath.name)
+
+        if filepath.exists():
+            filepath.unlink()
+            return True
+        return False
+
+    def get_cache_stats(self) -> Dict:
+        """Get file serving statistics"""
+        return {
+            "hot_cache": self.hot_cache.stats(),
+            "not_modified": self.not_modified,
+            "partial_responses": self.partial_responses
+        }
@@ -0,0 +1,133 @@
+# backend/services/audio_utils.py
+"""Small numpy helpers shared by the audio services"""
+
+import re
+from typing import List, Sequence
+
+import numpy as np
+
+# Playback speeds accepted for derived (time-stretched) audio
+MIN_SPEED = 0.25
+MAX_SPEED = 2.0
+
+# Whitespace after ., ! or ? (optionally followed by a closing quote/bracket)
+_SENTENCE_END = re.compile(r'(?<=[.!?])\s+|(?<=[.!?]["\')\]])\s+')
+
+
+def split_sentences(text: str) -> List[str]:
+    """
+    Split text into sentences, normalizing whitespace
+    "Hello. How are you?" -> ["Hello.", "How are you?"]
+    """
+    text = " ".join(text.split())
+    if not text:
+        return []
+    return [s.strip() for s in _SENTENCE_END.split(text) if s.strip()]
+
+
+def crossfade_concat(
+    waveforms: Sequence[np.ndarray],
+    sample_rate: int,
+    crossfade_ms: float = 15.0
+) -> np.ndarray:
+    """
+    Concatenate waveforms with a short linear crossfade between each pair
+    Avoids clicks where independently synthesized segments meet
+    """
+    waveforms = [np.asarray(w, dtype=np.float32) for w in waveforms if len(w)]
+    if not waveforms:
+        return np.zeros(0, dtype=np.float32)
+    if len(waveforms) == 1:
+        return waveforms[0]
+
+    fade = int(sample_rate * crossfade_ms / 1000)
+    # Overlap can't exceed half of the shortest segment
+    fade = min(fade, min(len(w) for w in waveforms) // 2)
+
+    total = sum(len(w) for w in waveforms) - fade * (len(waveforms) - 1)
+    out = np.zeros(total, dtype=np.float32)
+
+    fade_in = np.linspace(0.0, 1.0, fade, dtype=np.float32) if fade else None
+    pos = 0
+    for w in waveforms:
+        if pos and fade:
+            # Previous segment fades out while this one fades in
+            out[pos:pos + fade] *= fade_in[::-1]
+            out[pos:pos + fade] += w[:fade] * fade_in
+            out[pos + fade:pos + len(w)] = w[fade:]
+        else:
+            out[pos:pos + len(w)] = w
+        pos += len(w) - fade
+
+    return out
+
+
+def spectral_similarity(a: np.ndarray, b: np.ndarray, n_fft: int = 512) -> float:
+    """
+    Cosine similarity of log-magnitude spectrograms, in [0, 1]
+    Robust to tiny sample-level differences (threads, int8, ONNX), unlike
+    raw waveform comparison. Lengths are matched by trimming to the shorter.
+    """
+    a = np.asarray(a, dtype=np.float32)
+    b = np.asarray(b, dtype=np.float32)
+    length = min(len(a), len(b))
+    if length < n_fft:
+        return 0.0
+
+    def log_spec(x: np.ndarray) -> np.ndarray:
+        hop = n_fft // 4
+        frames = np.lib.stride_tricks.sliding_window_view(x[:length], n_fft)[::hop]
+        spec = np.abs(np.fft.rfft(frames * np.hanning(n_fft), axis=1))
+        return np.log1p(spec).ravel()
+
+    sa, sb = log_spec(a), log_spec(b)
+    denom = np.linalg.norm(sa) * np.linalg.norm(sb)
+    return float(sa @ sb / denom) if denom else 0.0
+
+
+def chunk_text(text: str, max_chars: int = 200) -> List[str]:
+    """
+    Split text into synthesis-sized chunks at sentence boundaries
+    Sentences longer than max_chars are split at clause punctuation, then
+    at word boundaries, so no chunk exceeds max_chars (unless one word does).
+    """
+    chunks = []
+    for sentence in split_sentences(text):
+        if len(sentence) <= max_chars:
+            chunks.append(sentence)
+            continue
+
+        current = ""
+        for clause in re.split(r'(?<=[,;:])\s+', sentence):
+            for word in clause.split(" ") if len(clause) > max_chars else [clause]:
+                candidate = f"{current} {word}" if current else word
+                if len(candidate) <= max_chars:
+                    current = candidate
+                else:
+                    if current:
+                        chunks.append(current)
+                    current = word
+        if current:
+            chunks.append(current)
+
+    return chunks
+
+
+def time_stretch(waveform: np.ndarray, speed: float) -> np.ndarray:
+    """
+    Change tempo without changing pitch (phase vocoder)
+    speed < 1 slows down: 0.5 gives audio twice as long
+    """
+    waveform = np.asarray(waveform, dtype=np.float32)
+    if speed == 1.0 or not len(waveform):
+        return waveform
+
+    import librosa
+
+    stretched = librosa.effects.time_stretch(waveform, rate=speed)
+    # Keep the original peak level, the vocoder can overshoot slightly
+    peak = np.abs(stretched).max(initial=0.0)
+    limit = np.abs(waveform).max(initial=0.0)
+    if peak > limit > 0:
+        stretched *= limit / peak
+    return stretched.astype(np.float32, copy=False)
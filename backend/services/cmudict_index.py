@@ -0,0 +1,256 @@
+# backend/services/cmudict_index.py
+"""
+Compact, memory-mapped CMUDict
+
+`cmudict.dict()` is ~126k words as Python lists of lists of strings:
+seconds to load and a large private heap in every process. This module
+builds a flat binary index once and then maps it read-only, so loading is
+instant and the pages are shared by every process on the machine.
+
+Each phoneme is one byte: the low 6 bits are the stress-stripped code from
+phoneme_inventory, the top 2 bits the stress (0 = none, 1-3 = stress 0-2).
+All pronunciation variants are kept, in CMUDict order.
+
+    python -m backend.services.cmudict_index --out models/cmudict.idx
+"""
+
+import argparse
+import json
+import logging
+import mmap
+import os
+import time
+import zlib
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from backend.services.phoneme_inventory import PHONEMES, PHONEME_IDS, UNK_ID
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"CMUIDX01"
+FORMAT_VERSION = 1
+
+CODE_MASK = 0x3F
+STRESS_SHIFT = 6
+_EMPTY = np.uint32(0xFFFFFFFF)
+
+# Packed byte -> symbol, with and without the stress digit
+_STRIPPED = [PHONEMES[b & CODE_MASK] if (b & CODE_MASK) < len(PHONEMES) else "UNK" for b in range(256)]
+_STRESSED = [
+    s + (str((b >> STRESS_SHIFT) - 1) if b >> STRESS_SHIFT else "")
+    for b, s in enumerate(_STRIPPED)
+]
+
+
+def pack_phoneme(symbol: str) -> int:
+    """'AH0' -> code | (stress + 1) << 6; consonants have no stress bits"""
+    stress = 0
+    if symbol[-1].isdigit():
+        stress = int(symbol[-1]) + 1
+        symbol = symbol[:-1]
+    return PHONEME_IDS.get(symbol, UNK_ID) | (stress << STRESS_SHIFT)
+
+
+def _hash(word: bytes) -> int:
+    return zlib.crc32(word)
+
+
+# ============================================================================
+# BUILD
+# ============================================================================
+
+def build_index(entries: Iterable[Tuple[str, List[str]]], path) -> Path:
+    """
+    Write the index for (word, phonemes) entries; a word appearing several
+    times gets several variants. Written atomically (tmp file + rename),
+    so concurrent workers never map a half-written file.
+    """
+    variants: Dict[bytes, List[List[int]]] = {}
+    for word, phonemes in entries:
+        key = word.lower().encode("utf-8")
+        variants.setdefault(key, []).append([pack_phoneme(p) for p in phonemes])
+
+    words = sorted(variants)
+    n = len(words)
+
+    word_offsets = np.zeros(n + 1, dtype=np.uint32)
+    variant_start = np.zeros(n + 1, dtype=np.uint32)
+    word_offsets[1:] = np.cumsum([len(w) for w in words])
+    variant_start[1:] = np.cumsum([len(variants[w]) for w in words])
+
+    prons = [pron for w in words for pron in variants[w]]
+    pron_offsets = np.zeros(len(prons) + 1, dtype=np.uint32)
+    pron_offsets[1:] = np.cumsum([len(p) for p in prons])
+    phones = np.fromiter((b for p in prons for b in p), dtype=np.uint8, count=int(pron_offsets[-1]))
+    word_blob = np.frombuffer(b"".join(words), dtype=np.uint8)
+
+    # Open addressing, linear probing, load factor <= 0.5
+    size = 1 << max(int(2 * n - 1).bit_length(), 1)
+    table = np.full(size, _EMPTY, dtype=np.uint32)
+    mask = size - 1
+    for i, word in enumerate(words):
+        slot = _hash(word) & mask
+        while table[slot] != _EMPTY:
+            slot = (slot + 1) & mask
+        table[slot] = i
+
+    arrays = {
+        "table": table,
+        "word_offsets": word_offsets,
+        "word_blob": word_blob,
+        "variant_start": variant_start,
+        "pron_offsets": pron_offsets,
+        "phones": phones,
+    }
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    layout, offset = {}, 0
+    for name, array in arrays.items():
+        layout[name] = [offset, array.dtype.str, len(array)]
+        offset += -(-array.nbytes // 8) * 8
+
+    header = json.dumps({
+        "format": FORMAT_VERSION,
+        "words": n,
+        "pronunciations": len(prons),
+        "arrays": layout,
+    }).encode()
+    header += b" " * (-(len(MAGIC) + 4 + len(header)) % 8)
+
+    tmp = path.with_suffix(path.suffix + f".tmp{os.getpid()}")
+    with tmp.open("wb") as f:
+        f.write(MAGIC)
+        f.write(np.uint32(len(header)).tobytes())
+        f.write(header)
+        for array in arrays.values():
+            data = array.tobytes()
+            f.write(data)
+            f.write(b"\0" * (-len(data) % 8))
+    os.replace(tmp, path)
+    return path
+
+
+def build_from_cmudict(path) -> Path:
+    """Build the index from the `cmudict` package"""
+    import cmudict
+
+    return build_index(cmudict.entries(), path)
+
+
+# ============================================================================
+# LOOKUP
+# ============================================================================
+
+class CMUDictIndex:
+    """Read-only view of an index file (mmap, nothing copied to the heap)"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with self.path.open("rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._mm[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{self.path} is not a CMUDict index")
+        header_len = int(np.frombuffer(self._mm, dtype=np.uint32, count=1, offset=len(MAGIC))[0])
+        base = len(MAGIC) + 4
+        self.meta = json.loads(self._mm[base:base + header_len])
+        if self.meta.get("format") != FORMAT_VERSION:
+            raise ValueError(f"{self.path} has index format {self.meta.get('format')}")
+
+        # Zero-copy views; memoryview indexing yields Python ints, which is
+        # much cheaper per lookup than numpy scalars
+        data = base + header_len
+        view = self._view = memoryview(self._mm)
+        arrays = {}
+        for name, (offset, dtype, count) in self.meta["arrays"].items():
+            start = data + offset
+            size = np.dtype(dtype).itemsize
+            arrays[name] = view[start:start + count * size].cast("B" if size == 1 else "I")
+        self._table = arrays["table"]
+        self._mask = len(self._table) - 1
+        self._word_offsets = arrays["word_offsets"]
+        self._word_blob = arrays["word_blob"]
+        self._variant_start = arrays["variant_start"]
+        self._pron_offsets = arrays["pron_offsets"]
+        self._phones = arrays["phones"]
+
+    @classmethod
+    def load_or_build(cls, path) -> "CMUDictIndex":
+        """Map `path`, building it from the cmudict package first if needed"""
+        path = Path(path)
+        try:
+            return cls(path)
+        except (FileNotFoundError, ValueError) as e:
+            logger.info(f"🔨 Building CMUDict index at {path} ({e.__class__.__name__})")
+            start = time.perf_counter()
+            build_from_cmudict(path)
+            logger.info(f"✅ CMUDict index built in {time.perf_counter() - start:.1f}s")
+            return cls(path)
+
+    def __len__(self) -> int:
+        return self.meta["words"]
+
+    def __contains__(self, word: str) -> bool:
+        return self._find(word) is not None
+
+    def _find(self, word: str) -> Optional[int]:
+        key = word.encode("utf-8")
+        table, offsets, blob, mask = self._table, self._word_offsets, self._word_blob, self._mask
+        slot = _hash(key) & mask
+        while True:
+            i = table[slot]
+            if i == 0xFFFFFFFF:
+                return None
+            if blob[offsets[i]:offsets[i + 1]] == key:
+                return i
+            slot = (slot + 1) & mask
+
+    def packed(self, word: str) -> List[bytes]:
+        """Packed phoneme bytes of every variant of `word` (lowercase)"""
+        i = self._find(word)
+        if i is None:
+            return []
+        phones, offsets = self._phones, self._pron_offsets
+        return [
+            phones[offsets[v]:offsets[v + 1]].tobytes()
+            for v in range(self._variant_start[i], self._variant_start[i + 1])
+        ]
+
+    def pronunciations(self, word: str, stress: bool = False) -> List[List[str]]:
+        """All variants of `word` as symbols, with or without stress digits"""
+        table = _STRESSED if stress else _STRIPPED
+        return [[table[b] for b in variant] for variant in self.packed(word)]
+
+    def first(self, word: str) -> List[str]:
+        """Stress-stripped symbols of the first variant ([] if unknown)"""
+        variants = self.packed(word)
+        return [_STRIPPED[b] for b in variants[0]] if variants else []
+
+    def close(self):
+        for view in (self._table, self._word_offsets, self._word_blob,
+                     self._variant_start, self._pron_offsets, self._phones):
+            view.release()
+        self._view.release()
+        self._mm.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the memory-mapped CMUDict index")
+    parser.add_argument("--out", default="models/cmudict.idx")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    path = build_from_cmudict(args.out)
+    index = CMUDictIndex(path)
+    print(
+        f"Built {path} in {time.perf_counter() - start:.1f}s: {len(index)} words, "
+        f"{index.meta['pronunciations']} pronunciations, {path.stat().st_size / 1e6:.1f} MB"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,23 @@
 # backend/services/coqui_tts_service.py - VITS VERSION
 
 import os
+import asyncio
 import logging
 import hashlib
 from pathlib import Path
-from typing import Optional
-import torch
-from TTS.api import TTS
+from typing import Dict, List, Optional
 
+import numpy as np
+
+from backend.core.cache import LRUCache
 from backend.core.config import get_settings
 from backend.core.exceptions import ExternalServiceError, ValidationError
 from backend.api.schemas.api_schemas import AudioGenerateResponse
+from backend.services.audio_utils import (
+    MAX_SPEED, MIN_SPEED, chunk_text, crossfade_concat, time_stretch
+)
+from backend.services.tts_pool import TTSReplicaPool
+from backend.services.tts_backends import create_backend
 # backend/services/coqui_tts_service.py - Add at top
 
 import os
@@ -26,105 +33,215 @@ class CoquiTTSService:
     """
     Service for generating audio using Coqui TTS with VITS model
     Fast, high quality, 109 different voices
+    
+    The engine itself is pluggable (see tts_backends): VITS, Bark or a stub
     """
     
     def __init__(self):
         logger.info("🎙️ Initializing CoquiTTSService (VITS)...")
         self.settings = get_settings()
-        self.audio_dir = Path("audio_files")
+        self.audio_dir = Path(self.settings.AUDIO_DIR)
         self.audio_dir.mkdir(exist_ok=True)
         
-        # Model
-        self.tts = None
-        self.models_loaded = False
+        # Engine (Coqui VITS by default, see TTS_BACKEND)
+        self.backend = create_backend(self.settings)
+        self.available_speakers = self.backend.voices
+        logger.info(f"   Backend: {self.backend.name}")
         
-        # Device
-        self.device = "cuda" if torch.cuda.is_available() else "cpu"
-        logger.info(f"Using device: {self.device}")
-        
-        # Available speakers for VCTK/VITS
-        self.available_speakers = [
-            "p225", "p226", "p227", "p228", "p229", "p230", "p231", "p232",
-            "p233", "p234", "p236", "p237", "p238", "p239", "p240", "p241",
-            "p243", "p244", "p245", "p246", "p247", "p248", "p249", "p250",
-            "p251", "p252", "p253", "p254", "p255", "p256", "p257", "p258",
-            "p259", "p260", "p261", "p262", "p263", "p264", "p265", "p266",
-            "p267", "p268", "p269", "p270", "p271", "p272", "p273", "p274",
-            "p275", "p276", "p277", "p278", "p279", "p280", "p281", "p282",
-            "p283", "p284", "p285", "p286", "p287", "p288", "p292", "p293",
-            "p294", "p295", "p297", "p298", "p299", "p300", "p301", "p302",
-            "p303", "p304", "p305", "p306", "p307", "p308", "p310", "p311",
-            "p312", "p313", "p314", "p316", "p317", "p318", "p323", "p326",
-            "p329", "p330", "p333", "p334", "p335", "p336", "p339", "p340",
-            "p341", "p343", "p345", "p347", "p351", "p360", "p361", "p362",
-            "p363", "p364", "p374", "p376"
-        ]
+        # Extra model replicas in worker processes for long texts
+        self.replicas: Optional[TTSReplicaPool] = None
+        if self.settings.TTS_REPLICAS > 1:
+            self.replicas = TTSReplicaPool(self.backend.name, self.settings.TTS_REPLICAS)
+        self.parallel_requests = 0
         
         # Cache
         self.cache = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        
+        # Per-sentence waveforms, keyed by md5(sentence + speaker), so
+        # overlapping subtitle lines reuse what was already synthesized
+        self.segment_cache = LRUCache(
+            max_items=self.settings.TTS_SEGMENT_CACHE_ITEMS,
+            max_bytes=self.settings.TTS_SEGMENT_CACHE_MAX_BYTES,
+            sizeof=lambda waveform: waveform.nbytes
+        )
+        
+        # Whole-text waveforms at normal speed, (waveform, sample_rate) keyed
+        # like the response cache; slower/faster variants are stretched
+        # from these instead of asking the model again
+        self.base_cache = LRUCache(
+            max_items=self.settings.TTS_BASE_CACHE_ITEMS,
+            max_bytes=self.settings.TTS_BASE_CACHE_MAX_BYTES,
+            sizeof=lambda entry: entry[0].nbytes
+        )
+        self.speed_variants = 0
         
         logger.info("✅ CoquiTTSService ready")
     
+    @property
+    def models_loaded(self) -> bool:
+        return self.backend.loaded
+    
+    @property
+    def device(self) -> Optional[str]:
+        """Torch device of the backend, if it has one"""
+        return getattr(self.backend, "device", None)
+    
     def _load_models(self):
-        """Load VITS model"""
-        if self.models_loaded:
-            return
+        """Load the TTS model (idempotent, safe to call from several threads)"""
+        self.backend.load()
+        logger.info(f"   Available speakers: {len(self.available_speakers)}")
+    
+    def warmup(self, text: str = "Hello, and welcome."):
+        """Run one throwaway synthesis so the first real request is fast"""
+        self._load_models()
+        logger.info(f"🔥 Warming up {self.backend.name}...")
+        self._synthesize(text, self._get_speaker("default"))
+        logger.info(f"✅ {self.backend.name} warm")
+    
+    @property
+    def sample_rate(self) -> int:
+        """Output sample rate of the loaded model"""
+        return self.backend.sample_rate
+    
+    def _synthesize(self, text: str, speaker: str) -> np.ndarray:
+        """Run the TTS engine on one piece of text (blocking)"""
+        return self.backend.synthesize(text, speaker)
+    
+    def _voice_key(self, speaker: str) -> str:
+        """
+        Speaker part of cache keys
+        Non-default engines are namespaced so their files never collide
+        """
+        if self.backend.name == "coqui_vits":
+            return speaker
+        return f"{self.backend.name}:{speaker}"
+    
+    def _segment_key(self, segment: str, speaker: str) -> str:
+        return hashlib.md5(f"{segment}_{self._voice_key(speaker)}".encode()).hexdigest()
+    
+    async def _get_segment(self, segment: str, speaker: str) -> np.ndarray:
+        """Waveform for one sentence, synthesized only on a cache miss"""
+        segment_key = self._segment_key(segment, speaker)
         
-        try:
-            logger.info("📥 Loading VITS model...")
-            
-            # ✅ VITS model - Fast and high quality
-            # English only, 109 different speakers
-            model_name = "tts_models/en/vctk/vits"
-            
-            self.tts = TTS(model_name).to(self.device)
-            
-            self.models_loaded = True
-            logger.info(f"✅ VITS model loaded successfully")
-            logger.info(f"   Available speakers: {len(self.available_speakers)}")
-            
-        except Exception as e:
-            logger.error(f"❌ Failed to load models: {e}")
-            raise ExternalServiceError(
-                "Failed to load TTS models",
-                "Coqui TTS"
-            )
+        waveform = self.segment_cache.get(segment_key)
+        if waveform is not None:
+            logger.debug(f"💾 Segment cache hit: {segment[:30]}")
+            return waveform
+        
+        waveform = await asyncio.to_thread(self._synthesize, segment, speaker)
+        self.segment_cache.set(segment_key, waveform)
+        return waveform
+    
+    async def _get_segments_parallel(self, segments: List[str], speaker: str) -> List[np.ndarray]:
+        """
+        Same as _get_segment for many chunks, but the cache misses are
+        synthesized concurrently across the replica pool. Order is preserved.
+        """
+        keys = [self._segment_key(segment, speaker) for segment in segments]
+        waveforms = {key: self.segment_cache.get(key) for key in set(keys)}
+        
+        missing = {
+            key: segment for key, segment in zip(keys, segments)
+            if waveforms[key] is None
+        }
+        if missing:
+            logger.info(f"🧬 Synthesizing {len(missing)} chunks on {self.replicas.replicas} replicas")
+            results = await asyncio.gather(*(
+                self.replicas.synthesize(segment, speaker) for segment in missing.values()
+            ))
+            for key, waveform in zip(missing, results):
+                waveforms[key] = waveform
+                self.segment_cache.set(key, waveform)
+        
+        return [waveforms[key] for key in keys]
     
     def _get_speaker(self, voice_preset: str) -> str:
         """
-        Map voice preset to VITS speaker ID
+        Map voice preset to the engine's voice ID
         
         Voice presets from Bark format (v2/en_speaker_X) to VITS speaker (pXXX)
         """
-        # Default speakers for different voice types
-        voice_map = {
-            "v2/en_speaker_0": "p225",  # Female, soft
-            "v2/en_speaker_1": "p226",  # Female, clear
-            "v2/en_speaker_2": "p227",  # Male, deep
-            "v2/en_speaker_3": "p228",  # Female, warm
-            "v2/en_speaker_4": "p229",  # Male, energetic
-            "v2/en_speaker_5": "p230",  # Female, professional
-            "v2/en_speaker_6": "p231",  # Male, neutral (default)
-            "v2/en_speaker_7": "p232",  # Female, friendly
-            "v2/en_speaker_8": "p233",  # Male, professional
-            "v2/en_speaker_9": "p234",  # Female, young
-            "default": "p231",          # Default male
-        }
+        speaker = self.backend.resolve_voice(voice_preset)
+        logger.info(f"Voice preset '{voice_preset}' → Speaker '{speaker}'")
+        return speaker
+    
+    async def _synthesize_text(self, text: str, speaker: str) -> np.ndarray:
+        """Whole text through the model, one sentence (or chunk) at a time"""
+        # Load models if not loaded (off the event loop)
+        await asyncio.to_thread(self._load_models)
         
-        # Get speaker from map or use default
-        speaker = voice_map.get(voice_preset, "p231")
+        # ✅ Generate audio one sentence (or long-sentence chunk) at a time
+        segments = chunk_text(text, self.settings.TTS_CHUNK_CHARS)
+        logger.info(
+            f"Generating speech with {self.backend.name} ({len(segments)} segments)..."
+        )
         
-        # If direct speaker ID provided (e.g., "p225"), use it
-        if voice_preset.startswith("p") and voice_preset in self.available_speakers:
-            speaker = voice_preset
+        if (
+            self.replicas is not None
+            and len(segments) > 1
+            and len(text) > self.settings.TTS_LONG_TEXT_CHARS
+        ):
+            # Long text: chunks in parallel across model replicas
+            self.parallel_requests += 1
+            waveforms = await self._get_segments_parallel(segments, speaker)
+        else:
+            # Short text: single in-process model
+            waveforms = [
+                await self._get_segment(segment, speaker)
+                for segment in segments
+            ]
+        return crossfade_concat(
+            waveforms,
+            self.sample_rate,
+            self.settings.TTS_CROSSFADE_MS
+        )
+    
+    async def _get_base_audio(self, text: str, speaker: str, base_key: str):
+        """
+        Normal-speed waveform and its sample rate
+        Memory first, then the wav already on disk, the model only as a last resort
+        """
+        entry = self.base_cache.get(base_key)
+        if entry is not None:
+            return entry
         
-        logger.info(f"Voice preset '{voice_preset}' → Speaker '{speaker}'")
-        return speaker
+        import soundfile as sf
+        
+        filepath = self.audio_dir / f"audio_{base_key}.wav"
+        if filepath.exists():
+            logger.info(f"💾 Base audio from disk: {filepath.name}")
+            waveform, sample_rate = await asyncio.to_thread(sf.read, str(filepath), dtype="float32")
+        else:
+            waveform = await self._synthesize_text(text, speaker)
+            sample_rate = self.sample_rate
+            await asyncio.to_thread(sf.write, str(filepath), waveform, sample_rate)
+            logger.info(f"✅ Audio file created: {filepath}")
+        
+        entry = (waveform, sample_rate)
+        self.base_cache.set(base_key, entry)
+        return entry
+    
+    def _text_key(self, text: str, speaker: str) -> str:
+        return hashlib.md5(f"{text}_{self._voice_key(speaker)}".encode()).hexdigest()
+    
+    async def get_waveform(self, text: str, voice_preset: str = "v2/en_speaker_6"):
+        """
+        Normal-speed (waveform, sample_rate) of `text`, from the same caches
+        and files as generate_audio
+        """
+        if not text or not text.strip():
+            raise ValidationError("Text cannot be empty")
+        text = text.strip()
+        speaker = self._get_speaker(voice_preset)
+        return await self._get_base_audio(text, speaker, self._text_key(text, speaker))
     
     async def generate_audio(
         self, 
         text: str,
-        voice_preset: str = "v2/en_speaker_6"
+        voice_preset: str = "v2/en_speaker_6",
+        speed: float = 1.0
     ) -> AudioGenerateResponse:
         """
         Generate audio from text using VITS model
@@ -132,55 +249,52 @@ class CoquiTTSService:
         Args:
             text: Text to convert to speech
             voice_preset: Voice style (Bark format or direct speaker ID like "p225")
+            speed: Playback speed; anything but 1.0 is time-stretched from
+                the normal-speed clip (pitch unchanged)
             
         Returns:
             AudioGenerateResponse with audio file URL
         """
         if not text or not text.strip():
             raise ValidationError("Text cannot be empty")
+        if not MIN_SPEED <= speed <= MAX_SPEED:
+            raise ValidationError(f"Speed must be between {MIN_SPEED} and {MAX_SPEED}")
         
         text = text.strip()
-        
-        # Limit text length for performance
-        if len(text) > 200:
-            text = text[:200]
-            logger.warning(f"Text truncated to 200 chars")
+        speed = round(float(speed), 2)
         
         # Get speaker ID
         speaker = self._get_speaker(voice_preset)
         
         # Check cache
-        cache_key = hashlib.md5(f"{text}_{speaker}".encode()).hexdigest()
+        base_key = self._text_key(text, speaker)
+        cache_key = base_key if speed == 1.0 else f"{base_key}_x{round(speed * 100):03d}"
         
         if cache_key in self.cache:
             logger.info(f"💾 Cache hit for: {text[:30]}...")
+            self.cache_hits += 1
             return self.cache[cache_key]
+        self.cache_misses += 1
         
         try:
             logger.info(f"🎙️ Generating audio for: {text[:50]}...")
             logger.info(f"   Using speaker: {speaker}")
             
-            # Load models if not loaded
-            self._load_models()
+            audio_data, sample_rate = await self._get_base_audio(text, speaker, base_key)
             
             # Generate filename
             filename = f"audio_{cache_key}.wav"
             filepath = self.audio_dir / filename
             
-            # ✅ Generate audio with VITS
-            logger.info("Generating speech with VITS...")
-            
-            self.tts.tts_to_file(
-                text=text,
-                file_path=str(filepath),
-                speaker=speaker  # Use specific speaker
-            )
+            if speed != 1.0:
+                logger.info(f"🐢 Time-stretching to {speed}x")
+                audio_data = await asyncio.to_thread(time_stretch, audio_data, speed)
+                self.speed_variants += 1
+                
+                import soundfile as sf
+                await asyncio.to_thread(sf.write, str(filepath), audio_data, sample_rate)
+                logger.info(f"✅ Audio file created: {filepath}")
             
-            logger.info(f"✅ Audio file created: {filepath}")
-            
-            # Get audio duration
-            import soundfile as sf
-            audio_data, sample_rate = sf.read(filepath)
             duration = len(audio_data) / sample_rate
             
             # Create response
@@ -190,7 +304,8 @@ class CoquiTTSService:
                 text=text,
                 audio_url=audio_url,
                 duration=duration,
-                voice_preset=voice_preset
+                voice_preset=voice_preset,
+                speed=speed
             )
             
             # Cache response
@@ -207,7 +322,8 @@ class CoquiTTSService:
     def list_speakers(self):
         """Get list of available speakers"""
         return {
-            "model": "tts_models/en/vctk/vits",
+            "model": self.backend.model_name,
+            "backend": self.backend.name,
             "total_speakers": len(self.available_speakers),
             "speakers": self.available_speakers,
             "recommended": {
@@ -222,17 +338,46 @@ class CoquiTTSService:
             }
         }
     
+    def cache_counters(self) -> Dict[str, Dict]:
+        """Hits, misses, evictions and size per cache (O(1), for /metrics)"""
+        return {
+            "responses": {
+                "hits": self.cache_hits,
+                "misses": self.cache_misses,
+                "evictions": 0,
+                "items": len(self.cache)
+            },
+            "segments": self.segment_cache.stats(),
+            "base_audio": self.base_cache.stats()
+        }
+    
     def get_cache_stats(self):
         """Get cache statistics"""
         return {
             "cached_audio": len(self.cache),
+            "segment_cache": self.segment_cache.stats(),
+            "base_cache": self.base_cache.stats(),
+            "speed_variants": self.speed_variants,
+            "parallel_requests": self.parallel_requests,
+            "replicas": self.replicas.get_stats() if self.replicas else None,
             "audio_files": len(list(self.audio_dir.glob("*.wav"))),
             "models_loaded": self.models_loaded,
-            "device": self.device,
-            "model": "tts_models/en/vctk/vits" if self.models_loaded else None,
+            "device": getattr(self.backend, "_device", None),
+            "backend": self.backend.get_stats(),
+            "model": self.backend.model_name if self.models_loaded else None,
             "available_speakers": len(self.available_speakers)
         }
     
+    def start_replicas(self):
+        """Spin up the replica pool now instead of on the first long request"""
+        if self.replicas is not None:
+            self.replicas.start()
+    
+    def shutdown(self):
+        """Stop replica worker processes"""
+        if self.replicas is not None:
+            self.replicas.shutdown()
+    
     def clear_old_files(self, max_age_hours: int = 24):
         """Clear audio files older than max_age_hours"""
         import time
@@ -253,4 +398,6 @@ class CoquiTTSService:
     def clear_cache(self):
         """Clear in-memory cache"""
         self.cache.clear()
+        self.segment_cache.clear()
+        self.base_cache.clear()
         logger.info("🧹 Cache cleared")
\ No newline at end of file
@@ -0,0 +1,186 @@
+# backend/services/g2p.py
+"""
+Rule-based grapheme-to-phoneme fallback for out-of-vocabulary words
+
+Names, slang and typos are not in CMUDict (pronunciation) or in the
+eng_to_ipa lexicon (phonetics). Instead of an 'UNK' token or the raw word,
+both services ask G2P for an ARPAbet guess: a compact table of English
+spelling rules, deterministic and local, memoized in an LRU lexicon.
+
+    G2P().phonemes("rizz")  -> ["R", "IH", "Z"]
+    G2P().ipa("rizz")       -> "rɪz"
+"""
+
+import logging
+import re
+from typing import Dict, List, Optional, Tuple
+
+from backend.core.cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+# Words as both services look them up: lowercase letters with inner
+# apostrophes ("don't", "o'clock"); punctuation, digits and dashes split
+_WORD = re.compile(r"[a-z]+(?:'[a-z]+)*")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lookup words of a text, punctuation stripped"""
+    return _WORD.findall(text.lower().replace("’", "'"))
+
+
+# Spelling rules: "grapheme[context] PHONEMES", longest grapheme first.
+# Context: ^ word start, $ word end, + before e/i/y, - not at word start.
+# A rule with no phonemes is silent.
+_RULE_TABLE = """
+    ough AO     augh AO     tion SH AH N    sion ZH AH N    tch CH
+    igh AY      eigh EY     dge JH      ght T       sch^ S K
+    kn^ N       wr^ R       gn^ N       ps^ S       wh W
+    ch CH       sh SH       th TH       ph F        ck K        ng NG
+    nk NG K     qu K W      gh^ G       gh          x^ Z        x K S
+    c+ S        c K         g+ JH       g G         s S         y^ Y
+    le$ AH L    ar AA R     er ER       ir ER       ur ER       or AO R
+    ee IY       ea IY       ie$ AY      ie IY       ei EY       ey$ IY
+    ey EY       ai EY       ay EY       au AO       aw AO       oa OW
+    oe$ OW      oi OY       oy OY       oo UW       ou AW       ow$ OW
+    ow AW       ew UW       eu UW       ue$ UW      ui UW
+    o$ OW       a$ AH       i$ IY       u$ UW
+    a AE        e EH        i IH        o AA        u AH
+    b B         d D         f F         h HH        j JH        k K
+    l L         m M         n N         p P         q K         r R
+    t T         v V         w W         z Z
+"""
+
+# Long vowels of the magic-e pattern (make, time, home, cute, theme)
+_LONG = {"a": ("EY",), "e": ("IY",), "i": ("AY",), "o": ("OW",), "u": ("UW",)}
+_VOWEL_LETTERS = frozenset("aeiou")
+_FRONT = frozenset("eiy")
+
+# ARPAbet -> IPA, for the phonetics service
+ARPABET_TO_IPA = {
+    "AA": "ɑ", "AE": "æ", "AH": "ʌ", "AO": "ɔ", "AW": "aʊ", "AY": "aɪ",
+    "EH": "ɛ", "ER": "ər", "EY": "eɪ", "IH": "ɪ", "IY": "i", "OW": "oʊ",
+    "OY": "ɔɪ", "UH": "ʊ", "UW": "u",
+    "B": "b", "CH": "tʃ", "D": "d", "DH": "ð", "F": "f", "G": "g",
+    "HH": "h", "JH": "dʒ", "K": "k", "L": "l", "M": "m", "N": "n",
+    "NG": "ŋ", "P": "p", "R": "r", "S": "s", "SH": "ʃ", "T": "t",
+    "TH": "θ", "V": "v", "W": "w", "Y": "j", "Z": "z", "ZH": "ʒ",
+}
+
+
+def _parse_rules(table: str) -> Dict[str, List[Tuple[str, str, Tuple[str, ...]]]]:
+    """First letter -> [(grapheme, context, phonemes)], longest grapheme first"""
+    tokens = table.split()
+    rules: Dict[str, List] = {}
+    i = 0
+    while i < len(tokens):
+        spec = tokens[i]
+        i += 1
+        phonemes = []
+        while i < len(tokens) and tokens[i].isupper():
+            phonemes.append(tokens[i])
+            i += 1
+        grapheme = spec.rstrip("^$+-")
+        context = spec[len(grapheme):]
+        rules.setdefault(grapheme[0], []).append((grapheme, context, tuple(phonemes)))
+    for options in rules.values():
+        # Stable: table order breaks ties between equally long graphemes
+        options.sort(key=lambda rule: -len(rule[0]))
+    return rules
+
+
+_RULES = _parse_rules(_RULE_TABLE)
+
+
+def _matches(word: str, i: int, grapheme: str, context: str) -> bool:
+    end = i + len(grapheme)
+    if not word.startswith(grapheme, i):
+        return False
+    if "^" in context and i != 0:
+        return False
+    if "$" in context and end != len(word):
+        return False
+    if "+" in context and (end >= len(word) or word[end] not in _FRONT):
+        return False
+    return "-" not in context or i > 0
+
+
+def _magic_e(word: str) -> Optional[int]:
+    """Index of the vowel lengthened by a silent final e (m[a]ke), if any"""
+    if len(word) < 3 or word[-1] != "e" or word[-2] in _VOWEL_LETTERS or word[-2] in "wy":
+        return None
+    vowel = len(word) - 3
+    if word[vowel] not in _VOWEL_LETTERS:
+        return None
+    if vowel > 0 and word[vowel - 1] in _VOWEL_LETTERS:
+        return None
+    return vowel
+
+
+def _y(word: str, i: int) -> Tuple[str, ...]:
+    """'y': consonant before a vowel, AY as the only vowel (my, fly), IY at the end"""
+    if i + 1 < len(word) and word[i + 1] in _VOWEL_LETTERS:
+        return ("Y",)
+    if i == len(word) - 1:
+        has_vowel = any(c in _VOWEL_LETTERS for c in word[:i])
+        return ("IY",) if has_vowel else ("AY",)
+    return ("IH",)
+
+
+def spell_to_phonemes(word: str) -> List[str]:
+    """Stress-less ARPAbet for a lowercase word (uncached)"""
+    word = word.replace("'", "")
+    long_vowel = _magic_e(word)
+    silent_end = long_vowel is not None or (
+        word.endswith("e") and len(word) > 2 and any(c in _VOWEL_LETTERS for c in word[:-1])
+    )
+
+    phonemes: List[str] = []
+    i = 0
+    while i < len(word):
+        letter = word[i]
+        if i == long_vowel:
+            phonemes.extend(_LONG[letter])
+            i += 1
+            continue
+        if i == len(word) - 1 and letter == "e" and silent_end:
+            break
+        if letter == "y" and i > 0:
+            phonemes.extend(_y(word, i))
+            i += 1
+            continue
+        for grapheme, context, sounds in _RULES.get(letter, ()):
+            if _matches(word, i, grapheme, context):
+                phonemes.extend(sounds)
+                i += len(grapheme)
+                break
+        else:
+            i += 1
+
+    # Double letters (ll, ss, tt) are one sound
+    return [p for k, p in enumerate(phonemes) if k == 0 or p != phonemes[k - 1]]
+
+
+class G2P:
+    """Memoized spelling-rule G2P, shared by the pronunciation and phonetics services"""
+
+    def __init__(self, max_items: int = 10_000):
+        # Learned lexicon: word -> phonemes
+        self.lexicon = LRUCache(max_items=max_items)
+
+    def phonemes(self, word: str) -> List[str]:
+        """ARPAbet guess for one word (lowercased); [] if it has no letters"""
+        word = word.lower()
+        phonemes = self.lexicon.get(word)
+        if phonemes is None:
+            phonemes = spell_to_phonemes(word)
+            self.lexicon.set(word, phonemes)
+            logger.debug(f"📝 G2P '{word}': {' '.join(phonemes)}")
+        return list(phonemes)
+
+    def ipa(self, word: str) -> str:
+        """IPA guess for one word"""
+        return "".join(ARPABET_TO_IPA[p] for p in self.phonemes(word))
+
+    def get_stats(self) -> Dict:
+        return self.lexicon.stats()
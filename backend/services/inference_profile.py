@@ -0,0 +1,111 @@
+# backend/services/inference_profile.py
+"""
+CPU inference tuning for torch TTS models
+
+Everything here imports torch lazily so it can be imported by lightweight workers.
+"""
+
+import contextlib
+import logging
+from typing import Any, Dict
+
+from backend.core.config import Settings
+
+logger = logging.getLogger(__name__)
+
+
+class InferenceProfile:
+    """
+    How a torch model should run: threading, autograd state and optional
+    int8 / torch.compile optimizations. Built from Settings.
+    """
+
+    def __init__(
+        self,
+        intra_op_threads: int = 0,
+        inter_op_threads: int = 0,
+        inference_mode: bool = True,
+        quantize_int8: bool = False,
+        torch_compile: bool = False
+    ):
+        # 0 means "leave torch's default"
+        self.intra_op_threads = intra_op_threads
+        self.inter_op_threads = inter_op_threads
+        self.inference_mode = inference_mode
+        self.quantize_int8 = quantize_int8
+        self.torch_compile = torch_compile
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "InferenceProfile":
+        return cls(
+            intra_op_threads=settings.TTS_INTRA_OP_THREADS,
+            inter_op_threads=settings.TTS_INTER_OP_THREADS,
+            inference_mode=settings.TTS_INFERENCE_MODE,
+            quantize_int8=settings.TTS_QUANTIZE_INT8,
+            torch_compile=settings.TTS_TORCH_COMPILE
+        )
+
+    def apply_threading(self):
+        """Configure torch thread pools (process-wide)"""
+        import torch
+
+        if self.intra_op_threads > 0:
+            torch.set_num_threads(self.intra_op_threads)
+        if self.inter_op_threads > 0:
+            try:
+                torch.set_num_interop_threads(self.inter_op_threads)
+            except RuntimeError as e:
+                # Only allowed before any inter-op parallel work has started
+                logger.warning(f"⚠️ Could not set inter-op threads: {e}")
+
+        logger.info(
+            f"🧵 torch threads: intra={torch.get_num_threads()} "
+            f"inter={torch.get_num_interop_threads()}"
+        )
+
+    def optimize(self, model: Any) -> Any:
+        """
+        Apply model-level optimizations
+
+        Returns the (possibly replaced) model; callers must use the return value.
+        """
+        import torch
+
+        model.eval()
+
+        if self.quantize_int8:
+            before = _count_modules(model, torch.nn.Linear)
+            model = torch.ao.quantization.quantize_dynamic(
+                model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+            logger.info(f"🗜️ Dynamic int8 quantization: {before} linear layers")
+
+        if self.torch_compile:
+            # Text length varies per request, so compile with dynamic shapes.
+            # Coqui calls `model.inference`, not forward
+            target = "inference" if hasattr(model, "inference") else "forward"
+            setattr(model, target, torch.compile(getattr(model, target), dynamic=True))
+            logger.info(f"⚙️ torch.compile enabled on {target}()")
+
+        return model
+
+    def context(self):
+        """Context manager to wrap each synthesis call in"""
+        if not self.inference_mode:
+            return contextlib.nullcontext()
+
+        import torch
+        return torch.inference_mode()
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "intra_op_threads": self.intra_op_threads,
+            "inter_op_threads": self.inter_op_threads,
+            "inference_mode": self.inference_mode,
+            "quantize_int8": self.quantize_int8,
+            "torch_compile": self.torch_compile
+        }
+
+
+def _count_modules(model: Any, module_type: type) -> int:
+    return sum(1 for m in model.modules() if isinstance(m, module_type))
@@ -0,0 +1,140 @@
+# backend/services/lookup_service.py
+
+import asyncio
+import logging
+import time
+from typing import Callable, Dict, List, Optional, Set
+
+from backend.core.config import get_settings
+from backend.core.exceptions import AppException
+
+logger = logging.getLogger(__name__)
+
+PARTS = ("meaning", "phonetics", "audio")
+
+
+class LookupService:
+    """
+    Meaning, phonetics and audio for one word click, fetched concurrently
+
+    Each part has its own timeout, so a click costs the slowest part that
+    finishes in time instead of the sum of three round-trips. A part that
+    times out keeps running in the background (its result still lands in
+    the service caches for the next click) and is reported in `errors`.
+
+    Services are passed as zero-argument getters (the dependency
+    singletons) and only built when a lookup needs them; a disabled
+    subsystem is None.
+    """
+
+    def __init__(
+        self,
+        meaning: Optional[Callable] = None,
+        phonetics: Optional[Callable] = None,
+        tts: Optional[Callable] = None
+    ):
+        settings = get_settings()
+        self.providers = {"meaning": meaning, "phonetics": phonetics, "audio": tts}
+        self.timeouts = {
+            "meaning": settings.LOOKUP_MEANING_TIMEOUT_SECONDS,
+            "phonetics": settings.LOOKUP_PHONETICS_TIMEOUT_SECONDS,
+            "audio": settings.LOOKUP_AUDIO_TIMEOUT_SECONDS
+        }
+        # Timed-out parts still running (referenced so they aren't collected)
+        self._background: Set[asyncio.Task] = set()
+        self.counters = {part: {"ok": 0, "timeouts": 0, "errors": 0} for part in PARTS}
+        self.lookups = 0
+
+    @property
+    def enabled(self) -> List[str]:
+        return [part for part in PARTS if self.providers[part] is not None]
+
+    async def lookup(
+        self,
+        text: str,
+        fields: Optional[List[str]] = None,
+        voice_preset: str = "v2/en_speaker_6",
+        speed: float = 1.0,
+        include_ipa: bool = True,
+        include_syllables: bool = True
+    ) -> Dict:
+        """
+        Requested parts of `text` (all enabled ones by default). Returns a
+        dict with one key per part that succeeded, plus `errors`,
+        `timings_ms` and `elapsed_ms`
+        """
+        start = time.perf_counter()
+        self.lookups += 1
+        fields = list(dict.fromkeys(fields or self.enabled))
+
+        calls = {
+            "meaning": lambda: self.providers["meaning"]().get_meaning(text),
+            "phonetics": lambda: self.providers["phonetics"]().get_phonetics(
+                text, include_ipa, include_syllables
+            ),
+            "audio": lambda: self.providers["audio"]().generate_audio(text, voice_preset, speed)
+        }
+
+        result = {"text": text, "errors": {}, "timings_ms": {}}
+        wanted = [part for part in fields if self.providers.get(part) is not None]
+        for part in fields:
+            if part not in wanted:
+                result["errors"][part] = "disabled"
+
+        outcomes = await asyncio.gather(*(self._run(part, calls[part]) for part in wanted))
+        for part, (value, error, elapsed) in zip(wanted, outcomes):
+            result["timings_ms"][part] = round(elapsed * 1000, 2)
+            if error is None:
+                result[part] = value
+            else:
+                result["errors"][part] = error
+
+        result["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 2)
+        logger.info(
+            f"🔎 Lookup '{text[:30]}': {sum(part in result for part in wanted)}"
+            f"/{len(fields)} parts in {result['elapsed_ms']:.0f} ms"
+        )
+        return result
+
+    async def _run(self, part: str, call: Callable):
+        """(value, error, seconds) of one part, bounded by its timeout"""
+        start = time.perf_counter()
+
+        async def invoke():
+            # The getter may build the service: inside the task, so its
+            # failures are this part's error
+            return await call()
+
+        task = asyncio.ensure_future(invoke())
+        timeout = self.timeouts[part]
+        try:
+            value = await asyncio.wait_for(asyncio.shield(task), timeout)
+            self.counters[part]["ok"] += 1
+            return value, None, time.perf_counter() - start
+        except asyncio.TimeoutError:
+            self._background.add(task)
+            task.add_done_callback(self._finished)
+            self.counters[part]["timeouts"] += 1
+            logger.warning(f"⏱️ Lookup part '{part}' timed out after {timeout}s")
+            return None, f"timed out after {timeout}s", time.perf_counter() - start
+        except AppException as e:
+            self.counters[part]["errors"] += 1
+            return None, e.message, time.perf_counter() - start
+        except Exception as e:
+            self.counters[part]["errors"] += 1
+            logger.error(f"❌ Lookup part '{part}' failed: {e}")
+            return None, str(e) or type(e).__name__, time.perf_counter() - start
+
+    def _finished(self, task: asyncio.Task):
+        self._background.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"⚠️ Timed-out lookup part failed later: {task.exception()}")
+
+    def get_stats(self) -> Dict:
+        return {
+            "lookups": self.lookups,
+            "enabled": self.enabled,
+            "timeouts_s": self.timeouts,
+            "parts": self.counters,
+            "background": len(self._background)
+        }
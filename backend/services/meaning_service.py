@@ -1,12 +1,13 @@
 # backend/services/meaning_service.py
+import asyncio
 import json
 import logging
+import time
 from typing import Dict
 
-# import os
-from google import genai
 from backend.core.config import get_settings
 from backend.core.exceptions import ExternalServiceError, ValidationError
+from backend.core.metrics import GEMINI_ERRORS, GEMINI_SECONDS
 from backend.api.schemas.api_schemas import MeaningResponse
 
 logger = logging.getLogger(__name__)
@@ -26,6 +27,8 @@ class MeaningService:
         """Setup Gemini API - YOUR CODE"""
         try:
             print("🔧 Initializing Gemini API...")
+            # Deferred: google.genai is slow to import and only this service needs it
+            from google import genai
             api_key = getattr(self.settings, "API_KEY_GEMINI", None)
             if not api_key:
                 raise ValueError("GEMINI API key (API_KEY_GEMINI) not configured")
@@ -99,19 +102,26 @@ Text:
     async def _call_gemini(self, prompt: str) -> str:
         """
         Call Gemini API - YOUR AI CALL
+        The client call blocks: it runs in a worker thread so the event loop
+        (and the lookup's per-part timeouts) keep running meanwhile
         """
+        start = time.perf_counter()
         try:
-            response = self.client.models.generate_content(
-                        model="gemini-2.5-flash", 
-                        contents=prompt 
-                )
+            response = await asyncio.to_thread(
+                self.client.models.generate_content,
+                model="gemini-2.5-flash",
+                contents=prompt
+            )
             return response.text
         except Exception as e:
+            GEMINI_ERRORS.inc()
             logger.error(f"Gemini API error: {e}")
             raise ExternalServiceError(
                 message="AI service temporarily unavailable",
                 service_name="Gemini"
             )
+        finally:
+            GEMINI_SECONDS.observe(time.perf_counter() - start)
     
     def _parse_response(self, response: str, original_text: str) -> Dict:
         """
@@ -0,0 +1,25 @@
+# backend/services/phoneme_inventory.py
+"""
+ARPAbet phoneme inventory (CMUDict, stress stripped)
+
+PHONEME_IDS are the codes packed into the CMUDict index file. Alignment
+encodes with WPSM.encode, whose codes follow the same order.
+"""
+
+from typing import Dict
+
+PHONEMES = (
+    # Vowels
+    "AA", "AE", "AH", "AO", "AW", "AY", "EH", "ER", "EY",
+    "IH", "IY", "OW", "OY", "UH", "UW",
+    # Consonants
+    "B", "CH", "D", "DH", "F", "G", "HH", "JH", "K", "L", "M", "N", "NG",
+    "P", "R", "S", "SH", "T", "TH", "V", "W", "Y", "Z", "ZH",
+    # Placeholder for out-of-dictionary words
+    "UNK",
+)
+
+VOWELS = frozenset(PHONEMES[:15])
+
+PHONEME_IDS: Dict[str, int] = {p: i for i, p in enumerate(PHONEMES)}
+UNK_ID = PHONEME_IDS["UNK"]
@@ -1,26 +1,38 @@
 # backend/services/phonetic_service.py - REFACTORED VERSION
 
 import logging
-import re
-from typing import List, Dict
+from typing import List, Dict, Optional
 import eng_to_ipa as ipa
 
 from backend.core.config import get_settings
 from backend.core.exceptions import ValidationError
 from backend.api.schemas.api_schemas import PhoneticsResponse, PhoneticWord
+from backend.services.g2p import G2P, tokenize
 
 logger = logging.getLogger(__name__)
 
+# Pre-cached at startup so the first lookups don't hit the lexicon cold
+COMMON_WORDS = [
+    "the", "be", "to", "of", "and", "a", "in", "that", "have", "i",
+    "it", "for", "not", "on", "with", "he", "as", "you", "do", "at",
+    "this", "but", "his", "by", "from", "they", "we", "say", "her", "she",
+    "or", "an", "will", "my", "one", "all", "would", "there", "their", "what",
+    "hello", "world", "thank", "please", "good", "morning", "how", "are", "is", "was",
+]
+
 class PhoneticService:
     """
     Service for generating phonetic transcriptions
-    Uses eng_to_ipa library (fast, local, reliable)
+    Uses eng_to_ipa library (fast, local, reliable), G2P for words it doesn't know
     """
     
-    def __init__(self):
+    def __init__(self, g2p: Optional[G2P] = None):
         logger.info("🔤 Initializing PhoneticService...")
         self.settings = get_settings()
+        self.g2p = g2p or G2P(self.settings.G2P_CACHE_ITEMS)
         self.cache = {}  # Cache phonetics
+        self.cache_hits = 0
+        self.cache_misses = 0
         logger.info("✅ PhoneticService ready (using eng_to_ipa)")
     
     async def get_phonetics(
@@ -68,11 +80,23 @@ class PhoneticService:
         logger.info(f"✅ Phonetics generated for {len(phonetic_words)} words")
         return result
     
+    def warmup(self, words: List[str] = None):
+        """Touch the eng_to_ipa lexicon and pre-fill the cache with common words"""
+        words = words or COMMON_WORDS
+        for word in words:
+            self._get_word_phonetics(word, True, True)
+        logger.info(f"🔥 Phonetic lexicon warm ({len(words)} words cached)")
+    
+    def lookup_words(self, words: List[str]) -> List[PhoneticWord]:
+        """
+        Phonetics of already extracted words with the default options, i.e.
+        exactly what later /api/phonetics requests for them read from the cache
+        """
+        return [self._get_word_phonetics(word, True, True) for word in words]
+    
     def _extract_words(self, text: str) -> List[str]:
-        """Extract words from text"""
-        # Remove punctuation and split
-        words = re.findall(r'\b[a-zA-Z]+\b', text)
-        return [w.lower() for w in words if w]
+        """Extract words from text (punctuation stripped, "don't" kept whole)"""
+        return tokenize(text)
     
     def _get_word_phonetics(
         self,
@@ -86,20 +110,22 @@ class PhoneticService:
         cache_key = f"{word}_{include_ipa}_{include_syllables}"
         if cache_key in self.cache:
             logger.debug(f"💾 Cache hit for: {word}")
+            self.cache_hits += 1
             return self.cache[cache_key]
+        self.cache_misses += 1
         
         try:
             # Get IPA transcription
             ipa_text = ""
             if include_ipa:
                 ipa_text = ipa.convert(word)
-                # eng_to_ipa returns the word itself if not found
+                # eng_to_ipa marks words it doesn't know with '*'
                 # Add slashes for standard IPA notation
-                if ipa_text and ipa_text != word:
+                if ipa_text and ipa_text != word and "*" not in ipa_text:
                     ipa_text = f"/{ipa_text}/"
                 else:
-                    # Fallback: simple phonetic
-                    ipa_text = f"/{word}/"
+                    # Fallback: spelling-rule guess (cached below like any word)
+                    ipa_text = f"/{self.g2p.ipa(word) or word}/"
             
             # Get syllables
             syllables = []
@@ -210,6 +236,17 @@ class PhoneticService:
             )
         }
     
+    def cache_counters(self) -> Dict[str, Dict]:
+        """Hits, misses, evictions and size per cache (O(1), for /metrics)"""
+        return {
+            "words": {
+                "hits": self.cache_hits,
+                "misses": self.cache_misses,
+                "evictions": 0,
+                "items": len(self.cache)
+            }
+        }
+    
     def clear_cache(self):
         """Clear phonetics cache"""
         old_size = len(self.cache)
@@ -0,0 +1,115 @@
+# backend/services/pronunciation_pool.py
+"""
+Process pool for pronunciation scoring
+
+Alignment is CPU-bound Python/numpy and holds the GIL, so batches are
+scored in worker processes. Each worker builds its WPSM/metrics once (pool
+initializer); references (phonemes, identity score, TTS features) are
+prepared by the parent, once per distinct text, and shipped with each
+task so workers never load CMUDict or a TTS model.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from backend.core.metrics import EXECUTOR_WAIT_SECONDS, INFERENCE_SECONDS
+
+logger = logging.getLogger(__name__)
+
+# Per-worker metrics, set by _init_scorer
+_scorer = None
+
+
+def _init_scorer(max_cells: int, segment_phonemes: int):
+    """Pool initializer: build the substitution matrix and aligner once"""
+    global _scorer
+    from backend.services.pronunciation_service import PronunciationMetrics, WPSM
+
+    _scorer = PronunciationMetrics(
+        WPSM(), max_cells=max_cells, segment_phonemes=segment_phonemes
+    )
+
+
+def _score_recording(
+    waveform: np.ndarray, reference, acoustic_params: Optional[Dict]
+) -> Tuple[Dict, float]:
+    """(analysis, seconds spent scoring in this worker)"""
+    from backend.services.pronunciation_service import timed_score_recording
+
+    return timed_score_recording(_scorer, waveform, reference, acoustic_params)
+
+
+class PronunciationPool:
+    """Async front for a ProcessPoolExecutor of scorers"""
+
+    def __init__(self, workers: int, max_cells: int, segment_phonemes: int):
+        self.workers = workers
+        self.max_cells = max_cells
+        self.segment_phonemes = segment_phonemes
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self.pending = 0
+        self.completed = 0
+        self.failed = 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            logger.info(f"🧮 Starting {self.workers} pronunciation workers...")
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_scorer,
+                initargs=(self.max_cells, self.segment_phonemes)
+            )
+        return self._executor
+
+    async def score(
+        self,
+        waveform: np.ndarray,
+        reference,
+        acoustic_params: Optional[Dict] = None
+    ) -> Dict:
+        """Score one recording (against a pronunciation_service.Reference)
+        on whichever worker is free"""
+        loop = asyncio.get_running_loop()
+        self.pending += 1
+        submitted = time.perf_counter()
+        try:
+            analysis, seconds = await loop.run_in_executor(
+                self._get_executor(),
+                _score_recording,
+                waveform,
+                reference,
+                acoustic_params
+            )
+        except BaseException:
+            self.failed += 1
+            raise
+        finally:
+            self.pending -= 1
+        self.completed += 1
+        # Scoring time comes from the worker; the rest was spent queued
+        INFERENCE_SECONDS.labels("pronunciation_pool").observe(seconds)
+        EXECUTOR_WAIT_SECONDS.labels("pronunciation_pool").observe(
+            max(time.perf_counter() - submitted - seconds, 0.0)
+        )
+        return analysis
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def get_stats(self):
+        return {
+            "workers": self.workers,
+            "started": self._executor is not None,
+            "pending": self.pending,
+            "completed": self.completed,
+            "failed": self.failed
+        }
@@ -1,11 +1,27 @@
 # backend/services/pronunciation_service.py
 
+import os
+import time
+import hashlib
+import asyncio
 import numpy as np
-import librosa
 import logging
 from pathlib import Path
-from typing import List, Dict, Tuple
-import re
+from concurrent.futures import Executor
+from typing import AsyncIterator, List, Dict, Optional, Sequence, Tuple
+
+from backend.core.cache import LRUCache
+from backend.core.config import get_settings
+from backend.core.exceptions import AppException, ScoringUnavailableError, ValidationError
+from backend.core.metrics import EXECUTOR_WAIT_SECONDS, INFERENCE_SECONDS
+from backend.services.acoustic_service import (
+    AcousticService, OnlineDTW, compare_recording, load_audio
+)
+from backend.services.cmudict_index import CMUDictIndex
+from backend.services.g2p import G2P, tokenize
+from backend.services.phoneme_inventory import PHONEMES
+from backend.services.pronunciation_pool import PronunciationPool
+from backend.services.vad import prepare_recording
 
 logger = logging.getLogger(__name__)
 
@@ -14,45 +30,74 @@ logger = logging.getLogger(__name__)
 # ============================================================================
 
 class CMUDictLoader:
-    """Load and query CMU Pronouncing Dictionary"""
+    """
+    Query the CMU Pronouncing Dictionary through the mmapped index
+    Words missing from it are spelled out by `g2p` when given ('UNK' otherwise)
+    """
     
-    def __init__(self):
-        self.dict = {}
+    def __init__(self, index_path: Optional[str] = None, g2p: Optional[G2P] = None):
+        self.index_path = index_path or get_settings().CMUDICT_INDEX_PATH
+        self.index = None
+        self.g2p = g2p
         self._load_dict()
     
     def _load_dict(self):
-        """Load CMUDICT"""
+        """Map the CMUDICT index (built on first use)"""
         try:
-            import cmudict
-            self.dict = cmudict.dict()
-            logger.info(f"✅ Loaded CMUDICT with {len(self.dict)} words")
+            self.index = CMUDictIndex.load_or_build(self.index_path)
+            logger.info(f"✅ Loaded CMUDICT index with {len(self.index)} words")
         except ImportError:
             logger.error("❌ cmudict package not installed")
             raise
     
+    def in_dictionary(self, word: str) -> bool:
+        return word.lower().strip() in self.index
+    
+    def _fallback(self, word: str) -> List[str]:
+        """G2P guess for an out-of-vocabulary word, ['UNK'] without G2P"""
+        phonemes = self.g2p.phonemes(word) if self.g2p is not None else []
+        if not phonemes:
+            logger.warning(f"Word not in CMUDICT: {word}")
+            return ['UNK']
+        return phonemes
+    
     def get_pronunciation(self, word: str) -> List[str]:
-        """Get phoneme sequence for a word"""
+        """Get phoneme sequence for a word (first variant, stress removed)"""
         word = word.lower().strip()
-        pron = self.dict.get(word)
-        if pron:
-            # Remove stress markers
-            return [re.sub(r'[0-9]', '', p) for p in pron[0]]
-        return []
+        phonemes = self.index.first(word)
+        if not phonemes and self.g2p is not None and word:
+            phonemes = self.g2p.phonemes(word)
+        return phonemes
     
-    def sentence_to_phonemes(self, sentence: str) -> List[str]:
-        """Convert sentence to phoneme sequence"""
-        words = sentence.lower().split()
-        all_phonemes = []
+    def get_pronunciations(self, word: str, stress: bool = False) -> List[List[str]]:
+        """Every pronunciation variant of a word"""
+        return self.index.pronunciations(word.lower().strip(), stress=stress)
+    
+    def sentence_to_word_phonemes(self, sentence: str) -> List[List[str]]:
+        """Phoneme sequence of each word in the sentence (punctuation stripped)"""
+        return [
+            self.index.first(word) or self._fallback(word)
+            for word in tokenize(sentence)
+        ]
+    
+    def sentence_to_word_variants(self, sentence: str) -> List[List[List[str]]]:
+        """Every pronunciation of each word (stress removed, duplicates dropped)"""
+        word_variants = []
         
-        for word in words:
-            pron = self.get_pronunciation(word)
-            if pron:
-                all_phonemes.extend(pron)
-            else:
-                logger.warning(f"Word not in CMUDICT: {word}")
-                all_phonemes.append('UNK')
+        for word in tokenize(sentence):
+            variants = []
+            for pron in self.get_pronunciations(word):
+                if pron not in variants:
+                    variants.append(pron)
+            if not variants:
+                variants.append(self._fallback(word))
+            word_variants.append(variants)
         
-        return all_phonemes
+        return word_variants
+    
+    def sentence_to_phonemes(self, sentence: str) -> List[str]:
+        """Convert sentence to phoneme sequence"""
+        return [p for word in self.sentence_to_word_phonemes(sentence) for p in word]
 
 
 # ============================================================================
@@ -62,6 +107,9 @@ class CMUDictLoader:
 class WPSM:
     """Weighted Phonemic Substitution Matrix"""
     
+    # Fixed-point factor of the dense matrix (0.01 resolution)
+    SCALE = 100
+    
     def __init__(self):
         self.matrix = {}
         self._build_matrix()
@@ -96,6 +144,52 @@ class WPSM:
             self.matrix[(a, b)] = score
             if a != b:
                 self.matrix[(b, a)] = score
+        
+        # Dense form over integer phoneme codes, for the vectorized aligner.
+        # Scores have two decimals, so they are stored exactly as ints x SCALE
+        self.codes: Dict[str, int] = {}
+        self.dense = np.zeros((0, 0), dtype=np.int64)
+        for phoneme in PHONEMES:
+            self.code(phoneme)
+    
+    def code(self, phoneme: str) -> int:
+        """
+        Integer code of a phoneme
+        Symbols outside the inventory get a new code on first use
+        """
+        code = self.codes.get(phoneme)
+        if code is not None:
+            return code
+        
+        code = len(self.codes)
+        self.codes[phoneme] = code
+        
+        dense = np.full((code + 1, code + 1), -self.SCALE, dtype=np.int64)
+        dense[:code, :code] = self.dense
+        for other, other_code in self.codes.items():
+            dense[code, other_code] = dense[other_code, code] = round(
+                self.get_similarity(phoneme, other) * self.SCALE
+            )
+        self.dense = dense
+        return code
+    
+    def encode(self, phonemes: List[str]) -> np.ndarray:
+        """Phoneme sequence -> array of codes"""
+        return np.array([self.code(p) for p in phonemes], dtype=np.intp)
+    
+    def is_diagonal_dominant(self) -> bool:
+        """
+        True when every phoneme scores itself higher (and above zero) than
+        any substitution involving it; aligning a sequence with itself then
+        can't beat the plain diagonal
+        """
+        diag = np.diag(self.dense)
+        off = self.dense.copy()
+        np.fill_diagonal(off, np.iinfo(np.int64).min)
+        return bool(
+            (diag > 0).all()
+            and (off < np.minimum.outer(diag, diag)).all()
+        )
     
     def get_similarity(self, p1: str, p2: str) -> float:
         """Get similarity between phonemes"""
@@ -113,64 +207,382 @@ class WPSM:
 # ============================================================================
 
 class NeedlemanWunschAligner:
-    """Global sequence alignment"""
+    """
+    Global sequence alignment
+    
+    The DP table is filled one row at a time with numpy: diagonal and up
+    moves are elementwise, and the left-move chain within a row is a
+    running maximum (prefix scan). Scores are integers (WPSM.SCALE), so
+    results and tie-breaking match the cell-by-cell recurrence exactly:
+    diagonal, then up, then left.
     
-    def __init__(self, wpsm: WPSM, gap_penalty: float = -0.73):
+    Problems above `max_cells` never build the full table:
+    - with reference word boundaries, the alignment is cut at word
+      boundaries and the segments are aligned independently (segmented)
+    - otherwise Hirschberg's divide and conquer (linear)
+    Both keep the optimal score; only the choice among equally good
+    alignments can differ from the full table.
+    """
+    
+    # Traceback codes
+    DIAG, UP, LEFT = 0, 1, 2
+    
+    def __init__(
+        self,
+        wpsm: WPSM,
+        gap_penalty: float = -0.73,
+        max_cells: int = 1_000_000,
+        segment_phonemes: int = 48
+    ):
         self.wpsm = wpsm
         self.gap_penalty = gap_penalty
+        self._gap = round(gap_penalty * WPSM.SCALE)
+        # Largest (m + 1) x (n + 1) table aligned in one piece
+        self.max_cells = max_cells
+        # Minimum reference length of a segment in segmented mode
+        self.segment_phonemes = segment_phonemes
+    
+    def _next_row(self, prev: np.ndarray, sub_row: np.ndarray, first: int, ramp: np.ndarray):
+        """One DP row from the previous one; returns (scores, traceback)"""
+        gap = self._gap
+        diag = prev[:-1] + sub_row
+        up = prev[1:] + gap
+        
+        # Best of diagonal/up, diagonal wins ties
+        best = np.maximum(diag, up)
+        row_trace = np.empty(len(prev), dtype=np.int8)
+        row_trace[0] = self.UP
+        row_trace[1:] = np.where(diag >= up, self.DIAG, self.UP)
+        
+        # Left chain: row[j] = max_k(best[k] + gap * (j - k)), with the
+        # row's boundary cell as k = 0. Shift by the ramp to make it a cummax
+        row = np.empty(len(prev), dtype=np.int64)
+        row[0] = first
+        row[1:] = best
+        row = np.maximum.accumulate(row - ramp) + ramp
+        
+        # Left is only taken when strictly better
+        row_trace[1:][row[1:] > best] = self.LEFT
+        return row, row_trace
     
-    def align(self, seq1: List[str], seq2: List[str]) -> Tuple[List[str], List[str], float]:
-        """Align two phoneme sequences"""
+    def fill(
+        self, seq1: List[str], seq2: List[str], codes2: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score and traceback tables, (m + 1) x (n + 1)
+        Scores are in WPSM.SCALE units; `codes2` is seq2 already encoded
+        """
         m, n = len(seq1), len(seq2)
+        gap = self._gap
+        codes1 = self.wpsm.encode(seq1)
+        if codes2 is None:
+            codes2 = self.wpsm.encode(seq2)
+        # Substitution scores for every (i, j) pair in one gather
+        sub = self.wpsm.dense[codes1[:, None], codes2[None, :]]
         
-        # Initialize
-        score = np.zeros((m + 1, n + 1))
-        trace = np.zeros((m + 1, n + 1), dtype=int)
+        score = np.empty((m + 1, n + 1), dtype=np.int64)
+        trace = np.empty((m + 1, n + 1), dtype=np.int8)
         
-        for i in range(1, m + 1):
-            score[i][0] = score[i-1][0] + self.gap_penalty
-            trace[i][0] = 1
-        for j in range(1, n + 1):
-            score[0][j] = score[0][j-1] + self.gap_penalty
-            trace[0][j] = 2
+        ramp = np.arange(n + 1, dtype=np.int64) * gap
+        score[0] = ramp
+        trace[0] = self.LEFT
+        trace[0, 0] = self.DIAG
         
-        # Fill matrix
         for i in range(1, m + 1):
-            for j in range(1, n + 1):
-                diag = score[i-1][j-1] + self.wpsm.get_similarity(seq1[i-1], seq2[j-1])
-                up = score[i-1][j] + self.gap_penalty
-                left = score[i][j-1] + self.gap_penalty
-                
-                if diag >= up and diag >= left:
-                    score[i][j] = diag
-                    trace[i][j] = 0
-                elif up >= left:
-                    score[i][j] = up
-                    trace[i][j] = 1
-                else:
-                    score[i][j] = left
-                    trace[i][j] = 2
+            score[i], trace[i] = self._next_row(score[i - 1], sub[i - 1], i * gap, ramp)
         
-        # Traceback
+        return score, trace
+    
+    def _last_rows(self, codes1: np.ndarray, codes2: np.ndarray, keep) -> Dict[int, np.ndarray]:
+        """
+        Score rows `keep` of the DP table in O(n) memory
+        (only the previous row is held while sweeping down)
+        """
+        gap = self._gap
+        dense = self.wpsm.dense
+        ramp = np.arange(len(codes2) + 1, dtype=np.int64) * gap
+        
+        row = ramp
+        rows = {0: row} if 0 in keep else {}
+        for i in range(1, len(codes1) + 1):
+            row, _ = self._next_row(row, dense[codes1[i - 1], codes2], i * gap, ramp)
+            if i in keep:
+                rows[i] = row
+        return rows
+    
+    def _best_cuts(self, codes1: np.ndarray, codes2: np.ndarray, rows: List[int]) -> List[int]:
+        """
+        For each row i in `rows`, the column where an optimal alignment
+        crosses it: leftmost argmax of forward + backward scores.
+        Leftmost crossings of every row lie on one optimal path, so the
+        cuts are consistent with each other.
+        """
+        m, n = len(codes1), len(codes2)
+        forward = self._last_rows(codes1, codes2, set(rows))
+        backward = self._last_rows(codes1[::-1], codes2[::-1], {m - i for i in rows})
+        cuts = [
+            int(np.argmax(forward[i] + backward[m - i][::-1]))
+            for i in rows
+        ]
+        return list(np.maximum.accumulate(cuts)) if cuts else []
+    
+    def _traceback(self, seq1, seq2, trace) -> Tuple[List[str], List[str]]:
+        """Walk the traceback table from the corner (built backwards, reversed once)"""
         aligned1, aligned2 = [], []
-        i, j = m, n
+        i, j = len(seq1), len(seq2)
         
         while i > 0 or j > 0:
-            if i > 0 and j > 0 and trace[i][j] == 0:
-                aligned1.insert(0, seq1[i-1])
-                aligned2.insert(0, seq2[j-1])
+            move = trace[i, j]
+            if i > 0 and j > 0 and move == self.DIAG:
+                aligned1.append(seq1[i-1])
+                aligned2.append(seq2[j-1])
                 i -= 1
                 j -= 1
-            elif i > 0 and trace[i][j] == 1:
-                aligned1.insert(0, seq1[i-1])
-                aligned2.insert(0, '-')
+            elif i > 0 and move == self.UP:
+                aligned1.append(seq1[i-1])
+                aligned2.append('-')
                 i -= 1
             else:
-                aligned1.insert(0, '-')
-                aligned2.insert(0, seq2[j-1])
+                aligned1.append('-')
+                aligned2.append(seq2[j-1])
                 j -= 1
         
-        return aligned1, aligned2, score[m][n]
+        aligned1.reverse()
+        aligned2.reverse()
+        return aligned1, aligned2
+    
+    def _align_full(self, seq1, seq2, codes2=None) -> Tuple[List[str], List[str], int]:
+        score, trace = self.fill(seq1, seq2, codes2)
+        aligned1, aligned2 = self._traceback(seq1, seq2, trace)
+        return aligned1, aligned2, int(score[-1, -1])
+    
+    def _align_linear(self, seq1, seq2, codes2=None) -> Tuple[List[str], List[str], int]:
+        """Hirschberg: split seq1 in half, find where the path crosses, recurse"""
+        m, n = len(seq1), len(seq2)
+        if m <= 1 or (m + 1) * (n + 1) <= self.max_cells:
+            return self._align_full(seq1, seq2, codes2)
+        
+        mid = m // 2
+        if codes2 is None:
+            codes2 = self.wpsm.encode(seq2)
+        (cut,) = self._best_cuts(self.wpsm.encode(seq1), codes2, [mid])
+        
+        top1, top2, top = self._align_linear(seq1[:mid], seq2[:cut], codes2[:cut])
+        bottom1, bottom2, bottom = self._align_linear(seq1[mid:], seq2[cut:], codes2[cut:])
+        return top1 + bottom1, top2 + bottom2, top + bottom
+    
+    def _align_segmented(
+        self,
+        seq1: List[str],
+        seq2: List[str],
+        boundaries: Sequence[int],
+        executor: Optional[Executor] = None,
+        codes2: Optional[np.ndarray] = None
+    ) -> Tuple[List[str], List[str], int]:
+        """
+        Cut seq2 (the reference) at word boundaries into segments of at
+        least `segment_phonemes`, locate the matching cuts in seq1 with one
+        forward and one backward sweep, then align segment pairs
+        independently (in parallel when an executor is given)
+        """
+        n = len(seq2)
+        rows, last = [], 0
+        for b in sorted(set(boundaries)):
+            if b - last >= self.segment_phonemes and n - b >= self.segment_phonemes:
+                rows.append(b)
+                last = b
+        if codes2 is None:
+            codes2 = self.wpsm.encode(seq2)
+        if not rows:
+            return self._align_linear(seq1, seq2, codes2)
+        
+        # Reference as rows: the DP is symmetric in its two sequences
+        cuts = self._best_cuts(codes2, self.wpsm.encode(seq1), rows)
+        ref_edges = [0, *rows, n]
+        spoken_edges = [0, *cuts, len(seq1)]
+        pairs = [
+            (
+                seq1[spoken_edges[k]:spoken_edges[k + 1]],
+                seq2[ref_edges[k]:ref_edges[k + 1]],
+                codes2[ref_edges[k]:ref_edges[k + 1]]
+            )
+            for k in range(len(rows) + 1)
+        ]
+        
+        align = lambda pair: self._align_linear(*pair)
+        results = list(executor.map(align, pairs) if executor else map(align, pairs))
+        
+        aligned1 = [p for r in results for p in r[0]]
+        aligned2 = [p for r in results for p in r[1]]
+        return aligned1, aligned2, sum(r[2] for r in results)
+    
+    def align(
+        self,
+        seq1: List[str],
+        seq2: List[str],
+        boundaries: Optional[Sequence[int]] = None,
+        executor: Optional[Executor] = None,
+        codes2: Optional[np.ndarray] = None
+    ) -> Tuple[List[str], List[str], float]:
+        """
+        Align two phoneme sequences
+        
+        Args:
+            seq1: Spoken phonemes
+            seq2: Reference phonemes
+            boundaries: Optional word end offsets in seq2, enables the
+                segmented mode for long inputs
+            executor: Optional executor to align segments in parallel
+            codes2: Optional WPSM codes of seq2 (e.g. Reference.codes),
+                saves encoding the reference again
+        """
+        if (len(seq1) + 1) * (len(seq2) + 1) <= self.max_cells:
+            aligned1, aligned2, score = self._align_full(seq1, seq2, codes2)
+        elif boundaries:
+            aligned1, aligned2, score = self._align_segmented(seq1, seq2, boundaries, executor, codes2)
+        else:
+            aligned1, aligned2, score = self._align_linear(seq1, seq2, codes2)
+        return aligned1, aligned2, score / WPSM.SCALE
+    
+    # ------------------------------------------------------------------
+    # Reference lattice: every word has one or more pronunciations
+    # ------------------------------------------------------------------
+    
+    def _lattice_pass(
+        self,
+        words: List[List[List[str]]],
+        spoken_codes: np.ndarray,
+        trace: bool = False
+    ) -> Tuple[np.ndarray, List]:
+        """
+        Sweep the reference lattice down, one reference phoneme per row and
+        one column per spoken phoneme (the DP is symmetric). Every variant
+        of a word starts from the word's entry row; variants sharing a
+        prefix share its rows. The word's exit row is the column-wise best
+        of its variants, the first variant winning ties.
+        
+        Returns the last exit row and, with `trace`, per word the traceback
+        rows of each variant and the winning variant of each column
+        """
+        gap = self._gap
+        # Encode first: unknown symbols grow the dense matrix
+        encoded = [[self.wpsm.encode(variant) for variant in variants] for variants in words]
+        # Substitution row of every reference code against the spoken
+        # phonemes, gathered once for the whole pass
+        by_code = np.ascontiguousarray(self.wpsm.dense.T[:, spoken_codes])
+        ramp = np.arange(len(spoken_codes) + 1, dtype=np.int64) * gap
+        
+        row, steps = ramp, []
+        for variants, variant_codes in zip(words, encoded):
+            prefixes = {}
+            exit_row, choice, traces = None, None, []
+            for v, (variant, codes) in enumerate(zip(variants, variant_codes)):
+                r, rows_trace = row, []
+                for k in range(len(codes)):
+                    key = tuple(variant[:k + 1])
+                    if key not in prefixes:
+                        prefixes[key] = self._next_row(r, by_code[codes[k]], r[0] + gap, ramp)
+                    r, row_trace = prefixes[key]
+                    rows_trace.append(row_trace)
+                traces.append(rows_trace)
+                if exit_row is None:
+                    exit_row, choice = r, np.zeros(len(r), dtype=np.intp)
+                else:
+                    better = r > exit_row
+                    exit_row = np.where(better, r, exit_row)
+                    choice[better] = v
+            row = exit_row
+            if trace:
+                steps.append((traces, choice))
+        return row, steps
+    
+    def _align_lattice_full(
+        self,
+        spoken: List[str],
+        words: List[List[List[str]]]
+    ) -> Tuple[List[str], List[str], int, List[int]]:
+        """Lattice DP with traceback rows kept; walks back word by word"""
+        row, steps = self._lattice_pass(words, self.wpsm.encode(spoken), trace=True)
+        
+        aligned1, aligned2, chosen = [], [], []
+        j = len(spoken)
+        for variants, (traces, choice) in zip(reversed(words), reversed(steps)):
+            v = int(choice[j])
+            chosen.append(v)
+            variant, rows_trace = variants[v], traces[v]
+            k = len(variant)
+            while k > 0:
+                move = rows_trace[k - 1][j]
+                if j > 0 and move == self.DIAG:
+                    aligned1.append(spoken[j - 1])
+                    aligned2.append(variant[k - 1])
+                    k -= 1
+                    j -= 1
+                elif j == 0 or move == self.UP:
+                    aligned1.append('-')
+                    aligned2.append(variant[k - 1])
+                    k -= 1
+                else:
+                    aligned1.append(spoken[j - 1])
+                    aligned2.append('-')
+                    j -= 1
+        # Spoken phonemes before the first word
+        while j > 0:
+            aligned1.append(spoken[j - 1])
+            aligned2.append('-')
+            j -= 1
+        
+        aligned1.reverse()
+        aligned2.reverse()
+        chosen.reverse()
+        return aligned1, aligned2, int(row[-1]), chosen
+    
+    def _align_lattice(
+        self,
+        spoken: List[str],
+        words: List[List[List[str]]]
+    ) -> Tuple[List[str], List[str], int, List[int]]:
+        """Hirschberg over words: split the lattice between two words, recurse"""
+        rows = sum(len(variant) for variants in words for variant in variants)
+        if len(words) <= 1 or rows * (len(spoken) + 1) <= self.max_cells:
+            return self._align_lattice_full(spoken, words)
+        
+        mid = len(words) // 2
+        codes = self.wpsm.encode(spoken)
+        forward, _ = self._lattice_pass(words[:mid], codes)
+        backward, _ = self._lattice_pass(
+            [[variant[::-1] for variant in variants] for variants in reversed(words[mid:])],
+            codes[::-1]
+        )
+        cut = int(np.argmax(forward + backward[::-1]))
+        
+        top1, top2, top, top_chosen = self._align_lattice(spoken[:cut], words[:mid])
+        bottom1, bottom2, bottom, bottom_chosen = self._align_lattice(spoken[cut:], words[mid:])
+        return top1 + bottom1, top2 + bottom2, top + bottom, top_chosen + bottom_chosen
+    
+    def align_variants(
+        self,
+        seq1: List[str],
+        words: List[List[List[str]]]
+    ) -> Tuple[List[str], List[str], float, List[int]]:
+        """
+        Align spoken phonemes against a reference whose words each have
+        one or more pronunciations, choosing the variant of every word
+        inside the same DP (no enumeration of sentence variants)
+        
+        `seq1` must come from an independent recognizer: phonemes derived
+        from one variant (as compare_recording's are) would favour any
+        variant that skips their mismatches
+        
+        Args:
+            seq1: Spoken phonemes
+            words: Per reference word, its phoneme sequences
+        
+        Returns:
+            (aligned spoken, aligned reference, score, chosen variant index per word)
+        """
+        aligned1, aligned2, score, chosen = self._align_lattice(seq1, words)
+        return aligned1, aligned2, score / WPSM.SCALE, chosen
 
 
 # ============================================================================
@@ -180,33 +592,79 @@ class NeedlemanWunschAligner:
 class PronunciationMetrics:
     """Calculate MSS and MIR"""
     
-    def __init__(self, wpsm: WPSM):
-        self.aligner = NeedlemanWunschAligner(wpsm)
+    def __init__(self, wpsm: WPSM, max_cells: int = 1_000_000, segment_phonemes: int = 48):
+        self.aligner = NeedlemanWunschAligner(
+            wpsm, max_cells=max_cells, segment_phonemes=segment_phonemes
+        )
         self.wpsm = wpsm
     
     def identity_score(self, phonemes: List[str]) -> float:
         """Score when comparing to itself"""
+        if self.aligner.gap_penalty <= 0 and self.wpsm.is_diagonal_dominant():
+            # No gap or substitution can beat matching every phoneme with
+            # itself, so the alignment is the diagonal: sum the self scores
+            codes = self.wpsm.encode(phonemes)
+            return int(self.wpsm.dense[codes, codes].sum()) / WPSM.SCALE
         _, _, score = self.aligner.align(phonemes, phonemes)
         return score
     
+    def _mss_from_score(self, score: float, spoken: List[str], reference: List[str]) -> float:
+        avg_len = (len(spoken) + len(reference)) / 2
+        return score / avg_len if avg_len > 0 else 0
+    
+    def _mir_from_score(
+        self, score: float, reference: List[str], identity: Optional[float] = None
+    ) -> float:
+        id_score = self.identity_score(reference) if identity is None else identity
+        return (score / id_score * 100) if id_score > 0 else 0
+    
     def mss(self, spoken: List[str], reference: List[str]) -> float:
         """Mean Similarity Score"""
         _, _, score = self.aligner.align(spoken, reference)
-        avg_len = (len(spoken) + len(reference)) / 2
-        return score / avg_len if avg_len > 0 else 0
+        return self._mss_from_score(score, spoken, reference)
     
     def mir(self, spoken: List[str], reference: List[str]) -> float:
         """Mean Identity Ratio (%)"""
         _, _, sim_score = self.aligner.align(spoken, reference)
-        id_score = self.identity_score(reference)
-        return (sim_score / id_score * 100) if id_score > 0 else 0
+        return self._mir_from_score(sim_score, reference)
     
-    def detailed_analysis(self, spoken: List[str], reference: List[str]) -> Dict:
-        """Complete analysis"""
-        aligned_spoken, aligned_ref, score = self.aligner.align(spoken, reference)
+    def detailed_analysis(
+        self,
+        spoken: List[str],
+        reference: List[str],
+        boundaries: Optional[List[int]] = None,
+        phoneme_scores: Optional[List[Dict]] = None,
+        variants: Optional[List[List[List[str]]]] = None,
+        identity: Optional[float] = None,
+        codes: Optional[np.ndarray] = None
+    ) -> Dict:
+        """
+        Complete analysis (one alignment shared by every metric)
+        `boundaries` are word end offsets in `reference`; long passages are
+        then aligned word-segment by word-segment. `phoneme_scores` are the
+        per-reference-phoneme acoustic deviations, reported as-is.
+        With `variants` (every pronunciation of each reference word) the
+        best-matching one is chosen per word and becomes the reference;
+        only for spoken phonemes independent of `reference` (a phoneme
+        recognizer), see score_recording.
+        `identity` and `codes` are the precomputed identity_score and WPSM
+        codes of `reference`
+        """
+        chosen = None
+        if variants and any(len(word) > 1 for word in variants):
+            aligned_spoken, aligned_ref, score, chosen = self.aligner.align_variants(spoken, variants)
+            chosen_reference = [p for word, v in zip(variants, chosen) for p in word[v]]
+            if chosen_reference != reference:
+                reference, identity = chosen_reference, None
+        else:
+            aligned_spoken, aligned_ref, score = self.aligner.align(
+                spoken, reference, boundaries, codes2=codes
+            )
+            if variants:
+                chosen = [0] * len(variants)
         
-        mss_val = self.mss(spoken, reference)
-        mir_val = self.mir(spoken, reference)
+        mss_val = self._mss_from_score(score, spoken, reference)
+        mir_val = self._mir_from_score(score, reference, identity)
         
         # Create alignment visualization
         errors = []
@@ -236,7 +694,7 @@ class PronunciationMetrics:
             quality = "very_poor"
             feedback = "Needs significant improvement. 💪"
         
-        return {
+        analysis = {
             'mss': round(mss_val, 2),
             'mir': round(mir_val, 1),
             'quality': quality,
@@ -248,26 +706,276 @@ class PronunciationMetrics:
             'reference_phonemes': ' '.join(reference),
             'spoken_phonemes': ' '.join(spoken)
         }
+        
+        if chosen is not None:
+            analysis['word_variants'] = [
+                {'variant': v, 'phonemes': ' '.join(word[v])}
+                for word, v in zip(variants, chosen)
+            ]
+        
+        if phoneme_scores is not None:
+            analysis['phoneme_scores'] = phoneme_scores
+            analysis['acoustic_score'] = round(
+                float(np.mean([p['score'] for p in phoneme_scores])), 1
+            ) if phoneme_scores else 0.0
+        
+        return analysis
 
 
-# ============================================================================
-# SIMPLIFIED FORCED ALIGNMENT (No external dependencies)
-# ============================================================================
+def normalize_text(text: str) -> str:
+    """Cache key of an expected text: case, spacing and punctuation don't matter"""
+    return " ".join(tokenize(text))
+
 
-class SimpleAligner:
-    """Simplified alignment without external tools"""
+class Reference:
+    """
+    Everything derived from an expected text, computed once per text
     
-    def __init__(self, cmudict: CMUDictLoader):
-        self.cmudict = cmudict
+    - phonemes / codes: first pronunciation of each word, and its WPSM codes
+      (handed to the aligner, the reference is never encoded per request)
+    - boundaries: word end offsets in `phonemes`
+    - variants: every pronunciation of each word (for recognizer output;
+      acoustic scoring uses `phonemes` only)
+    - identity: identity_score of `phonemes` (MIR denominator)
+    - features: MFCCs of the TTS reference, None if unavailable (no scoring)
+    """
     
-    def extract_phonemes_from_audio(self, audio_path: str, text: str) -> List[str]:
-        """
-        Simplified: Just return reference phonemes
-        In production, use proper forced alignment (Gentle, MFA, etc.)
-        """
-        # For now, return reference phonemes
-        # TODO: Implement actual forced alignment
-        return self.cmudict.sentence_to_phonemes(text)
+    def __init__(
+        self,
+        text: str,
+        phonemes: List[str],
+        codes: np.ndarray,
+        boundaries: List[int],
+        variants: List[List[List[str]]],
+        identity: float,
+        features: Optional[np.ndarray] = None
+    ):
+        self.text = text
+        self.phonemes = phonemes
+        self.codes = codes
+        self.boundaries = boundaries
+        self.variants = variants
+        self.identity = identity
+        self.features = features
+    
+    def nbytes(self) -> int:
+        """Approximate size, for cache accounting"""
+        size = self.codes.nbytes + 64 * len(self.phonemes)
+        return size + (self.features.nbytes if self.features is not None else 0)
+
+
+def score_recording(
+    metrics: "PronunciationMetrics",
+    waveform: np.ndarray,
+    reference: Reference,
+    acoustic_params: Optional[Dict] = None
+) -> Dict:
+    """
+    Analysis of one recording, a mono waveform at the analysis rate (blocking)
+    
+    The spoken phonemes come from the acoustic comparison with the TTS
+    reference: the reference phonemes (first CMUDict pronunciation of each
+    word), with those that don't sound like the TTS voice marked as
+    deviating. They are scored against that same pronunciation, without
+    the variant lattice: a gap costs less than a mismatch, so the lattice
+    would pick whichever shorter variant drops the deviating phonemes and
+    forgive exactly the mistakes the comparison found. Without
+    reference features there is nothing to compare the recording with, so
+    this raises ScoringUnavailableError rather than scoring the reference
+    against itself. A silent recording raises EmptyRecordingError
+    """
+    if reference.features is None:
+        raise ScoringUnavailableError(
+            f"Acoustic scoring unavailable: no TTS reference for '{reference.text[:40]}'"
+        )
+    try:
+        spoken, deviations = compare_recording(
+            waveform, reference.features, reference.phonemes, **(acoustic_params or {})
+        )
+    except AppException:
+        raise
+    except Exception as e:
+        logger.error(f"❌ Acoustic comparison failed: {e}")
+        raise ScoringUnavailableError(f"Acoustic comparison failed: {str(e) or type(e).__name__}")
+    
+    return metrics.detailed_analysis(
+        spoken,
+        reference.phonemes,
+        reference.boundaries,
+        deviations,
+        identity=reference.identity,
+        codes=reference.codes
+    )
+
+
+def timed_score_recording(
+    metrics: "PronunciationMetrics",
+    waveform: np.ndarray,
+    reference: Reference,
+    acoustic_params: Optional[Dict] = None
+) -> Tuple[Dict, float]:
+    """(score_recording, seconds it took): timed where it runs, so time
+    spent waiting for a thread or process is not counted as inference"""
+    start = time.perf_counter()
+    analysis = score_recording(metrics, waveform, reference, acoustic_params)
+    return analysis, time.perf_counter() - start
+
+
+class LiveSession:
+    """
+    One learner speaking `text` while audio streams in
+    
+    `feed` takes 16-bit little-endian mono PCM chunks, advances an online
+    DTW against the TTS reference and returns partial per-word scores.
+    `finish` scores the whole recording exactly like an upload
+    (score_recording), so the final analysis is ready as soon as the
+    learner stops. Sessions are only started with an acoustic reference
+    (PronunciationService.start_live_session).
+    
+    Audio is kept as received: the online DTW gets it through a streaming
+    resampler (no filter edges at chunk boundaries), `finish` resamples
+    the whole recording once, like an upload.
+    """
+    
+    def __init__(
+        self,
+        metrics: PronunciationMetrics,
+        reference: Reference,
+        acoustic_params: Optional[Dict],
+        input_rate: int,
+        window_frames: int
+    ):
+        self.metrics = metrics
+        self.reference = reference
+        self.text = reference.text
+        self.words = reference.text.split()
+        self.acoustic_params = acoustic_params
+        self.input_rate = input_rate
+        self.sample_rate = (acoustic_params or {}).get(
+            "sample_rate", get_settings().ACOUSTIC_SAMPLE_RATE
+        )
+        
+        self.online: Optional[OnlineDTW] = None
+        if reference.features is not None:
+            params = acoustic_params or {}
+            self.online = OnlineDTW(
+                reference.features,
+                reference.phonemes,
+                sample_rate=self.sample_rate,
+                n_mfcc=params.get("n_mfcc", 13),
+                hop_ms=params.get("hop_ms", 10.0),
+                deviation_scale=params.get("deviation_scale", 4.0),
+                window_frames=window_frames
+            )
+        # Word index of every reference phoneme
+        lengths = np.diff([0, *reference.boundaries, len(reference.phonemes)])
+        self._phoneme_word = np.repeat(np.arange(len(lengths)), lengths)
+        
+        self._audio: List[np.ndarray] = []  # at input_rate
+        self._odd_byte = b""
+        self._resampler = None
+        if input_rate != self.sample_rate:
+            import soxr
+            self._resampler = soxr.ResampleStream(input_rate, self.sample_rate, 1, dtype="float32")
+        self.chunks = 0
+        self.dropped = 0
+        self.latencies: List[float] = []
+    
+    @property
+    def seconds(self) -> float:
+        """Audio received so far, in seconds"""
+        return sum(len(a) for a in self._audio) / self.input_rate
+    
+    def describe(self) -> Dict:
+        return {
+            "text": self.text,
+            "words": self.words,
+            "reference_phonemes": " ".join(self.reference.phonemes),
+            "sample_rate": self.input_rate,
+            "acoustic": self.online is not None
+        }
+    
+    def _decode(self, chunk: bytes) -> np.ndarray:
+        """Samples at input_rate; a sample split across chunks is joined"""
+        data = self._odd_byte + chunk
+        end = len(data) // 2 * 2
+        self._odd_byte = data[end:]
+        return np.frombuffer(data[:end], dtype="<i2").astype(np.float32) / 32768.0
+    
+    def _word_scores(self) -> List[Dict]:
+        """Scores of the words reached so far; phonemes passed over without
+        a single frame count as 0"""
+        current = self.online.current_phoneme
+        if current < 0:
+            return []
+        scores = self.online.phoneme_scores()
+        reached = np.arange(len(scores)) <= current
+        scores = np.where(reached & np.isnan(scores), 0.0, scores)
+        current_word = int(self._phoneme_word[current])
+        
+        words = []
+        for w in range(current_word + 1):
+            word_scores = scores[(self._phoneme_word == w) & reached]
+            words.append({
+                "index": w,
+                "word": self.words[w] if w < len(self.words) else None,
+                "score": round(float(word_scores.mean()), 1) if len(word_scores) else None,
+                "status": "current" if w == current_word else "done"
+            })
+        return words
+    
+    def feed(self, chunk: bytes) -> Dict:
+        """Process one PCM chunk (blocking); returns the partial result"""
+        samples = self._decode(chunk)
+        self._audio.append(samples)
+        self.chunks += 1
+        
+        partial = {"chunk": self.chunks, "seconds": round(self.seconds, 2), "dropped": self.dropped}
+        if self.online is not None:
+            if self._resampler is not None:
+                samples = self._resampler.resample_chunk(samples)
+            self.online.feed(samples)
+            partial["frames"] = self.online.frames
+            partial["progress"] = round(
+                (self.online.position + 1) / len(self.online.reference), 3
+            ) if self.online.frames else 0.0
+            partial["words"] = self._word_scores()
+        return partial
+    
+    def record_latency(self, seconds: float):
+        self.latencies.append(seconds)
+    
+    def stats(self) -> Dict:
+        latencies = np.array(self.latencies) * 1000
+        return {
+            "chunks": self.chunks,
+            "dropped": self.dropped,
+            "seconds": round(self.seconds, 2),
+            "latency_p50_ms": round(float(np.percentile(latencies, 50)), 2) if len(latencies) else None,
+            "latency_p95_ms": round(float(np.percentile(latencies, 95)), 2) if len(latencies) else None,
+            "latency_max_ms": round(float(latencies.max()), 2) if len(latencies) else None
+        }
+    
+    def finish(self) -> Dict:
+        """Final analysis of everything received (blocking)"""
+        waveform = np.concatenate(self._audio) if self._audio else np.zeros(0, dtype=np.float32)
+        if self._resampler is not None and len(waveform):
+            import librosa
+            waveform = librosa.resample(waveform, orig_sr=self.input_rate, target_sr=self.sample_rate)
+        return score_recording(self.metrics, waveform, self.reference, self.acoustic_params)
+
+
+def _with_time_saved(trim: Dict, scoring_s: float) -> Dict:
+    """
+    VAD report plus the scoring time the trimmed samples would have cost
+    (feature extraction and banded DTW are linear in the recording length)
+    """
+    kept = max(trim["samples_out"], 1)
+    return {
+        **trim,
+        "scoring_ms": round(1000 * scoring_s, 3),
+        "estimated_time_saved_ms": round(1000 * scoring_s * trim["samples_removed"] / kept, 3)
+    }
 
 
 # ============================================================================
@@ -277,26 +985,170 @@ class SimpleAligner:
 class PronunciationService:
     """Main pronunciation analysis service"""
     
-    def __init__(self):
+    def __init__(self, tts_service=None, g2p: Optional[G2P] = None):
         logger.info("🔧 Initializing Pronunciation Service...")
         
-        self.cmudict = CMUDictLoader()
+        settings = get_settings()
+        # Out-of-vocabulary words are spelled out instead of becoming 'UNK'
+        self.g2p = g2p or G2P(settings.G2P_CACHE_ITEMS)
+        self.cmudict = CMUDictLoader(g2p=self.g2p)
         self.wpsm = WPSM()
-        self.metrics = PronunciationMetrics(self.wpsm)
-        self.aligner = SimpleAligner(self.cmudict)
+        self.metrics = PronunciationMetrics(
+            self.wpsm,
+            max_cells=settings.PRONUNCIATION_MAX_ALIGN_CELLS,
+            segment_phonemes=settings.PRONUNCIATION_SEGMENT_PHONEMES
+        )
+        
+        # Acoustic scoring against a TTS reference (needs a TTS service)
+        self.acoustic: Optional[AcousticService] = None
+        if tts_service is not None and settings.ENABLE_ACOUSTIC_SCORING:
+            self.acoustic = AcousticService(tts_service)
+        
+        # Every recording is decoded to mono float32 at this rate, once
+        self.sample_rate = settings.ACOUSTIC_SAMPLE_RATE
+        
+        # Reference data per normalized expected text
+        self.references = LRUCache(
+            max_items=settings.PRONUNCIATION_REFERENCE_CACHE_ITEMS,
+            sizeof=lambda reference: reference.nbytes()
+        )
+        
+        # Finished analyses by upload content (audio bytes + normalized text),
+        # so retried or resubmitted takes are not scored again
+        self.analyses = LRUCache(
+            max_items=settings.PRONUNCIATION_RESULT_CACHE_ITEMS,
+            ttl_seconds=settings.PRONUNCIATION_RESULT_CACHE_TTL_SECONDS
+        )
+        self.saved_seconds = 0.0
+        # Single analyses handed to asyncio.to_thread and not finished
+        self.scoring_pending = 0
+        
+        # Worker processes for batch scoring, started on the first batch
+        self.pool = PronunciationPool(
+            workers=settings.PRONUNCIATION_WORKERS or os.cpu_count() or 1,
+            max_cells=settings.PRONUNCIATION_MAX_ALIGN_CELLS,
+            segment_phonemes=settings.PRONUNCIATION_SEGMENT_PHONEMES
+        )
         
         logger.info("✅ Pronunciation Service ready")
     
+    async def _reference_features(self, text: str) -> Optional[np.ndarray]:
+        """TTS reference MFCCs, or None (recordings can't be scored) if unavailable"""
+        if self.acoustic is None:
+            return None
+        try:
+            return await self.acoustic.reference_features(text)
+        except Exception as e:
+            logger.warning(f"⚠️ No acoustic reference for '{text[:30]}': {e}")
+            return None
+    
+    def load_recording(self, source) -> np.ndarray:
+        """
+        Decode an uploaded recording (open file or path) to a mono float32
+        array at the analysis rate (blocking)
+        """
+        try:
+            return load_audio(source, self.sample_rate)
+        except Exception as e:
+            raise ValidationError(f"Could not decode audio: {e}")
+    
+    def upload_key(self, source, text: str) -> str:
+        """
+        Content address of an upload (open file): SHA-256 of the audio bytes
+        and the normalized expected text (blocking; rewinds the file)
+        """
+        digest = hashlib.sha256()
+        source.seek(0)
+        for block in iter(lambda: source.read(1 << 20), b""):
+            digest.update(block)
+        source.seek(0)
+        digest.update(b"\0" + normalize_text(text).encode("utf-8"))
+        return digest.hexdigest()
+    
+    def cached_analysis(self, key: str) -> Optional[Dict]:
+        """Analysis of an identical earlier upload, marked as a cache hit"""
+        entry = self.analyses.get(key)
+        if entry is None:
+            return None
+        analysis, seconds, stored_at = entry
+        self.saved_seconds += seconds
+        logger.info(f"♻️ Repeated upload {key[:12]}, analysis reused ({seconds * 1000:.0f} ms saved)")
+        return {
+            **analysis,
+            "cache": {
+                "hit": True,
+                "key": key,
+                "age_s": round(time.time() - stored_at, 1),
+                "saved_ms": round(seconds * 1000, 1)
+            }
+        }
+    
+    def remember_analysis(self, key: str, analysis: Dict, seconds: float) -> Dict:
+        """Cache a fresh analysis that took `seconds` to produce; returns it marked as a miss"""
+        self.analyses.set(key, (analysis, seconds, time.time()))
+        return {**analysis, "cache": {"hit": False, "key": key}}
+    
+    def prepare_recording(self, waveform: np.ndarray) -> Tuple[np.ndarray, Optional[Dict]]:
+        """
+        Trim a decoded recording to its speech and normalize its loudness
+        (see vad.prepare_recording); raises EmptyRecordingError or
+        ClippedRecordingError. Unchanged, with no report, if VAD is disabled
+        """
+        settings = get_settings()
+        if not settings.PRONUNCIATION_VAD_ENABLED:
+            return waveform, None
+        return prepare_recording(
+            waveform,
+            self.sample_rate,
+            top_db=settings.PRONUNCIATION_VAD_TOP_DB,
+            pad_ms=settings.PRONUNCIATION_VAD_PAD_MS,
+            min_speech_ms=settings.PRONUNCIATION_MIN_SPEECH_MS,
+            target_dbfs=settings.PRONUNCIATION_TARGET_DBFS,
+            max_clipped_ratio=settings.PRONUNCIATION_MAX_CLIPPED_RATIO
+        )
+    
+    def reference_for(self, text: str) -> Tuple[List[str], List[int], List[List[List[str]]]]:
+        """
+        Reference phonemes of `text` (first pronunciation of each word), the
+        word end offsets within them, and every pronunciation of each word
+        """
+        variants = self.cmudict.sentence_to_word_variants(text)
+        ref_words = [word[0] for word in variants]
+        ref_phonemes = [p for word in ref_words for p in word]
+        boundaries = np.cumsum([len(word) for word in ref_words])[:-1].tolist()
+        return ref_phonemes, boundaries, variants
+    
+    async def get_reference(self, text: str) -> Reference:
+        """
+        Reference data of an expected text, from the cache when the text
+        (case and spacing aside) was seen before. Acoustic features that
+        could not be built are retried on the next request
+        """
+        key = normalize_text(text)
+        reference = self.references.get(key)
+        if reference is None:
+            phonemes, boundaries, variants = self.reference_for(key)
+            codes = self.wpsm.encode(phonemes)
+            reference = Reference(
+                key, phonemes, codes, boundaries, variants, self.metrics.identity_score(phonemes)
+            )
+        elif reference.features is not None or self.acoustic is None:
+            return reference
+        
+        reference.features = await self._reference_features(key)
+        self.references.set(key, reference)
+        return reference
+    
     async def analyze_pronunciation(
         self,
-        audio_path: str,
+        waveform: np.ndarray,
         expected_text: str
     ) -> Dict:
         """
-        Analyze pronunciation from audio file
+        Analyze pronunciation from a recording
         
         Args:
-            audio_path: Path to recorded audio (WAV)
+            waveform: Recording as decoded by load_recording
             expected_text: What the user was supposed to say
             
         Returns:
@@ -304,22 +1156,39 @@ class PronunciationService:
         """
         try:
             logger.info(f"🎙️ Analyzing: {expected_text}")
-            logger.info(f"   Audio: {audio_path}")
+            logger.info(f"   Audio: {len(waveform) / self.sample_rate:.2f}s")
             
-            # Get reference phonemes
-            ref_phonemes = self.cmudict.sentence_to_phonemes(expected_text)
-            logger.info(f"   Reference: {' '.join(ref_phonemes)}")
+            # Silence off, loudness normalized; empty or clipped recordings
+            # are rejected before any reference work
+            waveform, trim = self.prepare_recording(waveform)
+            if trim:
+                logger.info(f"   Trimmed: {trim['seconds_removed']:.2f}s, gain {trim['gain_db']} dB")
             
-            # Extract spoken phonemes
-            # TODO: Replace with actual forced alignment
-            spoken_phonemes = self.aligner.extract_phonemes_from_audio(
-                audio_path, 
-                expected_text
-            )
-            logger.info(f"   Spoken: {' '.join(spoken_phonemes)}")
+            # Reference phonemes, word ends, identity score and TTS features
+            reference = await self.get_reference(expected_text)
+            logger.info(f"   Reference: {' '.join(reference.phonemes)}")
             
-            # Calculate metrics
-            analysis = self.metrics.detailed_analysis(spoken_phonemes, ref_phonemes)
+            # Compare the recording with the TTS reference and score
+            # (off the event loop)
+            start = time.perf_counter()
+            self.scoring_pending += 1
+            try:
+                analysis, seconds = await asyncio.to_thread(
+                    timed_score_recording,
+                    self.metrics,
+                    waveform,
+                    reference,
+                    self.acoustic.params if self.acoustic else None
+                )
+            finally:
+                self.scoring_pending -= 1
+            INFERENCE_SECONDS.labels("pronunciation").observe(seconds)
+            EXECUTOR_WAIT_SECONDS.labels("pronunciation_threads").observe(
+                max(time.perf_counter() - start - seconds, 0.0)
+            )
+            if trim:
+                analysis['preprocessing'] = _with_time_saved(trim, time.perf_counter() - start)
+            logger.info(f"   Spoken: {analysis['spoken_phonemes']}")
             
             logger.info(f"✅ Analysis complete: MIR={analysis['mir']}%")
             
@@ -329,13 +1198,130 @@ class PronunciationService:
             logger.error(f"❌ Analysis failed: {e}", exc_info=True)
             raise
     
+    async def start_live_session(self, text: str, input_rate: Optional[int] = None) -> LiveSession:
+        """
+        Prepare live scoring of `text`: reference phonemes and TTS features
+        are ready before the first chunk arrives
+        """
+        if not text.strip():
+            raise ValidationError("Expected text is empty")
+        input_rate = input_rate or self.sample_rate
+        if isinstance(input_rate, bool) or not isinstance(input_rate, int):
+            raise ValidationError(f"sample_rate must be an integer, got {input_rate!r}")
+        if not 8000 <= input_rate <= 96000:
+            raise ValidationError(f"Unsupported sample rate: {input_rate}")
+        
+        logger.info(f"🎙️ Live session: {text[:40]}")
+        reference = await self.get_reference(text)
+        if reference.features is None:
+            raise ScoringUnavailableError("Acoustic scoring unavailable: no TTS reference voice")
+        return LiveSession(
+            self.metrics,
+            reference,
+            self.acoustic.params if self.acoustic else None,
+            input_rate,
+            get_settings().PRONUNCIATION_STREAM_WINDOW_FRAMES
+        )
+    
+    async def analyze_batch(self, items: List[Tuple[np.ndarray, str]]) -> AsyncIterator[Dict]:
+        """
+        Score many (waveform, expected_text) pairs across the worker pool
+        
+        Yields one dict per recording as soon as it is scored (in completion
+        order, with its `index` in `items`), then a final `summary`.
+        References come from the cache, so each distinct text is prepared
+        at most once.
+        """
+        start = time.perf_counter()
+        distinct_texts = dict.fromkeys(text for _, text in items)
+        references = {text: await self.get_reference(text) for text in distinct_texts}
+        acoustic_params = self.acoustic.params if self.acoustic else None
+        logger.info(
+            f"🎙️ Batch of {len(items)} recordings ({len(references)} distinct texts)"
+        )
+        
+        async def score(index: int, waveform: np.ndarray, text: str) -> Dict:
+            try:
+                waveform, trim = self.prepare_recording(waveform)
+                if references[text].features is None:
+                    # Don't ship it to a worker just to fail there
+                    raise ScoringUnavailableError("Acoustic scoring unavailable: no TTS reference voice")
+                start = time.perf_counter()
+                result = await self.pool.score(waveform, references[text], acoustic_params)
+                if trim:
+                    result['preprocessing'] = _with_time_saved(trim, time.perf_counter() - start)
+                return {"index": index, "text": text, "result": result}
+            except AppException as e:
+                logger.warning(f"⚠️ Batch item {index} rejected: {e.message}")
+                return {"index": index, "text": text, "error": e.message, "error_type": e.error_type}
+            except Exception as e:
+                logger.error(f"❌ Batch item {index} failed: {e}")
+                return {"index": index, "text": text, "error": str(e)}
+        
+        tasks = [
+            asyncio.ensure_future(score(i, waveform, text))
+            for i, (waveform, text) in enumerate(items)
+        ]
+        failed = 0
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                item = await next_done
+                failed += "error" in item
+                yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+        
+        elapsed = time.perf_counter() - start
+        yield {
+            "summary": {
+                "recordings": len(items),
+                "succeeded": len(items) - failed,
+                "failed": failed,
+                "distinct_texts": len(references),
+                "workers": self.pool.workers,
+                "elapsed_s": round(elapsed, 3),
+                "recordings_per_s": round(len(items) / elapsed, 2) if elapsed else None
+            }
+        }
+    
+    def shutdown(self):
+        """Stop batch worker processes"""
+        self.pool.shutdown()
+    
+    def cache_counters(self) -> Dict[str, Dict]:
+        """Hits, misses, evictions and size per cache (O(1), for /metrics)"""
+        counters = {
+            "references": self.references.stats(),
+            "analyses": self.analyses.stats()
+        }
+        if self.acoustic is not None:
+            counters["acoustic_references"] = self.acoustic.reference_cache.stats()
+        return counters
+    
+    def get_stats(self) -> Dict:
+        """Reference and analysis caches, acoustic and batch pool statistics"""
+        return {
+            "references": self.references.stats(),
+            "analyses": {
+                **self.analyses.stats(),
+                "saved_s": round(self.saved_seconds, 3)
+            },
+            "g2p": self.g2p.get_stats(),
+            "acoustic": self.acoustic.get_stats() if self.acoustic else None,
+            "pool": self.pool.get_stats()
+        }
+    
     def get_word_pronunciation(self, word: str) -> Dict:
         """Get pronunciation for a single word"""
         phonemes = self.cmudict.get_pronunciation(word)
+        found = self.cmudict.in_dictionary(word)
         
         return {
             'word': word,
             'phonemes': phonemes,
             'phoneme_string': ' '.join(phonemes) if phonemes else None,
-            'found': len(phonemes) > 0
+            'variants': [' '.join(v) for v in self.cmudict.get_pronunciations(word)],
+            'found': found,
+            'source': 'cmudict' if found else 'g2p' if phonemes else None
         }
\ No newline at end of file
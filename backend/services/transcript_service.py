@@ -0,0 +1,263 @@
+# backend/services/transcript_service.py
+
+import asyncio
+import html
+import logging
+import re
+import time
+import uuid
+from typing import AsyncIterator, Callable, Dict, List, Optional
+
+from backend.core.config import get_settings
+from backend.core.exceptions import NotFoundError, ServiceBusyError, ValidationError
+from backend.services.g2p import tokenize
+
+logger = logging.getLogger(__name__)
+
+# Caption cues that are not speech: [Music], [Applause], (laughs)
+_CUE = re.compile(r"\[[^\]]*\]|\([^)]*\)")
+
+
+def clean_line(text: str) -> str:
+    """Caption text as spoken: entities decoded, cues dropped, spacing collapsed"""
+    return " ".join(_CUE.sub(" ", html.unescape(text)).split())
+
+
+class TranscriptJob:
+    """
+    One transcript being prepared; results are appended to `events` as
+    they are produced and replayed to every reader of the stream
+    """
+
+    def __init__(self, lines: List[Dict], position: float, voice_preset: str, speed: float):
+        self.id = uuid.uuid4().hex
+        self.voice_preset = voice_preset
+        self.speed = speed
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.status = "queued"  # queued -> running -> done | cancelled | failed
+
+        # Spoken lines in timestamp order; identical lines share one clip
+        self.lines = sorted(
+            (
+                {
+                    "index": i,
+                    "start": line["start"],
+                    "end": line["start"] + (line.get("duration") or 0.0),
+                    "text": clean_line(line["text"])
+                }
+                for i, line in enumerate(lines)
+            ),
+            key=lambda line: line["start"]
+        )
+        self.clips: Dict[str, List[int]] = {}
+        for line in self.lines:
+            if line["text"] and line["end"] >= position:
+                self.clips.setdefault(line["text"], []).append(line["index"])
+
+        # Vocabulary: unique words in order of first appearance
+        self.words = list(dict.fromkeys(
+            word for line in self.lines for word in tokenize(line["text"])
+        ))
+
+        self.events: List[Dict] = []
+        self.phonetics_done = 0
+        self.audio_done = 0
+        self.audio_failed = 0
+        self.task: Optional[asyncio.Task] = None
+        self._changed = asyncio.Condition()
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("done", "cancelled", "failed")
+
+    async def emit(self, event: Dict):
+        async with self._changed:
+            self.events.append(event)
+            self._changed.notify_all()
+
+    async def finish(self, status: str):
+        self.status = status
+        self.finished_at = time.time()
+        await self.emit({"type": "done", "status": status, "summary": self.describe()})
+
+    async def stream(self, since: int = 0) -> AsyncIterator[Dict]:
+        """Events from index `since` on, waiting for new ones until the job ends"""
+        i = since
+        while True:
+            async with self._changed:
+                await self._changed.wait_for(lambda: len(self.events) > i or self.done)
+                batch = self.events[i:]
+            for event in batch:
+                yield event
+            i += len(batch)
+            if self.done and i >= len(self.events):
+                return
+
+    def describe(self) -> Dict:
+        end = self.finished_at or time.time()
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "lines": len(self.lines),
+            "words": len(self.words),
+            "phonetics_done": self.phonetics_done,
+            "audio_total": len(self.clips),
+            "audio_done": self.audio_done,
+            "audio_failed": self.audio_failed,
+            "events": len(self.events),
+            "elapsed_s": round(end - self.created_at, 3)
+        }
+
+
+class TranscriptService:
+    """
+    Prepares a whole transcript ahead of playback
+
+    - every unique word gets its phonetics computed (PhoneticService cache)
+    - every upcoming line gets its audio synthesized, earliest first
+      (TTS cache and files)
+
+    so that word clicks and line replays during playback are cache hits.
+    Services are zero-argument getters (the dependency singletons); a
+    disabled subsystem is None and its part is skipped.
+    """
+
+    def __init__(self, phonetics: Optional[Callable] = None, tts: Optional[Callable] = None):
+        self.settings = get_settings()
+        self.phonetics = phonetics
+        self.tts = tts
+        self.jobs: Dict[str, TranscriptJob] = {}
+
+    def _prune(self):
+        """Forget finished jobs past their TTL"""
+        now = time.time()
+        for job_id, job in list(self.jobs.items()):
+            if job.finished_at and now - job.finished_at > self.settings.TRANSCRIPT_JOB_TTL_SECONDS:
+                del self.jobs[job_id]
+
+    def start(
+        self,
+        lines: List[Dict],
+        position: float = 0.0,
+        voice_preset: str = "v2/en_speaker_6",
+        speed: float = 1.0,
+        synthesize_audio: bool = True
+    ) -> TranscriptJob:
+        """
+        Register a job for timestamped lines ({start, duration?, text}) and
+        start it in the background; lines ending before `position` get no audio
+        """
+        if not lines:
+            raise ValidationError("Transcript has no lines")
+        if len(lines) > self.settings.TRANSCRIPT_MAX_LINES:
+            raise ValidationError(
+                f"Transcript has {len(lines)} lines (max {self.settings.TRANSCRIPT_MAX_LINES})"
+            )
+        self._prune()
+        active = sum(not job.done for job in self.jobs.values())
+        if active >= self.settings.TRANSCRIPT_MAX_ACTIVE_JOBS:
+            raise ServiceBusyError(f"{active} transcript jobs already running, retry later")
+
+        job = TranscriptJob(lines, position, voice_preset, speed)
+        if not synthesize_audio or self.tts is None:
+            job.clips = {}
+        self.jobs[job.id] = job
+        job.task = asyncio.ensure_future(self._run(job))
+        logger.info(
+            f"📜 Transcript job {job.id[:8]}: {len(job.lines)} lines, "
+            f"{len(job.words)} words, {len(job.clips)} clips"
+        )
+        return job
+
+    def get(self, job_id: str) -> TranscriptJob:
+        job = self.jobs.get(job_id)
+        if job is None:
+            raise NotFoundError(f"Transcript job not found: {job_id}")
+        return job
+
+    async def cancel(self, job_id: str) -> TranscriptJob:
+        job = self.get(job_id)
+        if job.task is not None and not job.task.done():
+            job.task.cancel()
+            try:
+                await job.task
+            except asyncio.CancelledError:
+                pass
+        return job
+
+    async def _run(self, job: TranscriptJob):
+        job.status = "running"
+        try:
+            await asyncio.gather(self._precompute_phonetics(job), self._synthesize_lines(job))
+        except asyncio.CancelledError:
+            await job.finish("cancelled")
+            raise
+        except Exception as e:
+            logger.error(f"❌ Transcript job {job.id[:8]} failed: {e}", exc_info=True)
+            await job.emit({"type": "error", "error": str(e)})
+            await job.finish("failed")
+            return
+        await job.finish("done")
+        logger.info(f"✅ Transcript job {job.id[:8]} done in {job.describe()['elapsed_s']}s")
+
+    async def _precompute_phonetics(self, job: TranscriptJob):
+        """
+        Phonetics of the vocabulary, emitted in batches
+        Runs on the event loop (PhoneticService and the G2P caches are not
+        thread-safe) and yields after every word, so requests served from
+        the same caches never wait more than one cold lookup
+        """
+        if self.phonetics is None or not job.words:
+            return
+        service = self.phonetics()
+        size = self.settings.TRANSCRIPT_PHONETICS_BATCH
+        for i in range(0, len(job.words), size):
+            words = []
+            for word in job.words[i:i + size]:
+                words += service.lookup_words([word])
+                await asyncio.sleep(0)
+            job.phonetics_done += len(words)
+            await job.emit({"type": "phonetics", "words": [w.model_dump() for w in words]})
+
+    async def _synthesize_lines(self, job: TranscriptJob):
+        """Line audio, earliest line first, by a few concurrent workers"""
+        if not job.clips:
+            return
+        service = self.tts()
+        # Shared iterator: each worker takes the next line in timestamp order
+        pending = iter(job.clips.items())
+
+        async def worker():
+            for text, indexes in pending:
+                try:
+                    audio = await service.generate_audio(text, job.voice_preset, job.speed)
+                except Exception as e:
+                    job.audio_failed += 1
+                    await job.emit({"type": "audio_error", "lines": indexes, "error": str(e)})
+                    continue
+                job.audio_done += 1
+                await job.emit({
+                    "type": "audio",
+                    "lines": indexes,
+                    "text": text,
+                    "audio_url": audio.audio_url,
+                    "duration": audio.duration
+                })
+
+        workers = min(self.settings.TRANSCRIPT_AUDIO_CONCURRENCY, len(job.clips))
+        await asyncio.gather(*(worker() for _ in range(workers)))
+
+    async def shutdown(self):
+        """Cancel running jobs"""
+        for job in list(self.jobs.values()):
+            if not job.done:
+                await self.cancel(job.id)
+
+    def get_stats(self) -> Dict:
+        return {
+            "jobs": len(self.jobs),
+            "active": sum(not job.done for job in self.jobs.values()),
+            "phonetics": self.phonetics is not None,
+            "audio": self.tts is not None
+        }
@@ -0,0 +1,368 @@
+# backend/services/tts_backends.py
+"""
+Pluggable TTS engines behind one contract:
+
+    backend.synthesize(text, voice) -> float32 waveform at backend.sample_rate
+
+Pick one with Settings.TTS_BACKEND. Every call is measured (latency,
+real-time factor, peak memory) so engines can be compared per deployment.
+"""
+
+import json
+import logging
+import threading
+import zlib
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Type
+
+import numpy as np
+
+from backend.core.config import Settings
+from backend.core.metrics import INFERENCE_SECONDS
+from backend.core.exceptions import ExternalServiceError, ValidationError
+from backend.core.profiling import CallMeter, bytes_to_mb
+from backend.services.inference_profile import InferenceProfile
+
+logger = logging.getLogger(__name__)
+
+# Speakers of tts_models/en/vctk/vits
+VCTK_SPEAKERS = [
+    "p225", "p226", "p227", "p228", "p229", "p230", "p231", "p232",
+    "p233", "p234", "p236", "p237", "p238", "p239", "p240", "p241",
+    "p243", "p244", "p245", "p246", "p247", "p248", "p249", "p250",
+    "p251", "p252", "p253", "p254", "p255", "p256", "p257", "p258",
+    "p259", "p260", "p261", "p262", "p263", "p264", "p265", "p266",
+    "p267", "p268", "p269", "p270", "p271", "p272", "p273", "p274",
+    "p275", "p276", "p277", "p278", "p279", "p280", "p281", "p282",
+    "p283", "p284", "p285", "p286", "p287", "p288", "p292", "p293",
+    "p294", "p295", "p297", "p298", "p299", "p300", "p301", "p302",
+    "p303", "p304", "p305", "p306", "p307", "p308", "p310", "p311",
+    "p312", "p313", "p314", "p316", "p317", "p318", "p323", "p326",
+    "p329", "p330", "p333", "p334", "p335", "p336", "p339", "p340",
+    "p341", "p343", "p345", "p347", "p351", "p360", "p361", "p362",
+    "p363", "p364", "p374", "p376"
+]
+
+# Bark-style presets (the API's voice_preset format) -> VCTK speakers
+VCTK_VOICE_MAP = {
+    "v2/en_speaker_0": "p225",  # Female, soft
+    "v2/en_speaker_1": "p226",  # Female, clear
+    "v2/en_speaker_2": "p227",  # Male, deep
+    "v2/en_speaker_3": "p228",  # Female, warm
+    "v2/en_speaker_4": "p229",  # Male, energetic
+    "v2/en_speaker_5": "p230",  # Female, professional
+    "v2/en_speaker_6": "p231",  # Male, neutral (default)
+    "v2/en_speaker_7": "p232",  # Female, friendly
+    "v2/en_speaker_8": "p233",  # Male, professional
+    "v2/en_speaker_9": "p234",  # Female, young
+    "default": "p231",          # Default male
+}
+
+TTS_BACKENDS: Dict[str, Type["TTSBackend"]] = {}
+
+
+def register_backend(name: str) -> Callable[[Type["TTSBackend"]], Type["TTSBackend"]]:
+    """Class decorator adding a backend to the registry"""
+    def decorator(cls: Type["TTSBackend"]) -> Type["TTSBackend"]:
+        cls.name = name
+        TTS_BACKENDS[name] = cls
+        return cls
+    return decorator
+
+
+def create_backend(settings: Settings, name: Optional[str] = None) -> "TTSBackend":
+    """Instantiate the backend selected in settings (or `name`)"""
+    if name is None:
+        # Legacy flag from the Bark days still wins if set
+        name = "bark" if settings.USE_TRANSFORMER_BARK else settings.TTS_BACKEND
+
+    backend_cls = TTS_BACKENDS.get(name)
+    if backend_cls is None:
+        raise ValueError(
+            f"Unknown TTS backend '{name}'. Available: {', '.join(sorted(TTS_BACKENDS))}"
+        )
+    return backend_cls(settings)
+
+
+class TTSBackend:
+    """Base class: subclasses implement _load() and _synthesize()"""
+
+    name = "base"
+    model_name: Optional[str] = None
+    voices: List[str] = []
+    default_voice = "default"
+
+    def __init__(self, settings: Settings):
+        self.settings = settings
+        self.loaded = False
+        self.sample_rate = 0
+        self._load_lock = threading.Lock()
+        self.stats = {
+            "calls": 0,
+            "total_latency_s": 0.0,
+            "max_latency_s": 0.0,
+            "last_latency_s": None,
+            "audio_seconds": 0.0,
+            "peak_rss_delta_mb": None,
+        }
+
+    def load(self):
+        """Load the model once (thread-safe, idempotent)"""
+        if self.loaded:
+            return
+        with self._load_lock:
+            if self.loaded:
+                return
+            try:
+                self._load()
+            except Exception as e:
+                logger.error(f"❌ Failed to load {self.name} backend: {e}")
+                raise ExternalServiceError(f"Failed to load TTS models: {e}", self.name)
+            self.loaded = True
+            logger.info(f"✅ {self.name} backend loaded ({self.model_name})")
+
+    def resolve_voice(self, voice_preset: Optional[str]) -> str:
+        """Map an API voice preset to this engine's voice id"""
+        if voice_preset in self.voices:
+            return voice_preset
+        return self.default_voice
+
+    def synthesize(self, text: str, voice: str) -> np.ndarray:
+        """Synthesize text, recording latency and peak memory"""
+        self.load()
+
+        with CallMeter() as meter:
+            waveform = np.asarray(self._synthesize(text, voice), dtype=np.float32)
+
+        stats = self.stats
+        stats["calls"] += 1
+        stats["total_latency_s"] += meter.latency_s
+        stats["max_latency_s"] = max(stats["max_latency_s"], meter.latency_s)
+        stats["last_latency_s"] = round(meter.latency_s, 4)
+        INFERENCE_SECONDS.labels(f"tts_{self.name}").observe(meter.latency_s)
+        stats["audio_seconds"] += len(waveform) / self.sample_rate
+        if meter.peak_rss_delta_bytes is not None:
+            peak_mb = bytes_to_mb(meter.peak_rss_delta_bytes)
+            stats["peak_rss_delta_mb"] = max(stats["peak_rss_delta_mb"] or 0.0, peak_mb)
+
+        return waveform
+
+    def get_stats(self) -> Dict:
+        """Per-backend measurement summary"""
+        stats = self.stats
+        calls = stats["calls"]
+        return {
+            "backend": self.name,
+            "model": self.model_name if self.loaded else None,
+            "loaded": self.loaded,
+            "calls": calls,
+            "avg_latency_s": round(stats["total_latency_s"] / calls, 4) if calls else None,
+            "max_latency_s": round(stats["max_latency_s"], 4),
+            "last_latency_s": stats["last_latency_s"],
+            "real_time_factor": (
+                round(stats["total_latency_s"] / stats["audio_seconds"], 4)
+                if stats["audio_seconds"] else None
+            ),
+            "peak_rss_delta_mb": stats["peak_rss_delta_mb"],
+            "inference_profile": (
+                self.profile.describe() if hasattr(self, "profile") else None
+            ),
+        }
+
+    def _load(self):
+        raise NotImplementedError
+
+    def _synthesize(self, text: str, voice: str) -> np.ndarray:
+        raise NotImplementedError
+
+
+@register_backend("coqui_vits")
+class CoquiVitsBackend(TTSBackend):
+    """Coqui TTS VITS (VCTK): fast, 109 English speakers"""
+
+    model_name = "tts_models/en/vctk/vits"
+    voices = VCTK_SPEAKERS
+    default_voice = VCTK_VOICE_MAP["default"]
+
+    def __init__(self, settings: Settings):
+        super().__init__(settings)
+        self.profile = InferenceProfile.from_settings(settings)
+        self.tts = None
+        self._device: Optional[str] = None
+
+    @property
+    def device(self) -> str:
+        """cuda if available, else cpu"""
+        if self._device is None:
+            import torch
+            self._device = "cuda" if torch.cuda.is_available() else "cpu"
+            logger.info(f"Using device: {self._device}")
+        return self._device
+
+    def _load(self):
+        logger.info("📥 Loading VITS model...")
+        # Heavy import deferred until the model is actually needed
+        from TTS.api import TTS
+
+        self.profile.apply_threading()
+        self.tts = TTS(self.model_name).to(self.device)
+
+        # Threads / int8 / torch.compile from settings
+        synthesizer = self.tts.synthesizer
+        synthesizer.tts_model = self.profile.optimize(synthesizer.tts_model)
+        self.sample_rate = synthesizer.output_sample_rate
+
+    def resolve_voice(self, voice_preset: Optional[str]) -> str:
+        # Direct speaker ID (e.g. "p225") or a Bark-style preset
+        if voice_preset in self.voices:
+            return voice_preset
+        return VCTK_VOICE_MAP.get(voice_preset, self.default_voice)
+
+    def _synthesize(self, text: str, voice: str) -> np.ndarray:
+        with self.profile.context():
+            return self.tts.tts(text=text, speaker=voice)
+
+
+@register_backend("onnx_vits")
+class OnnxVitsBackend(CoquiVitsBackend):
+    """
+    The same VITS model exported to ONNX (python -m ml.models.vits_onnx),
+    run with ONNX Runtime instead of eager PyTorch.
+    The text front-end (cleaners + espeak phonemes) still comes from Coqui.
+    """
+
+    def __init__(self, settings: Settings):
+        super().__init__(settings)
+        self.onnx_path = Path(settings.TTS_ONNX_PATH)
+        self.session = None
+        self.tokenizer = None
+        self.speaker_ids: Dict[str, int] = {}
+        # Coqui VITS inference defaults: noise, length, duration noise
+        self.scales = np.array([0.667, 1.0, 0.8], dtype=np.float32)
+
+    @property
+    def device(self) -> str:
+        return "cpu"
+
+    def _load(self):
+        try:
+            import onnxruntime as ort
+        except ImportError as e:
+            raise ImportError(
+                "TTS_BACKEND=onnx_vits needs onnxruntime (optional): pip install 'onnxruntime>=1.16'"
+            ) from e
+        from ml.models.vits_onnx import sidecar_path
+
+        if not self.onnx_path.exists():
+            raise FileNotFoundError(
+                f"{self.onnx_path} not found, export it with: "
+                f"python -m ml.models.vits_onnx --out {self.onnx_path}"
+            )
+
+        logger.info(f"📥 Loading ONNX VITS from {self.onnx_path}...")
+        meta = json.loads(sidecar_path(self.onnx_path).read_text())
+        self.speaker_ids = meta["speakers"]
+        self.sample_rate = meta["sample_rate"]
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if self.settings.TTS_INTRA_OP_THREADS > 0:
+            options.intra_op_num_threads = self.settings.TTS_INTRA_OP_THREADS
+        if self.settings.TTS_INTER_OP_THREADS > 0:
+            options.inter_op_num_threads = self.settings.TTS_INTER_OP_THREADS
+
+        self.session = ort.InferenceSession(
+            str(self.onnx_path), options, providers=["CPUExecutionProvider"]
+        )
+        self.tokenizer = self._load_tokenizer()
+
+    def _load_tokenizer(self):
+        """Coqui tokenizer from the checkpoint's config (no torch model loaded)"""
+        from TTS.tts.configs.vits_config import VitsConfig
+        from TTS.tts.utils.text.tokenizer import TTSTokenizer
+        from TTS.utils.manage import ModelManager
+
+        _, config_path, _ = ModelManager().download_model(self.model_name)
+        config = VitsConfig()
+        config.load_json(config_path)
+        self.scales = np.array([
+            config.inference_noise_scale,
+            config.length_scale,
+            config.inference_noise_scale_dp,
+        ], dtype=np.float32)
+
+        tokenizer, _ = TTSTokenizer.init_from_config(config)
+        return tokenizer
+
+    def _synthesize(self, text: str, voice: str) -> np.ndarray:
+        if voice not in self.speaker_ids:
+            # Speaker 0 would silently be someone else's voice
+            raise ValidationError(f"Voice '{voice}' is not in {self.onnx_path.name}")
+        input_ids = np.array([self.tokenizer.text_to_ids(text)], dtype=np.int64)
+        outputs = self.session.run(None, {
+            "input": input_ids,
+            "input_lengths": np.array([input_ids.shape[1]], dtype=np.int64),
+            "scales": self.scales,
+            "sid": np.array([self.speaker_ids[voice]], dtype=np.int64),
+        })
+        return outputs[0].squeeze()
+
+
+@register_backend("bark")
+class BarkTransformerBackend(TTSBackend):
+    """
+    Suno Bark through HuggingFace transformers (ml/models/bark_model.py)
+    Much slower than VITS but more expressive; avoids torchaudio/encodec wheels
+    """
+
+    voices = [f"v2/en_speaker_{i}" for i in range(10)]
+    default_voice = "v2/en_speaker_6"
+
+    def __init__(self, settings: Settings):
+        super().__init__(settings)
+        self.model_name = settings.BARK_MODEL_NAME
+        self.profile = InferenceProfile.from_settings(settings)
+
+    def _load(self):
+        from ml.models import bark_model
+
+        self.profile.apply_threading()
+        bark_model.load_model(self.model_name, optimize=self.profile.optimize)
+        self.sample_rate = bark_model.get_sample_rate()
+
+    def _synthesize(self, text: str, voice: str) -> np.ndarray:
+        from ml.models import bark_model
+
+        with self.profile.context():
+            return bark_model.generate(text, voice_preset=voice)["audio"]
+
+
+@register_backend("stub")
+class StubBackend(TTSBackend):
+    """
+    No model at all: a deterministic tone per word
+    For tests, benchmarks and workers where audio quality doesn't matter
+    """
+
+    model_name = "stub"
+    default_voice = "default"
+
+    def _load(self):
+        self.sample_rate = 16000
+
+    def resolve_voice(self, voice_preset: Optional[str]) -> str:
+        return voice_preset or self.default_voice
+
+    def _synthesize(self, text: str, voice: str) -> np.ndarray:
+        sr = self.sample_rate
+        base = 110 + zlib.crc32(voice.encode()) % 110
+        chunks = []
+        for word in text.split():
+            # ~65 ms per character, pitch depends on the word
+            length = int(sr * 0.065 * max(len(word), 2))
+            freq = base + zlib.crc32(word.lower().encode()) % 220
+            t = np.arange(length, dtype=np.float32) / sr
+            envelope = np.hanning(length).astype(np.float32)
+            chunks.append(0.3 * envelope * np.sin(2 * np.pi * freq * t))
+            chunks.append(np.zeros(int(sr * 0.05), dtype=np.float32))
+        return np.concatenate(chunks) if chunks else np.zeros(sr // 10, dtype=np.float32)
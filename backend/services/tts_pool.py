@@ -0,0 +1,144 @@
+# backend/services/tts_pool.py
+"""
+Process pool of TTS model replicas for long texts
+
+Each worker process loads its own copy of the configured backend once
+(in the pool initializer) and then synthesizes chunks independently, so a
+paragraph split into N chunks finishes in roughly 1/replicas of the time.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from backend.core.exceptions import ExternalServiceError
+from backend.core.metrics import EXECUTOR_WAIT_SECONDS, INFERENCE_SECONDS
+
+logger = logging.getLogger(__name__)
+
+# Per-worker model, set by _init_replica
+_replica_backend = None
+
+
+def _init_replica(backend_name: str):
+    """Pool initializer: load one model replica in this worker"""
+    global _replica_backend
+    from backend.core.config import get_settings
+    from backend.services.tts_backends import create_backend
+
+    _replica_backend = create_backend(get_settings(), backend_name)
+    _replica_backend.load()
+
+
+# Longest start() waits for the slowest replica to load its model
+READY_TIMEOUT_S = 600
+
+
+def _replica_ready(barrier) -> int:
+    """
+    Hold this worker until every worker is here: a worker blocked in the
+    barrier can't take another ready task, so N tasks need N distinct,
+    loaded workers (the initializer runs before any task)
+    """
+    barrier.wait(READY_TIMEOUT_S)
+    return os.getpid()
+
+
+def _replica_synthesize(text: str, voice: str) -> Tuple[np.ndarray, float]:
+    """(audio, seconds spent synthesizing in this replica)"""
+    start = time.perf_counter()
+    audio = _replica_backend.synthesize(text, voice)
+    return audio, time.perf_counter() - start
+
+
+class TTSReplicaPool:
+    """Async front for a ProcessPoolExecutor of model replicas"""
+
+    def __init__(self, backend_name: str, replicas: int):
+        self.backend_name = backend_name
+        self.replicas = replicas
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self.pending = 0
+        self.completed = 0
+        self.failed = 0
+        self.restarts = 0
+        self.worker_pids: List[int] = []
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            logger.info(f"🧬 Starting {self.replicas} TTS replicas ({self.backend_name})...")
+            # spawn: forking a process that already holds torch threads is unsafe
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.replicas,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_replica,
+                initargs=(self.backend_name,)
+            )
+        return self._executor
+
+    def start(self):
+        """Start every worker and wait until each has loaded its model (blocking)"""
+        executor = self._get_executor()
+        with multiprocessing.get_context("spawn").Manager() as manager:
+            barrier = manager.Barrier(self.replicas)
+            futures = [executor.submit(_replica_ready, barrier) for _ in range(self.replicas)]
+            self.worker_pids = sorted(future.result() for future in futures)
+        logger.info(f"✅ {self.replicas} TTS replicas ready")
+
+    async def synthesize(self, text: str, voice: str) -> np.ndarray:
+        """Synthesize one chunk on whichever replica is free"""
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        self.pending += 1
+        submitted = time.perf_counter()
+        try:
+            audio, seconds = await loop.run_in_executor(executor, _replica_synthesize, text, voice)
+        except BrokenProcessPool:
+            # A replica died (e.g. OOM-killed): the pool is unusable,
+            # build a fresh one on the next call
+            self.failed += 1
+            self._reset(executor)
+            raise ExternalServiceError("A TTS replica process died, retry the request", "TTS replicas")
+        except BaseException:
+            self.failed += 1
+            raise
+        finally:
+            self.pending -= 1
+        self.completed += 1
+        # Replicas record into their own process: their timing comes back
+        # with the audio, the rest of the round trip was spent queued
+        INFERENCE_SECONDS.labels(f"tts_{self.backend_name}_replica").observe(seconds)
+        EXECUTOR_WAIT_SECONDS.labels("tts_replicas").observe(
+            max(time.perf_counter() - submitted - seconds, 0.0)
+        )
+        return audio
+
+    def _reset(self, executor: ProcessPoolExecutor):
+        if self._executor is executor:
+            logger.error("💥 TTS replica pool broken, restarting on next request")
+            self._executor = None
+            self.worker_pids = []
+            self.restarts += 1
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def get_stats(self):
+        return {
+            "replicas": self.replicas,
+            "started": self._executor is not None,
+            "pending_chunks": self.pending,
+            "completed_chunks": self.completed,
+            "failed_chunks": self.failed,
+            "restarts": self.restarts
+        }
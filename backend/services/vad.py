@@ -0,0 +1,116 @@
+# backend/services/vad.py
+"""
+Voice-activity trimming and loudness normalization of learner recordings
+
+Uploads often carry seconds of silence and room noise around the speech;
+everything downstream (MFCC, DTW) pays for every frame. One vectorized
+pass computes frame energies, finds the first and last speech frame
+against an adaptive threshold, trims to them (plus a little padding),
+rejects recordings that are empty or clipped, and scales the speech to a
+target RMS level.
+
+Threshold (dB re full scale), the highest of:
+    - an absolute floor (SPEECH_RMS, as the streaming path uses)
+    - the loudest frame minus `top_db` (librosa.effects.trim's rule)
+    - the noise floor (10th percentile frame) plus a margin, unless the
+      recording is too flat for that to separate anything
+"""
+
+import time
+from typing import Dict, Tuple
+
+import numpy as np
+
+from backend.core.exceptions import ClippedRecordingError, EmptyRecordingError
+from backend.services.acoustic_service import SILENCE_PEAK, SPEECH_RMS
+
+# Analysis frames
+FRAME_MS = 20.0
+HOP_MS = 10.0
+
+# |sample| at or above this counts as clipped
+CLIP_LEVEL = 0.99
+
+# Noise floor margin, and the smallest speech/noise gap it applies to
+NOISE_MARGIN_DB = 6.0
+
+# Normalization never pushes the peak above this
+MAX_PEAK = 0.95
+
+_EPS = 1e-10
+
+
+def frame_db(waveform: np.ndarray, frame: int, hop: int) -> np.ndarray:
+    """RMS level (dBFS) of each frame, via a cumulative sum of squares"""
+    if len(waveform) < frame:
+        frame = len(waveform)
+    n_frames = 1 + (len(waveform) - frame) // hop
+    energy = np.concatenate(([0.0], np.cumsum(np.square(waveform, dtype=np.float64))))
+    starts = np.arange(n_frames) * hop
+    mean_square = (energy[starts + frame] - energy[starts]) / frame
+    return 10.0 * np.log10(mean_square + _EPS)
+
+
+def prepare_recording(
+    waveform: np.ndarray,
+    sample_rate: int,
+    top_db: float = 35.0,
+    pad_ms: float = 150.0,
+    min_speech_ms: float = 100.0,
+    target_dbfs: float = -20.0,
+    max_clipped_ratio: float = 0.01
+) -> Tuple[np.ndarray, Dict]:
+    """
+    Trimmed, loudness-normalized copy of a mono float waveform and what was
+    done to it. Raises EmptyRecordingError if there is no speech and
+    ClippedRecordingError if too much of the speech is clipped
+    """
+    start = time.perf_counter()
+    waveform = np.asarray(waveform, dtype=np.float32)
+    if not len(waveform) or np.abs(waveform).max() < SILENCE_PEAK:
+        raise EmptyRecordingError("Recording is empty or silent")
+
+    frame = max(int(sample_rate * FRAME_MS / 1000), 1)
+    hop = max(int(sample_rate * HOP_MS / 1000), 1)
+    levels = frame_db(waveform, frame, hop)
+
+    peak_db = levels.max()
+    noise_db = np.percentile(levels, 10)
+    threshold = max(
+        20.0 * np.log10(SPEECH_RMS),
+        peak_db - top_db,
+        min(noise_db + NOISE_MARGIN_DB, peak_db - NOISE_MARGIN_DB)
+    )
+    voiced = np.flatnonzero(levels >= threshold)
+    if len(voiced) * HOP_MS < min_speech_ms:
+        raise EmptyRecordingError(
+            f"No speech found ({len(voiced) * HOP_MS:.0f} ms above {threshold:.0f} dBFS)"
+        )
+
+    pad = int(sample_rate * pad_ms / 1000)
+    begin = max(int(voiced[0]) * hop - pad, 0)
+    end = min(int(voiced[-1]) * hop + frame + pad, len(waveform))
+    speech = waveform[begin:end]
+
+    clipped = float(np.mean(np.abs(speech) >= CLIP_LEVEL))
+    if clipped > max_clipped_ratio:
+        raise ClippedRecordingError(
+            f"Recording is clipped ({100 * clipped:.1f}% of samples at full scale); "
+            "move away from the microphone or lower the input gain"
+        )
+
+    # Gain from the RMS of the speech frames, limited by the peak
+    speech_db = 10.0 * np.log10(np.mean(10.0 ** (levels[voiced] / 10.0)))
+    gain_db = min(target_dbfs - speech_db, 20.0 * np.log10(MAX_PEAK / np.abs(speech).max()))
+    speech = speech * np.float32(10.0 ** (gain_db / 20.0))
+
+    return speech, {
+        "samples_in": len(waveform),
+        "samples_out": len(speech),
+        "samples_removed": len(waveform) - len(speech),
+        "seconds_removed": round((len(waveform) - len(speech)) / sample_rate, 3),
+        "speech_dbfs": round(float(speech_db), 1),
+        "gain_db": round(float(gain_db), 1),
+        "clipped_ratio": round(clipped, 5),
+        "vad_ms": round(1000 * (time.perf_counter() - start), 3)
+    }
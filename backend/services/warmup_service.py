@@ -0,0 +1,136 @@
+# backend/services/warmup_service.py
+
+import asyncio
+import logging
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from backend.core.config import get_settings
+from backend.core.profiling import bytes_to_mb, current_rss_bytes
+
+logger = logging.getLogger(__name__)
+
+
+class WarmupService:
+    """
+    Preloads heavy components at startup and tracks readiness
+    Each component reports its status, load time and memory delta
+    """
+
+    def __init__(self):
+        self.settings = get_settings()
+        self.state = "idle"  # idle -> loading -> ready | degraded
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.components: Dict[str, Dict] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def _build_steps(self) -> List[Tuple[str, Callable[[], None]]]:
+        """Ordered (name, loader) pairs for everything enabled in settings"""
+        # Imported here to avoid a cycle with backend.api.dependencies
+        from backend.api import dependencies
+
+        steps = []
+
+        if self.settings.ENABLE_AUDIO and self.settings.PRELOAD_TTS:
+            tts = dependencies.get_coqui_tts_service
+            steps.append(("tts_model", lambda: tts()._load_models()))
+            if self.settings.TTS_REPLICAS > 1:
+                steps.append(("tts_replicas", lambda: tts().start_replicas()))
+            if self.settings.TTS_WARMUP_TEXT:
+                steps.append((
+                    "tts_warmup",
+                    lambda: tts().warmup(self.settings.TTS_WARMUP_TEXT)
+                ))
+
+        if self.settings.ENABLE_PRONUNCIATION and self.settings.PRELOAD_CMUDICT:
+            steps.append(("cmudict", dependencies.get_pronunciation_service))
+
+        if self.settings.ENABLE_PHONETICS and self.settings.PRELOAD_PHONETICS:
+            steps.append((
+                "phonetic_lexicon",
+                lambda: dependencies.get_phonetic_service().warmup()
+            ))
+
+        return steps
+
+    def _run_step(self, name: str, loader: Callable[[], None]):
+        """Run one loader and record how long it took and what it cost"""
+        component = self.components[name]
+        component["status"] = "loading"
+
+        rss_before = current_rss_bytes()
+        start = time.perf_counter()
+        try:
+            loader()
+            component["status"] = "ready"
+        except Exception as e:
+            logger.error(f"❌ Preloading {name} failed: {e}", exc_info=True)
+            component["status"] = "failed"
+            component["error"] = str(e)
+        finally:
+            rss_after = current_rss_bytes()
+            component["load_time_s"] = round(time.perf_counter() - start, 3)
+            component["rss_delta_mb"] = (
+                bytes_to_mb(rss_after - rss_before)
+                if rss_before is not None and rss_after is not None else None
+            )
+            component["rss_after_mb"] = bytes_to_mb(rss_after)
+
+        logger.info(
+            f"🔥 {name}: {component['status']} in {component['load_time_s']}s "
+            f"(+{component['rss_delta_mb']} MB)"
+        )
+
+    async def preload(self):
+        """Load every component one after another, off the event loop"""
+        steps = self._build_steps()
+        self.components = {name: {"status": "pending"} for name, _ in steps}
+        self.state = "loading"
+        self.started_at = time.time()
+
+        logger.info(f"🔥 Preloading {len(steps)} components...")
+        # Sequential on purpose: memory deltas stay attributable
+        for name, loader in steps:
+            await asyncio.to_thread(self._run_step, name, loader)
+
+        self.finished_at = time.time()
+        failed = [n for n, c in self.components.items() if c["status"] == "failed"]
+        self.state = "degraded" if failed else "ready"
+        logger.info(f"✅ Preloading finished: {self.state}")
+
+    def start(self) -> asyncio.Task:
+        """Start preloading in the background (idempotent)"""
+        if self._task is None:
+            self._task = asyncio.create_task(self.preload())
+        return self._task
+
+    async def stop(self):
+        """Cancel preloading if it's still running"""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    @property
+    def is_ready(self) -> bool:
+        """Ready once preloading finished, or when preloading is disabled"""
+        if not self.settings.PRELOAD_ON_STARTUP:
+            return True
+        return self.state == "ready"
+
+    def get_status(self) -> Dict:
+        """Readiness report"""
+        elapsed = None
+        if self.started_at is not None:
+            elapsed = round((self.finished_at or time.time()) - self.started_at, 3)
+
+        return {
+            "ready": self.is_ready,
+            "state": self.state,
+            "elapsed_s": elapsed,
+            "rss_mb": bytes_to_mb(current_rss_bytes()),
+            "components": self.components
+        }
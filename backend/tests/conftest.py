@@ -0,0 +1,25 @@
+# backend/tests/conftest.py
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make `backend` importable when running pytest from anywhere
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+# Settings require a Gemini key; tests never call the real API
+os.environ.setdefault("API_KEY_GEMINI", "test-key")
+
+
+@pytest.fixture
+def settings_env(monkeypatch, tmp_path):
+    """Fresh settings pointing file outputs at a temp directory"""
+    from backend.core.config import get_settings
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("AUDIO_DIR", str(tmp_path / "audio_files"))
+    get_settings.cache_clear()
+    yield monkeypatch
+    get_settings.cache_clear()
@@ -0,0 +1,163 @@
+# backend/tests/test_acoustic.py
+import asyncio
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from backend.core.config import get_settings
+from backend.core.exceptions import EmptyRecordingError, ScoringUnavailableError, ValidationError
+from backend.services.acoustic_service import (
+    DEVIATING,
+    band_dtw,
+    phoneme_frames,
+)
+from backend.services.coqui_tts_service import CoquiTTSService
+from backend.services.pronunciation_service import PronunciationService
+
+
+def _full_dtw(x, y):
+    n, m = len(x), len(y)
+    acc = np.full((n + 1, m + 1), np.inf)
+    acc[0, 0] = 0
+    for i in range(1, n + 1):
+        for j in range(1, m + 1):
+            cost = np.linalg.norm(x[i - 1] - y[j - 1])
+            acc[i, j] = cost + min(acc[i - 1, j - 1], acc[i - 1, j], acc[i, j - 1])
+    return acc[n, m]
+
+
+def test_band_dtw_matches_unconstrained_dtw_with_wide_band():
+    rng = np.random.default_rng(0)
+    for n, m in [(1, 1), (1, 5), (7, 3), (12, 20), (25, 25)]:
+        x = rng.normal(size=(n, 4)).astype(np.float32)
+        y = rng.normal(size=(m, 4)).astype(np.float32)
+
+        cost, path, path_cost = band_dtw(x, y, band_ratio=1.0)
+
+        assert cost == pytest.approx(_full_dtw(x, y), rel=1e-5)
+        assert tuple(path[0]) == (0, 0) and tuple(path[-1]) == (n - 1, m - 1)
+        assert np.all(np.diff(path, axis=0) >= 0)
+        assert path_cost.sum() == pytest.approx(cost, rel=1e-5)
+
+
+def test_band_dtw_stays_inside_band():
+    rng = np.random.default_rng(1)
+    x = rng.normal(size=(200, 4))
+    y = rng.normal(size=(300, 4))
+
+    cost, path, _ = band_dtw(x, y, band_ratio=0.05)
+
+    slope = 299 / 199
+    width = np.ceil(0.05 * 300)
+    assert np.isfinite(cost)
+    assert np.all(np.abs(path[:, 1] - path[:, 0] * slope) <= width)
+
+
+def test_phoneme_frames_cover_reference_in_order():
+    owner = phoneme_frames(["HH", "AH", "L", "OW"], 100)
+    assert owner[0] == 0 and owner[-1] == 3
+    assert np.all(np.diff(owner) >= 0)
+    counts = np.bincount(owner)
+    # Vowels get more frames than consonants
+    assert counts[1] > counts[0] and counts[3] > counts[2]
+
+
+@pytest.fixture
+def service(settings_env):
+    settings_env.setenv("TTS_BACKEND", "stub")
+    tts = CoquiTTSService()
+    return PronunciationService(tts_service=tts)
+
+
+def _record(service, text, path):
+    waveform, sample_rate = asyncio.run(service.acoustic.tts_service.get_waveform(text))
+    sf.write(str(path), waveform, sample_rate)
+    # Decoded the way uploads are
+    with open(path, "rb") as f:
+        return service.load_recording(f)
+
+
+def test_matching_recording_scores_high(service, tmp_path):
+    text = "good morning teacher"
+    audio = _record(service, text, tmp_path / "learner.wav")
+
+    analysis = asyncio.run(service.analyze_pronunciation(audio, text))
+
+    assert analysis["mir"] == 100.0
+    assert analysis["acoustic_score"] > 95
+    assert len(analysis["phoneme_scores"]) == len(analysis["reference_phonemes"].split())
+    assert DEVIATING not in analysis["spoken_phonemes"].split()
+
+
+def test_different_recording_is_penalized(service, tmp_path):
+    audio = _record(service, "thank you very much", tmp_path / "learner.wav")
+
+    analysis = asyncio.run(service.analyze_pronunciation(audio, "good morning teacher"))
+
+    assert analysis["acoustic_score"] < 60
+    assert analysis["mir"] < 100
+    assert DEVIATING in analysis["spoken_phonemes"].split()
+
+
+def test_reference_features_are_cached(service, tmp_path, monkeypatch):
+    text = "good morning teacher"
+    audio = _record(service, text, tmp_path / "learner.wav")
+
+    calls = []
+    original = service.acoustic.tts_service.get_waveform
+    monkeypatch.setattr(
+        service.acoustic.tts_service, "get_waveform",
+        lambda *args: calls.append(args) or original(*args)
+    )
+
+    asyncio.run(service.analyze_pronunciation(audio, text))
+    asyncio.run(service.analyze_pronunciation(audio, text))
+
+    assert len(calls) == 1
+    assert service.get_stats()["references"]["hits"] == 1
+
+
+def test_unreadable_audio_is_rejected(service, tmp_path):
+    audio = tmp_path / "broken.wav"
+    audio.write_bytes(b"RIFF")
+
+    with pytest.raises(ValidationError):
+        service.load_recording(str(audio))
+
+
+def test_silent_audio_is_rejected(service):
+    silence = np.zeros(service.sample_rate, dtype=np.float32)
+
+    with pytest.raises(EmptyRecordingError):
+        asyncio.run(service.analyze_pronunciation(silence, "hello"))
+
+
+def test_silent_audio_is_rejected_without_vad(service, settings_env):
+    settings_env.setenv("PRONUNCIATION_VAD_ENABLED", "false")
+    get_settings.cache_clear()
+    silence = np.zeros(service.sample_rate, dtype=np.float32)
+
+    # The acoustic comparison itself refuses it (no reference-vs-reference 100%)
+    with pytest.raises(EmptyRecordingError):
+        asyncio.run(service.analyze_pronunciation(silence, "hello"))
+
+
+def test_tone_is_not_scored_without_acoustic_reference(settings_env):
+    service = PronunciationService()
+    t = np.arange(service.sample_rate) / service.sample_rate
+    tone = (0.3 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+    with pytest.raises(ScoringUnavailableError) as e:
+        asyncio.run(service.analyze_pronunciation(tone, "the quick brown fox"))
+    assert e.value.status_code == 503
+
+
+def test_tone_scores_low_against_acoustic_reference(service):
+    t = np.arange(service.sample_rate) / service.sample_rate
+    tone = (0.3 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+    analysis = asyncio.run(service.analyze_pronunciation(tone, "the quick brown fox"))
+
+    assert analysis["mir"] < 100
+    assert analysis["acoustic_score"] < 60
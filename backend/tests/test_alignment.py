@@ -0,0 +1,264 @@
+# backend/tests/test_alignment.py
+import itertools
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from backend.benchmarks.bench_alignment import legacy_align, random_pair
+from backend.services.acoustic_service import DEVIATING
+from backend.services.phoneme_inventory import PHONEME_IDS, PHONEMES
+from backend.services import pronunciation_service
+from backend.services.pronunciation_service import (
+    NeedlemanWunschAligner,
+    PronunciationMetrics,
+    Reference,
+    WPSM,
+    score_recording,
+)
+
+
+@pytest.fixture(scope="module")
+def wpsm():
+    return WPSM()
+
+
+def _rescore(wpsm, aligned1, aligned2, gap=-0.73):
+    return sum(
+        gap if "-" in (a, b) else wpsm.get_similarity(a, b)
+        for a, b in zip(aligned1, aligned2)
+    )
+
+
+def test_one_phoneme_code_space(wpsm):
+    # WPSM codes the inventory in order: same ids as the CMUDict index packs
+    assert wpsm.encode(list(PHONEMES)).tolist() == [PHONEME_IDS[p] for p in PHONEMES]
+    assert len(PHONEMES) <= 0x3F
+
+
+def test_dense_matrix_matches_lookup(wpsm):
+    for a in ("AA", "AE", "P", "B", "XX"):
+        for b in ("AA", "AE", "P", "B", "YY"):
+            i, j = wpsm.code(a), wpsm.code(b)
+            dense = wpsm.dense[i, j] / WPSM.SCALE
+            assert dense == pytest.approx(wpsm.get_similarity(a, b))
+
+
+def test_matches_cell_by_cell_alignment(wpsm):
+    aligner = NeedlemanWunschAligner(wpsm)
+    rng = random.Random(7)
+    alphabet = ["AA", "AE", "AH", "P", "B", "T", "D", "S", "Z", "IH", "IY", "XX"]
+
+    for _ in range(300):
+        seq1 = [rng.choice(alphabet) for _ in range(rng.randint(0, 10))]
+        seq2 = [rng.choice(alphabet) for _ in range(rng.randint(0, 10))]
+
+        aligned1, aligned2, score = aligner.align(seq1, seq2)
+        _, _, expected = legacy_align(wpsm, seq1, seq2)
+
+        assert score == pytest.approx(expected)
+        # A valid alignment of the inputs that actually reaches that score
+        assert [p for p in aligned1 if p != "-"] == seq1
+        assert [p for p in aligned2 if p != "-"] == seq2
+        assert _rescore(wpsm, aligned1, aligned2) == pytest.approx(score)
+
+
+def test_prefers_diagonal_then_up(wpsm):
+    aligner = NeedlemanWunschAligner(wpsm)
+    assert aligner.align(["P", "AA"], ["P", "AA"])[:2] == (["P", "AA"], ["P", "AA"])
+    assert aligner.align(["S", "T"], ["T"])[:2] == (["S", "T"], ["-", "T"])
+    assert aligner.align([], ["T", "D"])[:2] == (["-", "-"], ["T", "D"])
+
+
+def test_long_sequences(wpsm):
+    aligner = NeedlemanWunschAligner(wpsm)
+    spoken, reference = random_pair(1000, random.Random(0))
+
+    aligned1, aligned2, score = aligner.align(spoken, reference)
+
+    assert len(aligned1) == len(aligned2)
+    assert _rescore(wpsm, aligned1, aligned2) == pytest.approx(score)
+
+
+def test_identity_score_is_diagonal_sum(wpsm):
+    metrics = PronunciationMetrics(wpsm)
+    phonemes = ["HH", "AH", "L", "OW", "W", "ER", "L", "D", "XX"]
+
+    _, _, aligned = metrics.aligner.align(phonemes, phonemes)
+    assert metrics.identity_score(phonemes) == pytest.approx(aligned)
+
+
+def test_detailed_analysis_aligns_once(wpsm, monkeypatch):
+    metrics = PronunciationMetrics(wpsm)
+    calls = []
+    original = metrics.aligner.align
+    monkeypatch.setattr(
+        metrics.aligner, "align", lambda *args, **kwargs: calls.append(1) or original(*args, **kwargs)
+    )
+
+    result = metrics.detailed_analysis(["HH", "EH", "L", "OW"], ["HH", "AH", "L", "OW"])
+
+    assert len(calls) == 1
+    assert result["error_count"] == 1
+    assert result["mir"] == pytest.approx(metrics.mir(["HH", "EH", "L", "OW"], ["HH", "AH", "L", "OW"]), abs=0.1)
+
+
+def _long_pair(size=400):
+    spoken, reference = random_pair(size, random.Random(1))
+    # Word ends every 3-5 phonemes
+    rng = random.Random(2)
+    boundaries, pos = [], 0
+    while pos < len(reference):
+        pos += rng.randint(3, 5)
+        boundaries.append(pos)
+    return spoken, reference, [b for b in boundaries if b < len(reference)]
+
+
+@pytest.mark.parametrize("use_boundaries", [False, True])
+def test_long_inputs_never_build_the_full_table(wpsm, monkeypatch, use_boundaries):
+    spoken, reference, boundaries = _long_pair()
+    _, _, expected = NeedlemanWunschAligner(wpsm, max_cells=10**9).align(spoken, reference)
+
+    aligner = NeedlemanWunschAligner(wpsm, max_cells=5_000, segment_phonemes=20)
+    tables = []
+    original = aligner.fill
+    monkeypatch.setattr(
+        aligner, "fill",
+        lambda a, b, codes2=None: tables.append((len(a) + 1) * (len(b) + 1)) or original(a, b, codes2)
+    )
+
+    aligned1, aligned2, score = aligner.align(
+        spoken, reference, boundaries if use_boundaries else None
+    )
+
+    assert score == pytest.approx(expected)
+    assert max(tables) <= 5_000
+    assert [p for p in aligned1 if p != "-"] == spoken
+    assert [p for p in aligned2 if p != "-"] == reference
+    assert _rescore(wpsm, aligned1, aligned2) == pytest.approx(score)
+
+
+@pytest.mark.parametrize("max_cells, use_boundaries", [(10**9, False), (5_000, False), (5_000, True)])
+def test_precomputed_reference_codes(wpsm, monkeypatch, max_cells, use_boundaries):
+    spoken, reference, boundaries = _long_pair()
+    aligner = NeedlemanWunschAligner(wpsm, max_cells=max_cells, segment_phonemes=20)
+    bounds = boundaries if use_boundaries else None
+    expected = aligner.align(spoken, reference, bounds)
+
+    encoded = []
+    original = wpsm.encode
+    monkeypatch.setattr(wpsm, "encode", lambda seq: encoded.append(list(seq)) or original(seq))
+    result = aligner.align(spoken, reference, bounds, codes2=original(reference))
+
+    assert result == expected
+    # Only (pieces of) the spoken phonemes were encoded
+    text = " " + " ".join(spoken) + " "
+    assert encoded and all(" " + " ".join(seq) + " " in text for seq in encoded)
+
+
+def test_segments_align_in_parallel(wpsm):
+    spoken, reference, boundaries = _long_pair()
+    aligner = NeedlemanWunschAligner(wpsm, max_cells=5_000, segment_phonemes=20)
+
+    sequential = aligner.align(spoken, reference, boundaries)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        parallel = aligner.align(spoken, reference, boundaries, executor=executor)
+
+    assert parallel == sequential
+
+
+def test_short_inputs_ignore_boundaries(wpsm):
+    aligner = NeedlemanWunschAligner(wpsm)
+    seq1, seq2 = ["HH", "EH", "L", "OW"], ["HH", "AH", "L", "OW", "W", "ER", "L", "D"]
+    assert aligner.align(seq1, seq2, [4]) == aligner.align(seq1, seq2)
+
+
+def _random_lattice(rng, alphabet):
+    words = [
+        [[rng.choice(alphabet) for _ in range(rng.randint(1, 4))] for _ in range(rng.randint(1, 3))]
+        for _ in range(rng.randint(0, 4))
+    ]
+    spoken = [rng.choice(alphabet) for _ in range(rng.randint(0, 10))]
+    return spoken, words
+
+
+@pytest.mark.parametrize("max_cells", [1_000_000, 8])
+def test_variant_lattice_matches_enumerating_sentences(wpsm, max_cells):
+    aligner = NeedlemanWunschAligner(wpsm, max_cells=max_cells)
+    rng = random.Random(3)
+    alphabet = ["AA", "AE", "AH", "P", "B", "T", "D", "S", "Z", "IH", "IY"]
+
+    for _ in range(200):
+        spoken, words = _random_lattice(rng, alphabet)
+
+        aligned1, aligned2, score, chosen = aligner.align_variants(spoken, words)
+
+        best = max(
+            aligner.align(spoken, [p for variant in combo for p in variant])[2]
+            for combo in itertools.product(*words)
+        )
+        reference = [p for variants, v in zip(words, chosen) for p in variants[v]]
+        assert score == pytest.approx(best)
+        assert [p for p in aligned1 if p != "-"] == spoken
+        assert [p for p in aligned2 if p != "-"] == reference
+        assert _rescore(wpsm, aligned1, aligned2) == pytest.approx(score)
+
+
+def test_alternative_pronunciation_is_not_penalized(wpsm):
+    metrics = PronunciationMetrics(wpsm)
+    # "either tomato": IY DH ER / AY DH ER, T AH M EY T OW / T AH M AA T OW
+    variants = [
+        [["IY", "DH", "ER"], ["AY", "DH", "ER"]],
+        [["T", "AH", "M", "EY", "T", "OW"], ["T", "AH", "M", "AA", "T", "OW"]],
+    ]
+    first = [p for word in variants for p in word[0]]
+    spoken = ["AY", "DH", "ER", "T", "AH", "M", "AA", "T", "OW"]
+
+    single = metrics.detailed_analysis(spoken, first)
+    result = metrics.detailed_analysis(spoken, first, variants=variants)
+
+    assert single["mir"] < 100
+    assert result["mir"] == 100.0
+    assert result["error_count"] == 0
+    assert [w["variant"] for w in result["word_variants"]] == [1, 1]
+    assert result["reference_phonemes"] == " ".join(spoken)
+
+
+def test_acoustic_phonemes_are_scored_against_the_first_variant(wpsm, monkeypatch):
+    # What compare_recording yields: the first variant, the deviating AH
+    # marked. The lattice would take the shorter variant that skips it
+    metrics = PronunciationMetrics(wpsm)
+    variants = [
+        [["M", "AY"]],
+        [["F", "AE", "M", "AH", "L", "IY"], ["F", "AE", "M", "L", "IY"]],
+    ]
+    first = [p for word in variants for p in word[0]]
+    spoken = ["M", "AY", "F", "AE", "M", DEVIATING, "L", "IY"]
+    deviations = [{"phoneme": p, "score": 0.0 if p == DEVIATING else 90.0} for p in spoken]
+    lattice = metrics.detailed_analysis(spoken, first, variants=variants)
+    assert [w["variant"] for w in lattice["word_variants"]] == [0, 1]
+
+    monkeypatch.setattr(
+        pronunciation_service, "compare_recording", lambda *args, **kwargs: (spoken, deviations)
+    )
+    reference = Reference(
+        "my family", first, wpsm.encode(first), [2], variants,
+        metrics.identity_score(first), features=np.zeros((1, 13), dtype=np.float32)
+    )
+    result = score_recording(metrics, np.zeros(16000, dtype=np.float32), reference)
+
+    assert result["reference_phonemes"] == " ".join(first)
+    assert "word_variants" not in result
+    assert result["error_count"] == 1
+    assert result["mir"] < lattice["mir"]
+
+
+def test_single_variants_use_plain_alignment(wpsm):
+    metrics = PronunciationMetrics(wpsm)
+    spoken, reference = ["HH", "EH", "L", "OW"], ["HH", "AH", "L", "OW"]
+
+    result = metrics.detailed_analysis(spoken, reference, variants=[[reference]])
+
+    assert result["aligned_reference"] == "HH AH L OW"
+    assert result["word_variants"] == [{"variant": 0, "phonemes": "HH AH L OW"}]
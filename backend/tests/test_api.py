@@ -1,17 +1,41 @@
-from unittest.mock import Mock
-from aiohttp import request
+# backend/tests/test_api.py
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
-# from api_meaning import get_meaning
-from backend.services.meaning_service import MeaningService
-from routes.api_meaning import get_meaning
-from schemas import MeaningResponse
-# # Test service independently
-def test_meaning_service():
-    service = MeaningService()
-    
-    result = service.get_meaning("hello")
-    
-    assert result.text == "hello"
-    assert result.meaning is not None
-    # Testing ONLY business logic 😊
+from backend.api.dependencies import get_meaning_service
+from backend.api.routes.api_meaning import router
+from backend.benchmarks.common import OfflineMeaningService
+
+
+def _client(service):
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_meaning_service] = lambda: service
+    return TestClient(app)
+
+
+def test_meaning_route(settings_env):
+    service = OfflineMeaningService()
+
+    response = _client(service).post("/api/meaning", json={"text": " hello "})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["text"] == "hello"
+    assert body["meaning"] == "a greeting"
+    assert body["synonyms"] == ["hi", "hey"]
+    assert service.client.calls == 1
+
+
+def test_meaning_route_reports_gemini_failure(settings_env):
+    service = OfflineMeaningService()
+
+    def fail(model, contents):
+        raise RuntimeError("quota exceeded")
+
+    service.client.generate_content = fail
+
+    response = _client(service).post("/api/meaning", json={"text": "hello"})
+
+    assert response.status_code == 500
+    assert "AI service temporarily unavailable" in response.json()["detail"]
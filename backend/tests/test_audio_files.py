@@ -0,0 +1,143 @@
+# backend/tests/test_audio_files.py
+import asyncio
+
+import pytest
+
+from backend.core.exceptions import NotFoundError, ValidationError
+from backend.services.audio_file_service import (
+    AudioFileService,
+    RangeNotSatisfiableError,
+)
+
+KEY = "98eaa5d41c2476a0a37c4ee424f710de"
+
+
+@pytest.fixture
+def files(settings_env):
+    service = AudioFileService()
+    (service.audio_dir / f"audio_{KEY}.wav").write_bytes(bytes(range(100)))
+    return service
+
+
+def test_etag_is_derived_from_content_key(files):
+    assert files.etag_for(f"audio_{KEY}.wav") == f'"{KEY}"'
+    headers = files.cache_headers(f"audio_{KEY}.wav")
+    assert "immutable" in headers["Cache-Control"]
+    assert files.etag_matches(f'W/"{KEY}", "other"', headers["ETag"])
+    assert not files.etag_matches('"other"', headers["ETag"])
+
+
+@pytest.mark.parametrize("name", [
+    "../secret.wav", "..%2Fsecret.wav", "/etc/passwd", "audio.mp3", ".hidden.wav", "a/b.wav",
+])
+def test_rejects_unsafe_filenames(files, name):
+    with pytest.raises(ValidationError):
+        files.resolve(name)
+
+
+def test_missing_file(files):
+    with pytest.raises(NotFoundError):
+        files.get_existing("audio_missing.wav")
+
+
+def test_parse_range(files):
+    assert files.parse_range(None, 100) is None
+    assert files.parse_range("bytes=0-9", 100) == (0, 9)
+    assert files.parse_range("bytes=90-", 100) == (90, 99)
+    assert files.parse_range("bytes=-10", 100) == (90, 99)
+    assert files.parse_range("bytes=50-500", 100) == (50, 99)
+    assert files.parse_range("bytes=0-1,5-6", 100) is None
+    with pytest.raises(RangeNotSatisfiableError):
+        files.parse_range("bytes=100-", 100)
+
+
+def test_hot_cache_promotion(files):
+    path = files.get_existing(f"audio_{KEY}.wav")
+    assert asyncio.run(files.read(path)) == bytes(range(100))
+    assert len(files.hot_cache) == 0
+
+    asyncio.run(files.read(path))
+    assert len(files.hot_cache) == 1
+
+    # Served from memory even if the file changes on disk
+    path.write_bytes(b"changed")
+    assert asyncio.run(files.read_range(path, 10, 12)) == bytes([10, 11, 12])
+
+
+def test_only_disk_reads_leave_the_event_loop(files, monkeypatch):
+    # LRUCache is not thread-safe: lookups, promotion and play counts stay on the loop
+    path = files.get_existing(f"audio_{KEY}.wav")
+    offloaded = []
+    to_thread = asyncio.to_thread
+    monkeypatch.setattr(
+        asyncio, "to_thread", lambda fn, *args: offloaded.append(fn) or to_thread(fn, *args)
+    )
+
+    asyncio.run(files.read(path))
+    asyncio.run(files.read_range(path, 10, 12))
+    asyncio.run(files.read(path))
+    asyncio.run(files.read(path))
+
+    assert offloaded == [path.read_bytes, files._read_slice, path.read_bytes]
+    assert files.play_counts.get(path.name) == 2
+
+
+def test_delete_drops_hot_entry(files):
+    path = files.get_existing(f"audio_{KEY}.wav")
+    asyncio.run(files.read(path))
+    asyncio.run(files.read(path))
+    assert files.delete(path.name)
+    assert len(files.hot_cache) == 0
+    assert not files.delete(path.name)
+
+
+@pytest.fixture
+def client(files):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from backend.api.dependencies import get_audio_file_service
+    from backend.api.routes.api_audio import router
+
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_audio_file_service] = lambda: files
+    return TestClient(app)
+
+
+URL = f"/api/audio/files/audio_{KEY}.wav"
+
+
+def test_route_full_and_not_modified(client):
+    response = client.get(URL)
+    assert response.status_code == 200
+    assert response.content == bytes(range(100))
+    assert response.headers["etag"] == f'"{KEY}"'
+    assert "immutable" in response.headers["cache-control"]
+
+    response = client.get(URL, headers={"If-None-Match": f'"{KEY}"'})
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+def test_route_ranges(client):
+    response = client.get(URL, headers={"Range": "bytes=10-19"})
+    assert response.status_code == 206
+    assert response.content == bytes(range(10, 20))
+    assert response.headers["content-range"] == "bytes 10-19/100"
+
+    response = client.get(URL, headers={"Range": "bytes=100-"})
+    assert response.status_code == 416
+    assert response.headers["content-range"] == "bytes */100"
+
+
+def test_route_if_range(client):
+    # Matching validator: the range is honoured
+    response = client.get(URL, headers={"Range": "bytes=0-3", "If-Range": f'"{KEY}"'})
+    assert response.status_code == 206
+    assert response.content == bytes(range(4))
+
+    # Stale validator: the whole file instead
+    response = client.get(URL, headers={"Range": "bytes=0-3", "If-Range": '"old"'})
+    assert response.status_code == 200
+    assert len(response.content) == 100
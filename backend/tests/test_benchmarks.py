@@ -0,0 +1,52 @@
+# backend/tests/test_benchmarks.py
+from pathlib import Path
+
+from backend.api.dependencies import get_audio_file_service, get_coqui_tts_service, get_phonetic_service
+from backend.benchmarks.bench_suite import compare, run_suite, summarize
+
+INDEX = Path(__file__).parents[2] / "models" / "cmudict.idx"
+
+
+def test_summarize_percentiles():
+    summary = summarize([i / 1000 for i in range(1, 101)], ops=10)
+
+    assert summary["iterations"] == 100
+    assert summary["p50_ms"] == 50.5
+    assert summary["p95_ms"] == 95.05
+    assert summary["p99_ms"] == 99.01
+    assert summary["p50_us_per_op"] == 5050.0
+
+
+def test_compare_flags_regressions_beyond_tolerance():
+    baseline = {"cases": {
+        "a": {"p95_ms": 10.0}, "b": {"p95_ms": 10.0}, "c": {"p95_ms": 0.01}
+    }}
+    report = {"cases": {
+        "a": {"p95_ms": 14.0},   # within 50%
+        "b": {"p95_ms": 16.0},   # regressed
+        "c": {"p95_ms": 0.03},   # 3x, but only 0.02 ms: timer noise
+        "new": {"p95_ms": 99.0}  # no baseline yet
+    }}
+
+    regressions = compare(report, baseline, tolerance=0.5)
+
+    assert [r["case"] for r in regressions] == ["b"]
+    assert regressions[0]["ratio"] == 1.6
+
+
+def test_suite_runs_offline(settings_env):
+    settings_env.setenv("TTS_BACKEND", "stub")
+    settings_env.setenv("PRELOAD_ON_STARTUP", "false")
+    settings_env.setenv("CMUDICT_INDEX_PATH", str(INDEX))
+    for getter in (get_coqui_tts_service, get_audio_file_service, get_phonetic_service):
+        getter.cache_clear()
+    try:
+        report = run_suite(["alignment", "cmudict", "tts", "audio", "http"], iterations=2)
+    finally:
+        for getter in (get_coqui_tts_service, get_audio_file_service, get_phonetic_service):
+            getter.cache_clear()
+
+    cases = report["cases"]
+    assert {"alignment.nw_1000", "cmudict.lookup", "tts.cache_hit", "http.meaning", "http.lookup"} <= set(cases)
+    assert not any(name.startswith("phonetics.") for name in cases)
+    assert all(c["iterations"] == 2 and c["p50_ms"] <= c["p99_ms"] for c in cases.values())
@@ -0,0 +1,66 @@
+# backend/tests/test_cmudict_index.py
+import re
+
+import cmudict
+import pytest
+
+from backend.services.cmudict_index import CMUDictIndex, build_index, pack_phoneme
+from backend.services.pronunciation_service import CMUDictLoader
+
+ENTRIES = [
+    ("hello", ["HH", "AH0", "L", "OW1"]),
+    ("hello", ["HH", "EH0", "L", "OW1"]),
+    ("read", ["R", "EH1", "D"]),
+    ("read", ["R", "IY1", "D"]),
+    ("the", ["DH", "AH0"]),
+    ("o'clock", ["AH0", "K", "L", "AA1", "K"]),
+]
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = CMUDictIndex(build_index(ENTRIES, tmp_path / "small.idx"))
+    yield index
+    index.close()
+
+
+def test_variants_keep_order_and_stress(index):
+    assert len(index) == 4
+    assert index.pronunciations("read", stress=True) == [["R", "EH1", "D"], ["R", "IY1", "D"]]
+    assert index.pronunciations("hello") == [["HH", "AH", "L", "OW"], ["HH", "EH", "L", "OW"]]
+    assert index.first("o'clock") == ["AH", "K", "L", "AA", "K"]
+
+
+def test_stress_lives_in_the_top_bits():
+    assert pack_phoneme("AH0") & 0x3F == pack_phoneme("AH2") & 0x3F == pack_phoneme("AH")
+    assert pack_phoneme("AH") >> 6 == 0
+    assert [pack_phoneme(f"AH{s}") >> 6 for s in range(3)] == [1, 2, 3]
+
+
+def test_unknown_words(index):
+    assert "hellos" not in index
+    assert index.first("hellos") == []
+    assert index.pronunciations("") == []
+
+
+def test_rebuilds_missing_or_corrupt_index(tmp_path):
+    path = tmp_path / "cmudict.idx"
+    path.write_bytes(b"not an index")
+
+    index = CMUDictIndex.load_or_build(path)
+
+    assert len(index) > 100_000
+    assert index.first("hello") == ["HH", "AH", "L", "OW"]
+
+
+def test_loader_matches_cmudict(settings_env, tmp_path):
+    settings_env.setenv("CMUDICT_INDEX_PATH", str(tmp_path / "cmudict.idx"))
+    loader = CMUDictLoader()
+    reference = cmudict.dict()
+
+    for word in list(reference)[::97]:
+        assert loader.get_pronunciations(word, stress=True) == reference[word]
+        assert loader.get_pronunciation(word.upper()) == [
+            re.sub(r'[0-9]', '', p) for p in reference[word][0]
+        ]
+    assert loader.sentence_to_word_phonemes("Hello qwxz") == [["HH", "AH", "L", "OW"], ["UNK"]]
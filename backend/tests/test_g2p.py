@@ -0,0 +1,67 @@
+# backend/tests/test_g2p.py
+import asyncio
+
+import pytest
+
+from backend.services.g2p import ARPABET_TO_IPA, G2P, spell_to_phonemes, tokenize
+from backend.services.phoneme_inventory import PHONEMES
+from backend.services.phonetic_service import PhoneticService
+from backend.services.pronunciation_service import CMUDictLoader
+
+
+@pytest.mark.parametrize("word, phonemes", [
+    ("rizz", "R IH Z"),
+    ("make", "M EY K"),
+    ("knight", "N AY T"),
+    ("phone", "F OW N"),
+    ("city", "S IH T IY"),
+    ("school", "S K UW L"),
+])
+def test_spelling_rules(word, phonemes):
+    assert spell_to_phonemes(word) == phonemes.split()
+
+
+def test_output_stays_in_inventory():
+    words = ["zendaya", "skibidi", "xander", "qwxz", "delulu", "cheugy", "aaaa", "y"]
+    for word in words:
+        phonemes = spell_to_phonemes(word)
+        assert phonemes
+        assert set(phonemes) <= set(PHONEMES) - {"UNK"}
+        assert set(phonemes) <= set(ARPABET_TO_IPA)
+
+
+def test_tokenize_strips_punctuation():
+    assert tokenize("Hello, world! Don’t stop... (rizz)") == ["hello", "world", "don't", "stop", "rizz"]
+    assert tokenize("--") == []
+
+
+def test_lexicon_memoizes():
+    g2p = G2P(max_items=2)
+    assert g2p.phonemes("Yeet") == g2p.phonemes("yeet")
+    stats = g2p.get_stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1
+    # Callers can't corrupt the lexicon
+    g2p.phonemes("yeet").append("Z")
+    assert g2p.phonemes("yeet") == spell_to_phonemes("yeet")
+
+
+def test_loader_falls_back_for_oov_words(settings_env, tmp_path):
+    settings_env.setenv("CMUDICT_INDEX_PATH", str(tmp_path / "cmudict.idx"))
+    loader = CMUDictLoader(g2p=G2P())
+
+    words = loader.sentence_to_word_phonemes("Hello, rizz!")
+    assert words == [["HH", "AH", "L", "OW"], ["R", "IH", "Z"]]
+    assert loader.sentence_to_word_variants("rizz.") == [[["R", "IH", "Z"]]]
+    assert loader.get_pronunciation("rizz") == ["R", "IH", "Z"]
+    assert loader.in_dictionary("hello") and not loader.in_dictionary("rizz")
+
+
+def test_phonetics_oov_word_gets_ipa(settings_env):
+    service = PhoneticService(g2p=G2P())
+
+    result = asyncio.run(service.get_phonetics("Rizz, hello!"))
+
+    assert [w.word for w in result.words] == ["rizz", "hello"]
+    assert result.words[0].ipa == "/rɪz/"
+    assert "*" not in result.words[1].ipa
+    assert service.g2p.get_stats()["items"] == 1
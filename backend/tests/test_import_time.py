@@ -0,0 +1,92 @@
+# backend/tests/test_import_time.py
+"""
+Cold-start harness: imports backend.main in a fresh interpreter under
+`python -X importtime` and checks that heavy dependencies stay deferred.
+
+Set IMPORT_TIME_BUDGET_MS / IMPORT_RSS_BUDGET_MB to tighten the budgets.
+"""
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+# Must never be imported just by loading the app
+HEAVY_MODULES = ["torch", "TTS", "librosa", "google.genai", "cmudict", "transformers"]
+
+IMPORT_TIME_BUDGET_MS = float(os.environ.get("IMPORT_TIME_BUDGET_MS", 10000))
+IMPORT_RSS_BUDGET_MB = float(os.environ.get("IMPORT_RSS_BUDGET_MB", 400))
+
+PROBE = """
+import json, time
+start = time.perf_counter()
+import backend.main
+elapsed_ms = (time.perf_counter() - start) * 1000
+from backend.core.profiling import current_rss_bytes
+print(json.dumps({
+    "elapsed_ms": elapsed_ms,
+    "rss_mb": (current_rss_bytes() or 0) / (1024 * 1024),
+    "routes": sorted(backend.main.app.openapi()["paths"]),
+}))
+"""
+
+
+def run_importtime(**env_overrides):
+    """Import backend.main in a subprocess, return (probe result, {module: cumulative_us})"""
+    env = {**os.environ, "API_KEY_GEMINI": "test-key", **env_overrides}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+
+    modules = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = [p.strip() for p in line[len("import time:"):].split("|")]
+        if not parts[1].isdigit():
+            continue  # header line
+        modules[parts[2]] = int(parts[1])
+
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    return result, modules
+
+
+def test_heavy_dependencies_are_deferred():
+    result, modules = run_importtime()
+
+    loaded_heavy = [
+        name for name in modules
+        if any(name == heavy or name.startswith(heavy + ".") for heavy in HEAVY_MODULES)
+    ]
+    assert loaded_heavy == []
+
+    slowest = sorted(modules.items(), key=lambda kv: kv[1], reverse=True)[:5]
+    print(
+        f"\nbackend.main cold import: {result['elapsed_ms']:.0f} ms, "
+        f"RSS {result['rss_mb']:.1f} MB; slowest: "
+        + ", ".join(f"{name}={us / 1000:.0f}ms" for name, us in slowest)
+    )
+    assert result["elapsed_ms"] < IMPORT_TIME_BUDGET_MS
+    assert result["rss_mb"] < IMPORT_RSS_BUDGET_MB
+
+
+@pytest.mark.parametrize("flag,prefix", [
+    ("ENABLE_MEANING", "/api/meaning"),
+    ("ENABLE_AUDIO", "/api/audio"),
+    ("ENABLE_PRONUNCIATION", "/api/pronunciation"),
+])
+def test_feature_flags_unmount_subsystems(flag, prefix):
+    result, modules = run_importtime(**{flag: "false"})
+
+    assert not any(path.startswith(prefix) for path in result["routes"])
+    assert "/api/phonetics" in result["routes"]
@@ -0,0 +1,49 @@
+# backend/tests/test_inference_profile.py
+import numpy as np
+import pytest
+
+from backend.core.config import get_settings
+from backend.services.audio_utils import spectral_similarity
+from backend.services.inference_profile import InferenceProfile
+
+
+def test_profile_from_settings(settings_env):
+    settings_env.setenv("TTS_INTRA_OP_THREADS", "2")
+    settings_env.setenv("TTS_QUANTIZE_INT8", "true")
+    profile = InferenceProfile.from_settings(get_settings())
+
+    assert profile.describe() == {
+        "intra_op_threads": 2,
+        "inter_op_threads": 0,
+        "inference_mode": True,
+        "quantize_int8": True,
+        "torch_compile": False,
+    }
+
+
+def test_spectral_similarity():
+    t = np.arange(16000) / 16000
+    tone = np.sin(2 * np.pi * 440 * t)
+    noisy = tone + np.random.default_rng(0).normal(0, 0.001, len(t))
+    other = np.sin(2 * np.pi * 2000 * t)
+
+    assert spectral_similarity(tone, noisy) > 0.99
+    assert spectral_similarity(tone, other) < spectral_similarity(tone, noisy)
+
+
+def test_int8_profile_keeps_output_close():
+    torch = pytest.importorskip("torch")
+    torch.manual_seed(0)
+    model = torch.nn.Sequential(
+        torch.nn.Linear(64, 256), torch.nn.Tanh(), torch.nn.Linear(256, 64)
+    )
+    x = torch.randn(8, 64)
+    expected = model(x).detach()
+
+    profile = InferenceProfile(quantize_int8=True)
+    quantized = profile.optimize(model)
+    with profile.context():
+        out = quantized(x)
+
+    assert not out.requires_grad
+    assert torch.nn.functional.cosine_similarity(out.flatten(), expected.flatten(), dim=0) > 0.99
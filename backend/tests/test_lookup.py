@@ -0,0 +1,179 @@
+# backend/tests/test_lookup.py
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.api.dependencies import get_lookup_service
+from backend.api.routes.api_lookup import router
+from backend.api.schemas.api_schemas import AudioGenerateResponse, MeaningResponse
+from backend.core.config import get_settings
+from backend.core.exceptions import ExternalServiceError
+from backend.services.lookup_service import LookupService
+from backend.services.meaning_service import MeaningService
+from backend.services.phonetic_service import PhoneticService
+
+
+class SlowMeaning:
+    def __init__(self, delay=0.2, fail=False):
+        self.delay = delay
+        self.fail = fail
+
+    async def get_meaning(self, text):
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise ExternalServiceError("Gemini is down", "Gemini")
+        return MeaningResponse(text=text, meaning=f"meaning of {text}")
+
+
+class BlockingGemini:
+    """Synchronous client, like google.genai's `client.models`"""
+
+    def __init__(self, delay):
+        self.models = self
+        self.delay = delay
+
+    def generate_content(self, model, contents):
+        time.sleep(self.delay)
+        return SimpleNamespace(text=json.dumps({"meaning": "a greeting"}))
+
+
+class BlockingMeaning(MeaningService):
+    """The real MeaningService over a client that blocks its thread"""
+
+    def __init__(self, delay):
+        self.delay = delay
+        super().__init__()
+
+    def _initialize_gemini(self):
+        self.client = BlockingGemini(self.delay)
+
+
+class SlowTTS:
+    def __init__(self, delay=0.2):
+        self.delay = delay
+        self.finished = 0
+
+    async def generate_audio(self, text, voice_preset, speed):
+        await asyncio.sleep(self.delay)
+        self.finished += 1
+        return AudioGenerateResponse(
+            text=text, audio_url="/api/audio/files/audio_x.wav", voice_preset=voice_preset, speed=speed
+        )
+
+
+@pytest.fixture
+def phonetics(settings_env):
+    return PhoneticService()
+
+
+def _service(meaning=None, phonetics=None, tts=None):
+    return LookupService(
+        meaning=(lambda: meaning) if meaning else None,
+        phonetics=(lambda: phonetics) if phonetics else None,
+        tts=(lambda: tts) if tts else None
+    )
+
+
+def test_parts_run_concurrently(phonetics):
+    service = _service(SlowMeaning(0.3), phonetics, SlowTTS(0.3))
+
+    start = time.perf_counter()
+    result = asyncio.run(service.lookup("hello"))
+    elapsed = time.perf_counter() - start
+
+    assert result["meaning"].meaning == "meaning of hello"
+    assert result["phonetics"].words[0].word == "hello"
+    assert result["audio"].audio_url.endswith(".wav")
+    assert result["errors"] == {}
+    # Bounded by the slowest part, not the 0.6 s sum
+    assert elapsed < 0.5
+
+
+def test_slow_part_times_out_and_finishes_in_background(settings_env, phonetics):
+    settings_env.setenv("LOOKUP_AUDIO_TIMEOUT_SECONDS", "0.1")
+    get_settings.cache_clear()
+    tts = SlowTTS(0.3)
+    service = _service(SlowMeaning(0.05), phonetics, tts)
+
+    async def click():
+        result = await service.lookup("hello")
+        background = service.get_stats()["background"]
+        await asyncio.sleep(0.4)
+        return result, background
+
+    result, background = asyncio.run(click())
+
+    assert "audio" not in result
+    assert result["errors"] == {"audio": "timed out after 0.1s"}
+    assert result["meaning"] is not None and result["phonetics"] is not None
+    assert result["timings_ms"]["audio"] < 250
+    assert background == 1
+    # The synthesis still completed (and would have filled the TTS cache)
+    assert tts.finished == 1
+    assert service.get_stats()["parts"]["audio"]["timeouts"] == 1
+
+
+def test_blocking_gemini_client_does_not_stall_the_lookup(settings_env, phonetics):
+    settings_env.setenv("LOOKUP_MEANING_TIMEOUT_SECONDS", "0.1")
+    get_settings.cache_clear()
+    service = _service(BlockingMeaning(0.5), phonetics, SlowTTS(0.0))
+
+    async def click():
+        start = time.perf_counter()
+        result = await service.lookup("hello")
+        elapsed = time.perf_counter() - start
+        await asyncio.sleep(0.5)
+        return result, elapsed
+
+    result, elapsed = asyncio.run(click())
+
+    assert result["errors"] == {"meaning": "timed out after 0.1s"}
+    assert result["phonetics"] is not None and result["audio"] is not None
+    assert elapsed < 0.4
+
+
+def test_field_selection_and_disabled_parts(phonetics):
+    tts = SlowTTS(0.0)
+    service = _service(meaning=None, phonetics=phonetics, tts=tts)
+
+    result = asyncio.run(service.lookup("hello", fields=["phonetics", "meaning"]))
+
+    assert "phonetics" in result and "audio" not in result
+    assert result["errors"] == {"meaning": "disabled"}
+    assert tts.finished == 0
+
+
+def test_failed_part_is_reported(phonetics):
+    service = _service(SlowMeaning(0.0, fail=True), phonetics)
+
+    result = asyncio.run(service.lookup("hello"))
+
+    assert result["errors"] == {"meaning": "Gemini is down"}
+    assert result["phonetics"].word_count == 1
+
+
+def test_lookup_route(phonetics):
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_lookup_service] = lambda: _service(
+        SlowMeaning(0.0), phonetics, SlowTTS(0.0)
+    )
+    client = TestClient(app)
+
+    response = client.post("/api/lookup", json={"text": " hello ", "fields": ["meaning", "audio"]})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["text"] == "hello"
+    assert body["meaning"]["meaning"] == "meaning of hello"
+    assert body["audio"]["speed"] == 1.0
+    assert body["phonetics"] is None
+    assert set(body["timings_ms"]) == {"meaning", "audio"}
+
+    assert client.post("/api/lookup", json={"text": "hello", "fields": []}).status_code == 422
+    assert client.post("/api/lookup", json={"text": "hello", "fields": ["video"]}).status_code == 422
@@ -0,0 +1,142 @@
+# backend/tests/test_metrics.py
+import asyncio
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.api.dependencies import get_phonetic_service
+from backend.api.request_metrics import MetricsMiddleware
+from backend.api.routes.api_metrics import router
+from backend.core.metrics import (
+    Registry, Counter, Gauge, Histogram, EXECUTOR_WAIT_SECONDS, HTTP_REQUESTS, INFERENCE_SECONDS
+)
+
+
+def _app():
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+    app.include_router(router)
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: str):
+        return {"id": item_id}
+
+    return app
+
+
+def test_render_text_format():
+    registry = Registry()
+    hits = registry.register(Counter("hits_total", "Hits", ["cache"]))
+    depth = registry.register(Gauge("depth", "Queue depth"))
+    latency = registry.register(Histogram("latency_seconds", "Latency", buckets=(0.1, 1.0)))
+    registry.collector("items", "gauge", "Items", lambda: [({"cache": 'a"b'}, 3)])
+
+    hits.labels("words").inc()
+    hits.labels("words").inc(2)
+    depth.set(4)
+    for value in (0.05, 0.1, 0.5, 2.0):
+        latency.observe(value)
+
+    lines = registry.render().splitlines()
+
+    assert "# TYPE hits_total counter" in lines
+    assert 'hits_total{cache="words"} 3' in lines
+    assert "depth 4" in lines
+    # Cumulative buckets, upper bounds inclusive
+    assert 'latency_seconds_bucket{le="0.1"} 2' in lines
+    assert 'latency_seconds_bucket{le="1"} 3' in lines
+    assert 'latency_seconds_bucket{le="+Inf"} 4' in lines
+    assert "latency_seconds_count 4" in lines
+    assert "latency_seconds_sum 2.65" in lines
+    assert 'items{cache="a\\"b"} 3' in lines
+
+
+def test_middleware_labels_by_route_template():
+    client = TestClient(_app())
+    before = HTTP_REQUESTS.labels("GET", "/items/{item_id}", "200").value
+
+    for item_id in ("a", "b", "c"):
+        assert client.get(f"/items/{item_id}").status_code == 200
+    client.get("/nowhere")
+
+    assert HTTP_REQUESTS.labels("GET", "/items/{item_id}", "200").value == before + 3
+    text = client.get("/metrics").text
+    assert 'http_request_duration_seconds_count{method="GET",route="/items/{item_id}"}' in text
+    assert 'route="unmatched",status="404"' in text
+    assert "/items/a" not in text
+    assert "http_requests_in_flight 1" in text  # the scrape itself
+
+
+def test_metrics_report_live_service_caches(settings_env):
+    get_phonetic_service.cache_clear()
+    client = TestClient(_app())
+    try:
+        assert 'service="phonetic"' not in client.get("/metrics").text
+
+        phonetics = get_phonetic_service()
+        asyncio.run(phonetics.get_phonetics("hello hello world"))
+        text = client.get("/metrics").text
+    finally:
+        get_phonetic_service.cache_clear()
+
+    assert 'cache_hits_total{service="phonetic",cache="words"} 1' in text
+    assert 'cache_misses_total{service="phonetic",cache="words"} 2' in text
+    assert 'cache_items{service="phonetic",cache="words"} 2' in text
+    assert "# TYPE executor_queue_depth gauge" in text
+
+
+def test_pool_queue_wait_is_not_inference_time(settings_env):
+    from backend.services.tts_pool import TTSReplicaPool
+
+    settings_env.setenv("TTS_BACKEND", "stub")
+    inference = INFERENCE_SECONDS.labels("tts_stub_replica")
+    wait = EXECUTOR_WAIT_SECONDS.labels("tts_replicas")
+    before = (sum(inference.counts), inference.sum, sum(wait.counts), wait.sum)
+    pool = TTSReplicaPool("stub", 1)
+    try:
+        pool.start()
+
+        async def burst():
+            return await asyncio.gather(*(pool.synthesize("hello " * 40, "default") for _ in range(4)))
+
+        asyncio.run(burst())
+    finally:
+        pool.shutdown()
+
+    assert sum(inference.counts) - before[0] == 4
+    assert sum(wait.counts) - before[2] == 4
+    # One replica: the 2nd, 3rd and 4th chunk queue behind the others (~0+1+2+3 chunks)
+    assert wait.sum - before[3] > inference.sum - before[1] > 0
+
+
+def test_scoring_thread_wait_is_not_inference_time(settings_env, monkeypatch):
+    import numpy as np
+
+    from backend.services.coqui_tts_service import CoquiTTSService
+    from backend.services.pronunciation_service import PronunciationService
+
+    settings_env.setenv("TTS_BACKEND", "stub")
+    service = PronunciationService(tts_service=CoquiTTSService())
+    t = np.arange(service.sample_rate) / service.sample_rate
+    waveform = (0.3 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+    asyncio.run(service.analyze_pronunciation(waveform, "thank you"))  # reference built
+
+    # Every thread busy: the task waits 0.3 s before it starts
+    to_thread = asyncio.to_thread
+    depths = []
+
+    async def busy_to_thread(fn, *args):
+        depths.append(service.scoring_pending)
+        await asyncio.sleep(0.3)
+        return await to_thread(fn, *args)
+
+    monkeypatch.setattr(asyncio, "to_thread", busy_to_thread)
+    inference = INFERENCE_SECONDS.labels("pronunciation")
+    wait = EXECUTOR_WAIT_SECONDS.labels("pronunciation_threads")
+    before = (inference.sum, wait.sum)
+
+    asyncio.run(service.analyze_pronunciation(waveform, "thank you"))
+
+    assert wait.sum - before[1] >= 0.3
+    assert inference.sum - before[0] < 0.3
+    assert depths == [1] and service.scoring_pending == 0
@@ -1,21 +1,21 @@
-# test_phonetics_ipa.py
-
+# backend/tests/test_phonetic.py
 import eng_to_ipa as ipa
+import pytest
+
 
-# Test 3-letter words
-words = ["cat", "dog", "run", "big", "sit", "yes", "now", "the"]
+@pytest.mark.parametrize("word, expected", [
+    ("cat", "kæt"),
+    ("dog", "dɔg"),
+    ("run", "rən"),
+    ("big", "bɪg"),
+    ("sit", "sɪt"),
+    ("yes", "jɛs"),
+    ("now", "naʊ"),
+])
+def test_eng_to_ipa_three_letter_words(word, expected):
+    assert ipa.convert(word) == expected
 
-print("Testing eng_to_ipa with 3-letter words:\n")
-for word in words:
-    result = ipa.convert(word)
-    print(f"{word:10} → {result}")
 
-# Expected output:
-# cat        → kæt
-# dog        → dɔg
-# run        → rʌn
-# big        → bɪg
-# sit        → sɪt
-# yes        → jɛs
-# now        → naʊ
-# the        → ðə
\ No newline at end of file
+def test_unknown_word_is_starred():
+    # PhoneticService falls back to G2P on this marker
+    assert ipa.convert("rizz").endswith("*")
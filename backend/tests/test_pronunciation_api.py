@@ -0,0 +1,277 @@
+# backend/tests/test_pronunciation_api.py
+import io
+import json
+
+import numpy as np
+import pytest
+import soundfile as sf
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.api.dependencies import get_pronunciation_service
+from backend.api.routes.api_pronunciation import router
+from backend.api.upload_limits import UploadLimitMiddleware
+from backend.core.config import get_settings
+from backend.services.coqui_tts_service import CoquiTTSService
+from backend.services.pronunciation_service import PronunciationService
+
+
+@pytest.fixture(scope="module")
+def pronunciation_service(tmp_path_factory):
+    # Acoustic scoring against the stub TTS voice
+    with pytest.MonkeyPatch.context() as env:
+        env.setenv("TTS_BACKEND", "stub")
+        env.setenv("AUDIO_DIR", str(tmp_path_factory.mktemp("audio_files")))
+        get_settings.cache_clear()
+        service = PronunciationService(tts_service=CoquiTTSService())
+    get_settings.cache_clear()
+    service.pool.workers = 2
+    yield service
+    service.shutdown()
+
+
+@pytest.fixture
+def client(settings_env, pronunciation_service):
+    app = FastAPI()
+    app.add_middleware(UploadLimitMiddleware, limits={"/api/pronunciation/analyze": 200_000})
+    app.include_router(router)
+    app.dependency_overrides[get_pronunciation_service] = lambda: pronunciation_service
+    return TestClient(app)
+
+
+def _wav(seconds=0.5, sample_rate=22050):
+    buffer = io.BytesIO()
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    sf.write(buffer, 0.3 * np.sin(2 * np.pi * 220 * t), sample_rate, format="WAV")
+    return buffer.getvalue()
+
+
+def _files(n):
+    return [("audios", (f"student{i}.wav", io.BytesIO(_wav()), "audio/wav")) for i in range(n)]
+
+
+def _lines(response):
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_analyze_decodes_upload_in_memory(client, pronunciation_service, monkeypatch, tmp_path):
+    received = []
+    original = pronunciation_service.analyze_pronunciation
+
+    async def spy(waveform, text):
+        received.append(waveform)
+        return await original(waveform, text)
+
+    monkeypatch.setattr(pronunciation_service, "analyze_pronunciation", spy)
+
+    response = client.post(
+        "/api/pronunciation/analyze",
+        files={"audio": ("hello.wav", _wav(seconds=1.0), "audio/wav")},
+        data={"text": "hello"},
+    )
+
+    assert response.status_code == 200
+    # Scored against the (stub) TTS voice, not the text against itself
+    analysis = response.json()
+    assert "acoustic_score" in analysis
+    assert len(analysis["phoneme_scores"]) == len(analysis["reference_phonemes"].split())
+    # Resampled once to the analysis rate, nothing written to disk
+    (waveform,) = received
+    assert waveform.dtype == np.float32
+    assert len(waveform) == pytest.approx(pronunciation_service.sample_rate, abs=2)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_analysis_without_acoustic_reference_is_unavailable(settings_env):
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_pronunciation_service] = lambda: PronunciationService()
+
+    response = TestClient(app).post(
+        "/api/pronunciation/analyze",
+        files={"audio": ("hello.wav", _wav(seconds=1.0), "audio/wav")},
+        data={"text": "hello"},
+    )
+
+    assert response.status_code == 503
+    assert "unavailable" in response.json()["detail"]
+
+
+def test_oversized_upload_is_rejected_before_reading(client, pronunciation_service, monkeypatch):
+    monkeypatch.setattr(
+        pronunciation_service, "load_recording",
+        lambda source: pytest.fail("body should not be decoded")
+    )
+
+    response = client.post(
+        "/api/pronunciation/analyze",
+        files={"audio": ("long.wav", _wav(seconds=10.0), "audio/wav")},
+        data={"text": "hello"},
+    )
+
+    assert response.status_code == 413
+
+
+def test_per_file_limit(client, settings_env):
+    settings_env.setenv("PRONUNCIATION_MAX_UPLOAD_BYTES", "1000")
+    from backend.core.config import get_settings
+    get_settings.cache_clear()
+
+    response = client.post(
+        "/api/pronunciation/analyze",
+        files={"audio": ("a.wav", _wav(), "audio/wav")},
+        data={"text": "hello"},
+    )
+
+    assert response.status_code == 413
+
+
+def test_undecodable_upload_is_a_bad_request(client):
+    response = client.post(
+        "/api/pronunciation/analyze",
+        files={"audio": ("notes.wav", b"not audio", "audio/wav")},
+        data={"text": "hello"},
+    )
+
+    assert response.status_code == 400
+    assert "notes.wav" in response.json()["detail"]
+
+
+def test_batch_streams_each_result_then_summary(client, pronunciation_service, monkeypatch):
+    references = []
+    original = pronunciation_service.reference_for
+    monkeypatch.setattr(
+        pronunciation_service, "reference_for",
+        lambda text: references.append(text) or original(text)
+    )
+
+    texts = ["hello world", "good morning", "hello world", "hello world"]
+    response = client.post(
+        "/api/pronunciation/analyze/batch",
+        files=_files(4),
+        data={"texts": texts},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = _lines(response)
+    results, summary = lines[:-1], lines[-1]["summary"]
+
+    assert sorted(r["index"] for r in results) == [0, 1, 2, 3]
+    for r in results:
+        assert r["filename"] == f"student{r['index']}.wav"
+        assert r["text"] == texts[r["index"]]
+        assert "acoustic_score" in r["result"]
+    # Shared texts are converted to phonemes once
+    assert sorted(references) == ["good morning", "hello world"]
+    assert summary["recordings"] == summary["succeeded"] == 4
+    assert summary["distinct_texts"] == 2
+    assert summary["recordings_per_s"] > 0
+
+
+def test_single_text_applies_to_every_recording(client):
+    response = client.post(
+        "/api/pronunciation/analyze/batch",
+        files=_files(3),
+        data={"texts": ["thank you"]},
+    )
+
+    lines = _lines(response)
+    assert {r["text"] for r in lines[:-1]} == {"thank you"}
+    assert lines[-1]["summary"]["recordings"] == 3
+
+
+def test_mismatched_texts_are_rejected(client):
+    response = client.post(
+        "/api/pronunciation/analyze/batch",
+        files=_files(3),
+        data={"texts": ["one", "two"]},
+    )
+    assert response.status_code == 400
+
+
+def test_batch_with_undecodable_file_is_rejected(client):
+    files = _files(2) + [("audios", ("bad.wav", io.BytesIO(b"junk"), "audio/wav"))]
+    response = client.post(
+        "/api/pronunciation/analyze/batch",
+        files=files,
+        data={"texts": ["hello"]},
+    )
+    assert response.status_code == 400
+    assert "bad.wav" in response.json()["detail"]
+
+
+def test_silent_recording_in_batch_is_rejected_alone(client):
+    buffer = io.BytesIO()
+    sf.write(buffer, np.zeros(22050), 22050, format="WAV")
+    files = _files(2) + [("audios", ("quiet.wav", io.BytesIO(buffer.getvalue()), "audio/wav"))]
+
+    response = client.post(
+        "/api/pronunciation/analyze/batch",
+        files=files,
+        data={"texts": ["hello"]},
+    )
+
+    lines = _lines(response)
+    by_name = {r["filename"]: r for r in lines[:-1]}
+    assert by_name["quiet.wav"]["error_type"] == "empty_recording"
+    assert by_name["student0.wav"]["result"]["preprocessing"]["samples_removed"] >= 0
+    assert lines[-1]["summary"]["failed"] == 1
+
+
+def test_silent_recording_is_unprocessable(client):
+    buffer = io.BytesIO()
+    sf.write(buffer, np.zeros(22050), 22050, format="WAV")
+
+    response = client.post(
+        "/api/pronunciation/analyze",
+        files={"audio": ("quiet.wav", buffer.getvalue(), "audio/wav")},
+        data={"text": "hello"},
+    )
+
+    assert response.status_code == 422
+
+
+def test_repeated_upload_is_served_from_cache(client, pronunciation_service, monkeypatch):
+    calls = []
+    original = pronunciation_service.analyze_pronunciation
+
+    async def spy(waveform, text):
+        calls.append(text)
+        return await original(waveform, text)
+
+    monkeypatch.setattr(pronunciation_service, "analyze_pronunciation", spy)
+    take = _wav(seconds=0.7)
+
+    def post(text, audio=take):
+        return client.post(
+            "/api/pronunciation/analyze",
+            files={"audio": ("take.wav", audio, "audio/wav")},
+            data={"text": text},
+        ).json()
+
+    first = post("good night")
+    retry = post("Good night!")
+    other_text = post("good morning")
+    other_take = post("good night", audio=_wav(seconds=0.8))
+
+    assert first["cache"]["hit"] is False
+    assert retry["cache"]["hit"] is True
+    assert retry["cache"]["key"] == first["cache"]["key"]
+    assert retry["cache"]["saved_ms"] >= 0
+    assert retry["mir"] == first["mir"]
+    assert other_text["cache"]["hit"] is False and other_take["cache"]["hit"] is False
+    assert calls == ["good night", "good morning", "good night"]
+    assert pronunciation_service.get_stats()["analyses"]["hits"] >= 1
+
+
+def test_cached_analyses_expire(settings_env):
+    settings_env.setenv("PRONUNCIATION_RESULT_CACHE_TTL_SECONDS", "0")
+    from backend.core.config import get_settings
+    get_settings.cache_clear()
+    service = PronunciationService()
+    key = service.upload_key(io.BytesIO(_wav()), "hello")
+
+    service.remember_analysis(key, {"mir": 100.0}, 0.5)
+
+    assert service.cached_analysis(key) is None
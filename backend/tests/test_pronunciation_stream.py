@@ -0,0 +1,187 @@
+# backend/tests/test_pronunciation_stream.py
+import asyncio
+
+import numpy as np
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.api.dependencies import get_pronunciation_service
+from backend.api.routes.api_pronunciation import router
+from backend.services.acoustic_service import OnlineDTW
+from backend.services.coqui_tts_service import CoquiTTSService
+from backend.services.pronunciation_service import LiveSession, PronunciationService, score_recording
+
+TEXT = "good morning teacher"
+
+
+@pytest.fixture
+def service(settings_env):
+    settings_env.setenv("TTS_BACKEND", "stub")
+    return PronunciationService(tts_service=CoquiTTSService())
+
+
+@pytest.fixture
+def client(service):
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_pronunciation_service] = lambda: service
+    return TestClient(app)
+
+
+def _speech(service, text):
+    """16 kHz learner audio (the TTS voice itself) with silence around it"""
+    waveform, sample_rate = asyncio.run(service.acoustic.tts_service.get_waveform(text))
+    import librosa
+    audio = librosa.resample(np.asarray(waveform, dtype=np.float32), orig_sr=sample_rate, target_sr=16000)
+    silence = np.zeros(4000, dtype=np.float32)
+    return np.concatenate([silence, audio, silence])
+
+
+def _pcm_chunks(audio, size=1600):
+    pcm = (np.clip(audio, -1, 1) * 32767).astype("<i2").tobytes()
+    return [pcm[i:i + 2 * size] for i in range(0, len(pcm), 2 * size)]
+
+
+def _stream(client, text, chunks):
+    with client.websocket_connect("/api/pronunciation/stream") as ws:
+        ws.send_json({"type": "start", "text": text, "sample_rate": 16000})
+        ready = ws.receive_json()
+        partials = []
+        for chunk in chunks:
+            ws.send_bytes(chunk)
+            partials.append(ws.receive_json())
+        ws.send_json({"type": "stop"})
+        return ready, partials, ws.receive_json()
+
+
+def test_partials_then_final_analysis(client, service):
+    chunks = _pcm_chunks(_speech(service, TEXT))
+
+    ready, partials, final = _stream(client, TEXT, chunks)
+
+    assert ready["type"] == "ready" and ready["words"] == TEXT.split()
+    assert all(p["type"] == "partial" for p in partials)
+    # Words are reported as they are reached, in order
+    reached = [len(p["words"]) for p in partials]
+    assert reached == sorted(reached) and reached[-1] == 3
+    assert partials[-1]["progress"] > 0.8
+
+    assert final["type"] == "final"
+    assert final["result"]["mir"] == 100.0
+    assert final["result"]["acoustic_score"] > 90
+    assert final["stats"]["chunks"] == len(chunks)
+    assert final["stats"]["dropped"] == 0
+    assert final["stats"]["latency_p95_ms"] is not None
+
+
+def test_wrong_sentence_scores_lower_live(client, service):
+    matching = _stream(client, TEXT, _pcm_chunks(_speech(service, TEXT)))[1]
+    wrong = _stream(client, TEXT, _pcm_chunks(_speech(service, "thank you very much")))[1]
+
+    def mean_score(partials):
+        return np.mean([w["score"] for w in partials[-1]["words"]])
+
+    assert mean_score(wrong) < mean_score(matching)
+
+
+def test_chunks_beyond_the_queue_are_dropped(client, service, settings_env):
+    settings_env.setenv("PRONUNCIATION_STREAM_MAX_PENDING_CHUNKS", "1")
+    from backend.core.config import get_settings
+    get_settings.cache_clear()
+    chunks = _pcm_chunks(_speech(service, TEXT), size=160)
+
+    with client.websocket_connect("/api/pronunciation/stream") as ws:
+        ws.send_json({"type": "start", "text": TEXT})
+        ws.receive_json()
+        for chunk in chunks:
+            ws.send_bytes(chunk)
+        ws.send_json({"type": "stop"})
+        messages = []
+        while not messages or messages[-1]["type"] != "final":
+            messages.append(ws.receive_json())
+
+    stats = messages[-1]["stats"]
+    assert stats["dropped"] > 0
+    assert stats["chunks"] + stats["dropped"] == len(chunks)
+
+
+def test_start_message_is_validated(client):
+    with client.websocket_connect("/api/pronunciation/stream") as ws:
+        ws.send_json({"type": "start", "text": "  "})
+        assert ws.receive_json()["type"] == "error"
+
+
+@pytest.mark.parametrize("start", [[], "start", 16000, None])
+def test_start_message_must_be_an_object(client, start):
+    with client.websocket_connect("/api/pronunciation/stream") as ws:
+        ws.send_json(start)
+        error = ws.receive_json()
+
+    assert error["type"] == "error" and "start" in error["detail"]
+
+
+def test_sample_rate_must_be_an_integer(client):
+    with client.websocket_connect("/api/pronunciation/stream") as ws:
+        ws.send_json({"type": "start", "text": TEXT, "sample_rate": "16000"})
+        error = ws.receive_json()
+
+    assert error["type"] == "error" and "sample_rate" in error["detail"]
+
+
+def test_scoring_failure_is_reported(client, monkeypatch):
+    def broken(self, chunk):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(LiveSession, "feed", broken)
+    with client.websocket_connect("/api/pronunciation/stream") as ws:
+        ws.send_json({"type": "start", "text": TEXT})
+        ws.receive_json()
+        ws.send_bytes(b"\x00\x01" * 800)
+        error = ws.receive_json()
+
+    assert error == {"type": "error", "detail": "Live scoring failed"}
+
+
+def test_silent_stream_ends_with_an_error(client):
+    with client.websocket_connect("/api/pronunciation/stream") as ws:
+        ws.send_json({"type": "start", "text": TEXT})
+        ws.receive_json()
+        ws.send_bytes(bytes(3200))
+        ws.receive_json()
+        ws.send_json({"type": "stop"})
+        error = ws.receive_json()
+
+    assert error["type"] == "error" and "silent" in error["detail"]
+
+
+def test_resampled_stream_scores_like_one_recording(service):
+    import librosa
+    audio = librosa.resample(_speech(service, TEXT), orig_sr=16000, target_sr=44100)
+    pcm = (np.clip(audio, -1, 1) * 32767).astype("<i2").tobytes()
+    session = asyncio.run(service.start_live_session(TEXT, 44100))
+
+    # Odd sizes: samples split across chunks
+    for start in range(0, len(pcm), 4411):
+        partial = session.feed(pcm[start:start + 4411])
+    final = session.finish()
+
+    received = np.frombuffer(pcm, dtype="<i2").astype(np.float32) / 32768.0
+    whole = librosa.resample(received, orig_sr=44100, target_sr=16000)
+    assert final == score_recording(service.metrics, whole, session.reference, session.acoustic_params)
+    assert final["mir"] == 100.0
+    assert partial["progress"] > 0.8 and len(partial["words"]) == 3
+
+
+def test_online_dtw_follows_a_matching_recording(service):
+    audio = _speech(service, TEXT)
+    reference, _, _ = service.reference_for(TEXT)
+    features = asyncio.run(service.acoustic.reference_features(TEXT))
+    online = OnlineDTW(features, reference)
+
+    for start in range(0, len(audio), 1600):
+        online.feed(audio[start:start + 1600])
+
+    assert np.all(np.diff(online.path) >= 0)
+    assert online.path[-1] >= len(features) * 0.9
+    assert online.current_phoneme == len(reference) - 1
@@ -0,0 +1,90 @@
+# backend/tests/test_reference_cache.py
+import asyncio
+
+import numpy as np
+import pytest
+
+from backend.services.coqui_tts_service import CoquiTTSService
+from backend.services.pronunciation_service import PronunciationService, normalize_text, score_recording
+
+
+@pytest.fixture
+def service(settings_env):
+    return PronunciationService()
+
+
+def test_normalized_texts_share_an_entry(service, monkeypatch):
+    built = []
+    original = service.reference_for
+    monkeypatch.setattr(service, "reference_for", lambda text: built.append(text) or original(text))
+
+    first = asyncio.run(service.get_reference("Good morning teacher"))
+    second = asyncio.run(service.get_reference("  good   MORNING teacher "))
+
+    assert second is first
+    assert built == ["good morning teacher"]
+    stats = service.get_stats()["references"]
+    assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+    assert normalize_text(" A  b ") == "a b"
+
+
+def test_reference_holds_precomputed_data(service):
+    reference = asyncio.run(service.get_reference("hello world"))
+
+    assert reference.phonemes == ["HH", "AH", "L", "OW", "W", "ER", "L", "D"]
+    assert reference.boundaries == [4]
+    np.testing.assert_array_equal(reference.codes, service.wpsm.encode(reference.phonemes))
+    _, _, aligned = service.metrics.aligner.align(reference.phonemes, reference.phonemes)
+    assert reference.identity == pytest.approx(aligned)
+    # Text-only service: no acoustic reference
+    assert reference.features is None
+
+
+def test_analysis_reuses_identity_score(settings_env, monkeypatch):
+    settings_env.setenv("TTS_BACKEND", "stub")
+    service = PronunciationService(tts_service=CoquiTTSService())
+    t = np.arange(service.sample_rate) / service.sample_rate
+    waveform = (0.3 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+    first = asyncio.run(service.analyze_pronunciation(waveform, "thank you"))
+
+    monkeypatch.setattr(
+        service.metrics, "identity_score",
+        lambda phonemes: pytest.fail("identity score should come from the cache")
+    )
+    analysis = asyncio.run(service.analyze_pronunciation(waveform, "Thank you"))
+
+    assert analysis["mir"] == first["mir"]
+
+
+def test_scoring_aligns_against_cached_codes(settings_env, monkeypatch):
+    settings_env.setenv("TTS_BACKEND", "stub")
+    service = PronunciationService(tts_service=CoquiTTSService())
+    reference = asyncio.run(service.get_reference("thank you"))
+    passed = []
+    original = service.metrics.aligner.align
+    monkeypatch.setattr(
+        service.metrics.aligner, "align",
+        lambda *args, codes2=None, **kwargs: passed.append(codes2) or original(*args, codes2=codes2, **kwargs)
+    )
+    t = np.arange(service.sample_rate) / service.sample_rate
+    waveform = (0.3 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+    score_recording(service.metrics, waveform, reference, service.acoustic.params)
+
+    assert passed and passed[0] is reference.codes
+
+
+def test_missing_acoustic_features_are_retried(settings_env, monkeypatch):
+    settings_env.setenv("TTS_BACKEND", "stub")
+    service = PronunciationService(tts_service=CoquiTTSService())
+    original = service.acoustic.tts_service.get_waveform
+
+    async def unavailable(*args):
+        raise RuntimeError("TTS down")
+
+    monkeypatch.setattr(service.acoustic.tts_service, "get_waveform", unavailable)
+    assert asyncio.run(service.get_reference("good morning")).features is None
+
+    monkeypatch.setattr(service.acoustic.tts_service, "get_waveform", original)
+    assert asyncio.run(service.get_reference("good morning")).features is not None
+    assert len(service.references) == 1
@@ -0,0 +1,176 @@
+# backend/tests/test_transcripts.py
+import asyncio
+import json
+import threading
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.api.dependencies import get_transcript_service
+from backend.api.routes.api_transcript import router
+from backend.api.schemas.api_schemas import AudioGenerateResponse
+from backend.core.config import get_settings
+from backend.core.exceptions import ServiceBusyError
+from backend.services.phonetic_service import PhoneticService
+from backend.services.transcript_service import TranscriptService, clean_line
+
+LINES = [
+    {"start": 12.0, "duration": 2.0, "text": "see you tomorrow"},
+    {"start": 0.5, "duration": 2.0, "text": "[Music]"},
+    {"start": 3.0, "duration": 2.5, "text": "Hello &amp; welcome back!"},
+    {"start": 6.0, "duration": 3.0, "text": "Today we talk about rizz"},
+    {"start": 9.5, "duration": 2.0, "text": "Hello &amp; welcome back!"},
+]
+
+
+class RecordingTTS:
+    def __init__(self, delay=0.0, fail_on=None):
+        self.delay = delay
+        self.fail_on = fail_on
+        self.texts = []
+
+    async def generate_audio(self, text, voice_preset, speed):
+        self.texts.append(text)
+        await asyncio.sleep(self.delay)
+        if text == self.fail_on:
+            raise RuntimeError("synthesis failed")
+        return AudioGenerateResponse(
+            text=text, audio_url=f"/api/audio/files/{len(self.texts)}.wav",
+            duration=1.0, voice_preset=voice_preset, speed=speed
+        )
+
+
+@pytest.fixture
+def phonetics(settings_env):
+    return PhoneticService()
+
+
+def _service(phonetics=None, tts=None):
+    return TranscriptService(
+        phonetics=(lambda: phonetics) if phonetics else None,
+        tts=(lambda: tts) if tts else None
+    )
+
+
+async def _collect(service, lines, **kwargs):
+    job = service.start(lines, **kwargs)
+    return job, [event async for event in job.stream()]
+
+
+def test_clean_line():
+    assert clean_line("  [Music] Hello &amp; (laughs)  bye ") == "Hello & bye"
+
+
+def test_job_prepares_vocabulary_and_line_audio(phonetics):
+    tts = RecordingTTS()
+    service = _service(phonetics, tts)
+
+    job, events = asyncio.run(_collect(service, LINES))
+
+    # Unique words, cues dropped, in playback order
+    assert job.words == ["hello", "welcome", "back", "today", "we", "talk", "about", "rizz", "see", "you", "tomorrow"]
+    words = [w for e in events if e["type"] == "phonetics" for w in e["words"]]
+    assert [w["word"] for w in words] == job.words
+    # Word clicks during playback are now cache hits
+    assert "rizz_True_True" in phonetics.cache
+
+    # One clip per distinct line, earliest first; repeats share it
+    assert tts.texts == ["Hello & welcome back!", "Today we talk about rizz", "see you tomorrow"]
+    audio = [e for e in events if e["type"] == "audio"]
+    assert audio[0]["lines"] == [2, 4]
+
+    assert events[-1]["type"] == "done"
+    assert events[-1]["summary"]["audio_done"] == 3
+    assert job.status == "done"
+
+
+def test_phonetics_stay_on_the_event_loop_and_yield(phonetics, monkeypatch):
+    # The phonetic and G2P caches are shared with requests and not thread-safe
+    threads, ticks = [], []
+    lookup_words = phonetics.lookup_words
+    monkeypatch.setattr(
+        phonetics, "lookup_words", lambda words: threads.append(threading.get_ident()) or lookup_words(words)
+    )
+
+    async def run():
+        async def ticker():
+            while True:
+                ticks.append(len(threads))
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        await _collect(_service(phonetics), LINES)
+        task.cancel()
+
+    asyncio.run(run())
+
+    assert set(threads) == {threading.get_ident()}
+    # Other coroutines ran between words, not only between batches
+    assert len(set(ticks)) > len(threads) // 2
+
+
+def test_position_skips_lines_already_played(phonetics):
+    tts = RecordingTTS()
+    service = _service(phonetics, tts)
+
+    asyncio.run(_collect(service, LINES, position=9.2))
+
+    assert tts.texts == ["Hello & welcome back!", "see you tomorrow"]
+
+
+def test_failed_line_does_not_stop_the_job(phonetics):
+    tts = RecordingTTS(fail_on="Today we talk about rizz")
+    service = _service(phonetics, tts)
+
+    job, events = asyncio.run(_collect(service, LINES))
+
+    errors = [e for e in events if e["type"] == "audio_error"]
+    assert errors == [{"type": "audio_error", "lines": [3], "error": "synthesis failed"}]
+    assert job.status == "done" and job.audio_done == 2 and job.audio_failed == 1
+
+
+def test_cancel_and_active_job_limit(settings_env, phonetics):
+    settings_env.setenv("TRANSCRIPT_MAX_ACTIVE_JOBS", "1")
+    get_settings.cache_clear()
+    service = _service(phonetics, RecordingTTS(delay=5.0))
+
+    async def scenario():
+        job = service.start(LINES)
+        with pytest.raises(ServiceBusyError):
+            service.start(LINES)
+        await asyncio.sleep(0.05)
+        await service.cancel(job.id)
+        events = [event async for event in job.stream()]
+        # A slot is free again
+        service.start(LINES, synthesize_audio=False)
+        await service.shutdown()
+        return job, events
+
+    job, events = asyncio.run(scenario())
+
+    assert job.status == "cancelled"
+    assert events[-1]["status"] == "cancelled"
+
+
+def test_transcript_routes(phonetics):
+    app = FastAPI()
+    app.include_router(router)
+    service = _service(phonetics, RecordingTTS())
+    app.dependency_overrides[get_transcript_service] = lambda: service
+
+    with TestClient(app) as client:
+        response = client.post("/api/transcripts", json={"lines": LINES})
+        assert response.status_code == 202
+        handle = response.json()
+        assert handle["words"] == 11 and handle["audio_total"] == 3
+
+        events = [json.loads(line) for line in client.get(handle["events_url"]).text.splitlines()]
+        assert events[-1]["type"] == "done"
+        # Replay from an offset (e.g. after a reconnect)
+        replay = client.get(handle["events_url"], params={"since": len(events) - 1}).text.splitlines()
+        assert [json.loads(line)["type"] for line in replay] == ["done"]
+
+        assert client.get(handle["status_url"]).json()["status"] == "done"
+        assert client.get("/api/transcripts/unknown").status_code == 404
+        assert client.post("/api/transcripts", json={"lines": []}).status_code == 422
@@ -0,0 +1,65 @@
+# backend/tests/test_tts_backends.py
+import numpy as np
+import pytest
+
+from backend.core.config import get_settings
+from backend.core.exceptions import ValidationError
+from backend.services.tts_backends import (
+    TTS_BACKENDS,
+    BarkTransformerBackend,
+    CoquiVitsBackend,
+    OnnxVitsBackend,
+    StubBackend,
+    create_backend,
+)
+
+
+def test_registry_contains_all_engines():
+    assert {"coqui_vits", "bark", "stub"} <= set(TTS_BACKENDS)
+
+
+def test_backend_selected_by_settings(settings_env):
+    settings_env.setenv("TTS_BACKEND", "stub")
+    assert isinstance(create_backend(get_settings()), StubBackend)
+
+    settings_env.setenv("USE_TRANSFORMER_BARK", "true")
+    get_settings.cache_clear()
+    assert isinstance(create_backend(get_settings()), BarkTransformerBackend)
+
+
+def test_unknown_backend(settings_env):
+    with pytest.raises(ValueError, match="Unknown TTS backend"):
+        create_backend(get_settings(), "espeak")
+
+
+def test_vits_voice_mapping(settings_env):
+    backend = CoquiVitsBackend(get_settings())
+    assert backend.resolve_voice("v2/en_speaker_0") == "p225"
+    assert backend.resolve_voice("p300") == "p300"
+    assert backend.resolve_voice("unknown") == "p231"
+
+
+def test_onnx_rejects_voice_missing_from_export(settings_env):
+    backend = OnnxVitsBackend(get_settings())
+    # As loaded from an export that only has p225
+    backend.loaded = True
+    backend.speaker_ids = {"p225": 0}
+
+    with pytest.raises(ValidationError, match="p300"):
+        backend.synthesize("hello", "p300")
+
+
+def test_stub_synthesis_is_measured(settings_env):
+    backend = create_backend(get_settings(), "stub")
+    first = backend.synthesize("hello world", "v2/en_speaker_6")
+    second = backend.synthesize("hello world", "v2/en_speaker_6")
+
+    assert first.dtype == np.float32
+    np.testing.assert_array_equal(first, second)
+
+    stats = backend.get_stats()
+    assert stats["calls"] == 2
+    assert stats["loaded"]
+    assert stats["avg_latency_s"] >= 0
+    assert stats["real_time_factor"] is not None
+    assert stats["peak_rss_delta_mb"] is not None
@@ -0,0 +1,97 @@
+# backend/tests/test_tts_long_text.py
+import asyncio
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from backend.core.config import get_settings
+from backend.services.audio_utils import chunk_text
+from backend.services.coqui_tts_service import CoquiTTSService
+
+PARAGRAPH = " ".join(
+    f"Sentence number {i} talks about learning English every single day." for i in range(8)
+)
+
+
+def _read(service, response):
+    data, _ = sf.read(service.audio_dir / response.audio_url.rsplit("/", 1)[1], dtype="float32")
+    return data
+
+
+def test_chunk_text_respects_limit():
+    long_sentence = "one, two, three, " * 30 + "four"
+    chunks = chunk_text("Short one. " + long_sentence, max_chars=50)
+
+    assert chunks[0] == "Short one."
+    assert all(len(c) <= 50 for c in chunks)
+    assert " ".join(chunks).split() == ("Short one. " + long_sentence).split()
+
+
+def test_long_text_is_not_truncated(settings_env):
+    settings_env.setenv("TTS_BACKEND", "stub")
+    service = CoquiTTSService()
+
+    response = asyncio.run(service.generate_audio(PARAGRAPH))
+
+    assert response.text == PARAGRAPH
+    assert service.get_cache_stats()["segment_cache"]["misses"] == 8
+
+
+def test_replicas_produce_same_audio_as_single_model(settings_env):
+    settings_env.setenv("TTS_BACKEND", "stub")
+    sequential = CoquiTTSService()
+    expected = _read(sequential, asyncio.run(sequential.generate_audio(PARAGRAPH)))
+
+    settings_env.setenv("TTS_REPLICAS", "2")
+    # Fresh directory, otherwise the first run's wav is reused from disk
+    settings_env.setenv("AUDIO_DIR", "audio_parallel")
+    get_settings.cache_clear()
+    parallel = CoquiTTSService()
+    try:
+        actual = _read(parallel, asyncio.run(parallel.generate_audio(PARAGRAPH)))
+        stats = parallel.get_cache_stats()
+    finally:
+        parallel.shutdown()
+
+    assert stats["parallel_requests"] == 1
+    assert stats["replicas"]["completed_chunks"] == 8
+    np.testing.assert_allclose(actual, expected, atol=1e-4)
+
+
+def test_short_text_keeps_fast_path(settings_env):
+    settings_env.setenv("TTS_BACKEND", "stub")
+    settings_env.setenv("TTS_REPLICAS", "2")
+    service = CoquiTTSService()
+
+    asyncio.run(service.generate_audio("Hello. How are you?"))
+
+    assert service.get_cache_stats()["replicas"]["started"] is False
+
+
+def test_replica_pool_starts_every_worker_and_recovers(settings_env):
+    import os
+    import signal
+
+    from backend.core.exceptions import ExternalServiceError
+    from backend.services.tts_pool import TTSReplicaPool
+
+    settings_env.setenv("TTS_BACKEND", "stub")
+    pool = TTSReplicaPool("stub", 2)
+    try:
+        pool.start()
+        assert len(set(pool.worker_pids)) == 2
+
+        # Replicas killed (e.g. OOM): that call fails, the next one gets a fresh pool
+        for pid in pool.worker_pids:
+            os.kill(pid, signal.SIGKILL)
+        with pytest.raises(ExternalServiceError):
+            asyncio.run(pool.synthesize("hello", "default"))
+        audio = asyncio.run(pool.synthesize("hello", "default"))
+    finally:
+        pool.shutdown()
+
+    assert len(audio) > 0
+    stats = pool.get_stats()
+    assert stats["restarts"] == 1
+    assert (stats["completed_chunks"], stats["failed_chunks"]) == (1, 1)
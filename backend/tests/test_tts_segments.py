@@ -0,0 +1,134 @@
+# backend/tests/test_tts_segments.py
+import asyncio
+
+import numpy as np
+import pytest
+
+from backend.core.exceptions import ValidationError
+from backend.services.audio_utils import crossfade_concat, split_sentences, time_stretch
+from backend.services.coqui_tts_service import CoquiTTSService
+from backend.services.tts_backends import StubBackend
+
+
+class RecordingBackend(StubBackend):
+    """Stub engine that remembers what it was asked to synthesize"""
+
+    def __init__(self, settings):
+        super().__init__(settings)
+        self.calls = []
+
+    def _synthesize(self, text, voice):
+        self.calls.append(text)
+        return super()._synthesize(text, voice)
+
+
+@pytest.fixture
+def service(settings_env):
+    service = CoquiTTSService()
+    service.backend = RecordingBackend(service.settings)
+    return service
+
+
+def test_split_sentences():
+    assert split_sentences("Hello.  How are you?") == ["Hello.", "How are you?"]
+    assert split_sentences('He said "hi." Then left!') == ['He said "hi."', "Then left!"]
+    assert split_sentences("no punctuation") == ["no punctuation"]
+    assert split_sentences("   ") == []
+
+
+def test_crossfade_concat_overlaps_segments():
+    a = np.ones(100, dtype=np.float32)
+    b = np.ones(100, dtype=np.float32)
+    out = crossfade_concat([a, b], sample_rate=1000, crossfade_ms=10)
+
+    assert len(out) == 190
+    # Linear fades of equal signals sum back to the signal
+    np.testing.assert_allclose(out, 1.0, atol=1e-6)
+
+
+def test_only_uncached_segments_are_synthesized(service):
+    asyncio.run(service.generate_audio("Hello. How are you?"))
+    assert service.backend.calls == ["Hello.", "How are you?"]
+
+    response = asyncio.run(service.generate_audio("How are you? Fine."))
+    assert service.backend.calls[2:] == ["Fine."]
+    assert (service.audio_dir / response.audio_url.rsplit("/", 1)[1]).exists()
+
+    stats = service.get_cache_stats()["segment_cache"]
+    assert stats["hits"] == 1
+    assert stats["misses"] == 3
+    assert stats["hit_rate"] == 0.25
+
+
+def test_segments_are_cached_per_speaker(service):
+    asyncio.run(service.generate_audio("Hello.", "p225"))
+    asyncio.run(service.generate_audio("Hello.", "p226"))
+    assert service.backend.calls == ["Hello.", "Hello."]
+
+
+def test_time_stretch_changes_length_not_pitch():
+    sr = 16000
+    t = np.arange(sr) / sr
+    tone = (0.5 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
+
+    slow = time_stretch(tone, 0.5)
+    assert slow.dtype == np.float32
+    assert abs(len(slow) - 2 * len(tone)) < sr * 0.01
+    assert np.abs(slow).max() <= 0.5 + 1e-6
+
+    spectrum = np.abs(np.fft.rfft(slow))
+    peak_hz = np.argmax(spectrum) * sr / len(slow)
+    assert abs(peak_hz - 440) < 5
+
+
+def test_speed_variants_reuse_base_waveform(service):
+    normal = asyncio.run(service.generate_audio("Hello. How are you?"))
+    assert service.backend.calls == ["Hello.", "How are you?"]
+
+    slow = asyncio.run(service.generate_audio("Hello. How are you?", speed=0.5))
+    slower_again = asyncio.run(service.generate_audio("Hello. How are you?", speed=0.5))
+
+    # No new model calls, the variant is stretched from the cached base clip
+    assert service.backend.calls == ["Hello.", "How are you?"]
+    assert slower_again is slow
+    assert slow.speed == 0.5
+    assert slow.audio_url != normal.audio_url
+    assert slow.duration == pytest.approx(2 * normal.duration, rel=0.02)
+    assert (service.audio_dir / slow.audio_url.rsplit("/", 1)[1]).exists()
+    assert service.get_cache_stats()["speed_variants"] == 1
+
+
+def test_speed_variant_after_restart_reads_base_from_disk(settings_env):
+    first = CoquiTTSService()
+    first.backend = RecordingBackend(first.settings)
+    asyncio.run(first.generate_audio("Hello."))
+
+    second = CoquiTTSService()
+    second.backend = RecordingBackend(second.settings)
+    response = asyncio.run(second.generate_audio("Hello.", speed=0.75))
+
+    assert second.backend.calls == []
+    assert response.speed == 0.75
+
+
+def test_wav_files_are_written_off_the_event_loop(service, monkeypatch):
+    import threading
+
+    import soundfile as sf
+
+    threads = []
+    write = sf.write
+    monkeypatch.setattr(
+        sf, "write", lambda *args, **kwargs: threads.append(threading.get_ident()) or write(*args, **kwargs)
+    )
+
+    asyncio.run(service.generate_audio("Hello.", speed=0.75))
+
+    # Base clip, then the 0.75x variant, neither on this (the loop's) thread
+    assert len(threads) == 2
+    assert threading.get_ident() not in threads
+
+
+def test_speed_out_of_range_is_rejected(service):
+    with pytest.raises(ValidationError):
+        asyncio.run(service.generate_audio("Hello.", speed=5.0))
@@ -0,0 +1,97 @@
+# backend/tests/test_vad.py
+import asyncio
+
+import numpy as np
+import pytest
+
+from backend.core.exceptions import ClippedRecordingError, EmptyRecordingError
+from backend.services.coqui_tts_service import CoquiTTSService
+from backend.services.pronunciation_service import PronunciationService
+from backend.services.vad import frame_db, prepare_recording
+
+RATE = 16000
+
+
+def _tone(seconds, amplitude=0.3, freq=220.0):
+    t = np.arange(int(seconds * RATE)) / RATE
+    return (amplitude * np.sin(2 * np.pi * freq * t)).astype(np.float32)
+
+
+def _padded(speech, before, after, noise=0.0, seed=0):
+    """`speech` between stretches of (optionally noisy) silence"""
+    rng = np.random.default_rng(seed)
+    waveform = np.concatenate([np.zeros(int(before * RATE)), speech, np.zeros(int(after * RATE))])
+    return (waveform + noise * rng.standard_normal(len(waveform))).astype(np.float32)
+
+
+def test_frame_db_matches_direct_rms():
+    waveform = np.random.default_rng(1).standard_normal(RATE).astype(np.float32) * 0.1
+    levels = frame_db(waveform, 320, 160)
+
+    frames = np.lib.stride_tricks.sliding_window_view(waveform, 320)[::160]
+    expected = 10 * np.log10(np.mean(frames.astype(np.float64) ** 2, axis=1) + 1e-10)
+    np.testing.assert_allclose(levels, expected, atol=1e-4)
+
+
+@pytest.mark.parametrize("noise", [0.0, 0.002])
+def test_silence_is_trimmed(noise):
+    waveform = _padded(_tone(1.0), before=2.0, after=1.5, noise=noise)
+
+    speech, report = prepare_recording(waveform, RATE, pad_ms=100)
+
+    # 1 s of speech plus ~100 ms padding on each side
+    assert len(speech) / RATE == pytest.approx(1.2, abs=0.05)
+    assert report["samples_removed"] == len(waveform) - len(speech)
+    assert report["seconds_removed"] == pytest.approx(3.3, abs=0.05)
+
+
+def test_loudness_is_normalized():
+    quiet, _ = prepare_recording(_tone(1.0, amplitude=0.02), RATE, target_dbfs=-20)
+    loud, _ = prepare_recording(_tone(1.0, amplitude=0.5), RATE, target_dbfs=-20)
+
+    for speech in (quiet, loud):
+        rms_db = 20 * np.log10(np.sqrt(np.mean(speech.astype(np.float64) ** 2)))
+        assert rms_db == pytest.approx(-20, abs=0.5)
+
+
+def test_gain_never_clips():
+    # A click over a hum: reaching the target would push the click past full scale
+    waveform = _tone(1.0, amplitude=0.05)
+    waveform[RATE // 2] = 0.9
+
+    speech, report = prepare_recording(waveform, RATE, target_dbfs=-10)
+
+    assert np.abs(speech).max() == pytest.approx(0.95, abs=1e-3)
+    assert report["gain_db"] < 1
+
+
+@pytest.mark.parametrize("waveform", [
+    np.zeros(RATE, dtype=np.float32),
+    np.zeros(0, dtype=np.float32),
+    # A single click is not speech
+    _padded(_tone(0.02), before=1.0, after=1.0),
+])
+def test_empty_recordings_are_rejected(waveform):
+    with pytest.raises(EmptyRecordingError):
+        prepare_recording(waveform, RATE)
+
+
+def test_clipped_recording_is_rejected():
+    clipped = np.clip(_tone(1.0, amplitude=3.0), -1.0, 1.0)
+
+    with pytest.raises(ClippedRecordingError) as e:
+        prepare_recording(clipped, RATE)
+    assert e.value.status_code == 422
+
+
+def test_service_reports_trimming(settings_env):
+    settings_env.setenv("TTS_BACKEND", "stub")
+    service = PronunciationService(tts_service=CoquiTTSService())
+    waveform = _padded(_tone(1.0), before=2.0, after=2.0)
+
+    analysis = asyncio.run(service.analyze_pronunciation(waveform, "hello"))
+
+    report = analysis["preprocessing"]
+    assert report["samples_in"] == len(waveform)
+    assert report["seconds_removed"] > 3.5
+    assert report["estimated_time_saved_ms"] >= 0
@@ -0,0 +1,46 @@
+# backend/tests/test_warmup.py
+import asyncio
+
+from backend.services.warmup_service import WarmupService
+
+
+def _fail():
+    raise RuntimeError("model download failed")
+
+
+def test_preload_reports_each_component(settings_env):
+    service = WarmupService()
+    loaded = []
+    service._build_steps = lambda: [
+        ("tts_model", lambda: loaded.append("tts")),
+        ("cmudict", lambda: loaded.append("cmudict")),
+    ]
+    assert not service.is_ready
+
+    asyncio.run(service.preload())
+
+    status = service.get_status()
+    assert loaded == ["tts", "cmudict"]
+    assert status["ready"] and status["state"] == "ready"
+    for component in status["components"].values():
+        assert component["status"] == "ready"
+        assert component["load_time_s"] >= 0
+        assert "rss_delta_mb" in component
+
+
+def test_failed_component_keeps_service_unready(settings_env):
+    service = WarmupService()
+    service._build_steps = lambda: [("tts_model", _fail), ("cmudict", lambda: None)]
+
+    asyncio.run(service.preload())
+
+    status = service.get_status()
+    assert not status["ready"]
+    assert status["state"] == "degraded"
+    assert status["components"]["tts_model"]["error"] == "model download failed"
+    assert status["components"]["cmudict"]["status"] == "ready"
+
+
+def test_ready_when_preloading_disabled(settings_env):
+    settings_env.setenv("PRELOAD_ON_STARTUP", "false")
+    assert WarmupService().is_ready
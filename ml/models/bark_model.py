@@ -0,0 +1,123 @@
+"""Transformer-based Bark wrapper (HuggingFace `BarkModel` / `BarkProcessor`).
+
+Avoids the native torchaudio/encodec dependencies of the original `bark`
+package. The model is loaded once per process and shared by every caller.
+
+    from ml.models.bark_model import load_model, generate
+    load_model()
+    out = generate("Hello world", voice_preset="v2/en_speaker_6")
+    out["audio"], out["sample_rate"]
+"""
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+import numpy as np
+
+DEFAULT_MODEL = "suno/bark-small"
+DEFAULT_VOICE = "v2/en_speaker_6"
+
+_lock = threading.Lock()
+_state: Dict[str, object] = {}
+
+
+def load_model(
+    model_name: str = DEFAULT_MODEL,
+    device: Optional[str] = None,
+    optimize: Optional[Callable] = None,
+) -> None:
+    """Load processor and model into memory. Idempotent.
+
+    `optimize` may transform the model after loading (e.g. int8 quantization)
+    and must return the model to use.
+    """
+    if _state.get("model_name") == model_name:
+        return
+
+    with _lock:
+        if _state.get("model_name") == model_name:
+            return
+
+        import torch
+        from transformers import AutoProcessor, BarkModel
+
+        device = device or ("cuda" if torch.cuda.is_available() else "cpu")
+        processor = AutoProcessor.from_pretrained(model_name)
+        model = BarkModel.from_pretrained(model_name).to(device)
+        model.eval()
+        if optimize is not None:
+            model = optimize(model)
+
+        _state.update(
+            model_name=model_name,
+            processor=processor,
+            model=model,
+            device=device,
+            sample_rate=int(model.generation_config.sample_rate),
+        )
+
+
+def get_sample_rate() -> int:
+    """Sample rate of the loaded model's output."""
+    load_model(_state.get("model_name", DEFAULT_MODEL))
+    return _state["sample_rate"]
+
+
+def generate(text: str, voice_preset: str = DEFAULT_VOICE) -> Dict[str, object]:
+    """Synthesize `text`.
+
+    Returns a dict with the float32 waveform (`audio`), its `sample_rate`
+    and the generation `latency_s`.
+    """
+    import torch
+
+    load_model(_state.get("model_name", DEFAULT_MODEL))
+    processor, model = _state["processor"], _state["model"]
+
+    inputs = processor(text, voice_preset=voice_preset).to(_state["device"])
+
+    start = time.perf_counter()
+    with torch.inference_mode():
+        audio = model.generate(**inputs)
+    latency = time.perf_counter() - start
+
+    waveform = audio.cpu().numpy().squeeze().astype(np.float32)
+    return {
+        "audio": waveform,
+        "sample_rate": _state["sample_rate"],
+        "latency_s": latency,
+    }
+
+
+def measure_performance(
+    text: str,
+    nb_loops: int = 5,
+    voice_preset: str = DEFAULT_VOICE,
+) -> Dict[str, object]:
+    """Time `nb_loops` generations and report latency, RTF and memory."""
+    import torch
+
+    from backend.core.profiling import CallMeter, bytes_to_mb
+
+    latencies, peak = [], 0
+    duration = 0.0
+    for _ in range(nb_loops):
+        with CallMeter() as meter:
+            out = generate(text, voice_preset=voice_preset)
+        latencies.append(meter.latency_s)
+        peak = max(peak, meter.peak_rss_delta_bytes or 0)
+        duration = len(out["audio"]) / out["sample_rate"]
+
+    result = {
+        "model": _state["model_name"],
+        "device": _state["device"],
+        "loops": nb_loops,
+        "mean_latency_s": float(np.mean(latencies)),
+        "min_latency_s": float(np.min(latencies)),
+        "audio_duration_s": duration,
+        "real_time_factor": float(np.mean(latencies)) / duration if duration else None,
+        "peak_rss_delta_mb": bytes_to_mb(peak),
+    }
+    if _state["device"] == "cuda":
+        result["cuda_max_memory_mb"] = bytes_to_mb(torch.cuda.max_memory_allocated())
+    return result
@@ -0,0 +1,163 @@
+"""Export the Coqui VITS model to ONNX (speaker ID as an input).
+
+The exported graph takes:
+
+    input          int64 [1, T]   token ids from the Coqui tokenizer
+    input_lengths  int64 [1]
+    scales         float32 [3]    noise_scale, length_scale, noise_scale_dp
+    sid            int64 [1]      speaker id
+
+and returns `output` float32 [1, 1, samples].
+
+A JSON sidecar (`<model>.json`) records the speaker name -> id map and
+the sample rate so the runtime never needs the torch checkpoint.
+
+    python -m ml.models.vits_onnx --out models/vits_vctk.onnx
+"""
+import argparse
+import json
+from pathlib import Path
+from typing import Dict, Optional
+
+DEFAULT_MODEL = "tts_models/en/vctk/vits"
+OPSET = 15
+
+
+def _wrapper(model):
+    """nn.Module whose forward is VITS inference with explicit scales/speaker."""
+    import torch
+
+    class VitsOnnxWrapper(torch.nn.Module):
+        def __init__(self, vits):
+            super().__init__()
+            self.vits = vits
+
+        def forward(self, input_ids, input_lengths, scales, sid):
+            vits = self.vits
+            vits.inference_noise_scale = scales[0]
+            vits.length_scale = scales[1]
+            vits.inference_noise_scale_dp = scales[2]
+            outputs = vits.inference(
+                input_ids,
+                aux_input={
+                    "x_lengths": input_lengths,
+                    "d_vectors": None,
+                    "speaker_ids": sid,
+                    "language_ids": None,
+                    "durations": None,
+                },
+            )
+            return outputs["model_outputs"]
+
+    return VitsOnnxWrapper(model).eval()
+
+
+def sidecar_path(onnx_path) -> Path:
+    return Path(onnx_path).with_suffix(".json")
+
+
+def export_vits(
+    model,
+    output_path,
+    speakers: Optional[Dict[str, int]] = None,
+    sample_rate: int = 22050,
+    opset: int = OPSET,
+) -> Path:
+    """Export a loaded Coqui `Vits` model to `output_path`.
+
+    Returns the path of the ONNX file; the sidecar is written next to it.
+    """
+    import torch
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Training-only submodules are not part of inference
+    model.disc = None
+    model.eval()
+
+    wrapper = _wrapper(model)
+    input_ids = torch.randint(low=0, high=20, size=(1, 50), dtype=torch.long)
+    input_lengths = torch.tensor([input_ids.shape[1]], dtype=torch.long)
+    scales = torch.tensor([0.667, 1.0, 0.8], dtype=torch.float32)
+    sid = torch.tensor([0], dtype=torch.long)
+
+    with torch.no_grad():
+        torch.onnx.export(
+            wrapper,
+            (input_ids, input_lengths, scales, sid),
+            str(output_path),
+            opset_version=opset,
+            input_names=["input", "input_lengths", "scales", "sid"],
+            output_names=["output"],
+            dynamic_axes={
+                "input": {0: "batch", 1: "phonemes"},
+                "input_lengths": {0: "batch"},
+                "sid": {0: "batch"},
+                "output": {0: "batch", 2: "time"},
+            },
+        )
+
+    sidecar_path(output_path).write_text(json.dumps({
+        "speakers": speakers or {},
+        "sample_rate": sample_rate,
+        "opset": opset,
+    }, indent=2))
+    return output_path
+
+
+def export_pretrained(output_path, model_name: str = DEFAULT_MODEL) -> Path:
+    """Download (if needed) the Coqui checkpoint used by the API and export it."""
+    from TTS.api import TTS
+
+    tts = TTS(model_name).to("cpu")
+    synthesizer = tts.synthesizer
+    model = synthesizer.tts_model
+    speakers = dict(model.speaker_manager.name_to_id) if model.speaker_manager else {}
+    return export_vits(
+        model,
+        output_path,
+        speakers=speakers,
+        sample_rate=synthesizer.output_sample_rate,
+    )
+
+
+def build_tiny_vits(num_speakers: int = 4):
+    """Small randomly initialized multi-speaker VITS (tests, no download)."""
+    from TTS.tts.configs.vits_config import VitsConfig
+    from TTS.tts.models.vits import Vits, VitsArgs
+
+    args = VitsArgs(
+        num_chars=32,
+        hidden_channels=32,
+        hidden_channels_ffn_text_encoder=64,
+        num_heads_text_encoder=2,
+        num_layers_text_encoder=2,
+        num_layers_posterior_encoder=2,
+        num_layers_flow=2,
+        num_layers_dp_flow=2,
+        resblock_kernel_sizes_decoder=[3],
+        resblock_dilation_sizes_decoder=[[1, 3]],
+        upsample_rates_decoder=[8, 8, 4],
+        upsample_initial_channel_decoder=64,
+        upsample_kernel_sizes_decoder=[16, 16, 8],
+        num_speakers=num_speakers,
+        use_speaker_embedding=True,
+        speaker_embedding_channels=16,
+    )
+    config = VitsConfig(model_args=args)
+    return Vits(config).eval()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export Coqui VITS to ONNX")
+    parser.add_argument("--model", default=DEFAULT_MODEL)
+    parser.add_argument("--out", default="models/vits_vctk.onnx")
+    args = parser.parse_args()
+
+    path = export_pretrained(args.out, args.model)
+    print(f"Exported {args.model} -> {path} (+ {sidecar_path(path).name})")
+
+
+if __name__ == "__main__":
+    main()